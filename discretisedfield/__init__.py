@@ -10,10 +10,12 @@ from . import tools as tools
 from .field import Field as Field
 from .field_rotator import FieldRotator as FieldRotator
 from .interact import interact as interact
+from .lazy import LazyField as LazyField
 from .line import Line as Line
 from .mesh import Mesh as Mesh
 from .operators import integrate as integrate
 from .region import Region as Region
+from .remapper import Remapper as Remapper
 
 # Enable default plotting style.
 plt.style.use(pathlib.Path(__file__).parent / "plotting" / "plotting-style.mplstyle")
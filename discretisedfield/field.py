@@ -1,10 +1,18 @@
 import collections
+import concurrent.futures
 import functools
+import itertools
+import logging
 import numbers
+import time
+import warnings
+from multiprocessing import shared_memory
 
 import numpy as np
 import scipy.fft as spfft
 import xarray as xr
+from scipy import ndimage
+from scipy.interpolate import RegularGridInterpolator, make_interp_spline
 from vtkmodules.util import numpy_support as vns
 from vtkmodules.vtkCommonDataModel import vtkRectilinearGrid
 
@@ -13,9 +21,26 @@ import discretisedfield.plotting as dfp
 import discretisedfield.util as dfu
 from . import html
 from .io import _FieldIO
-from discretisedfield.operators import _split_diff_combine
+from discretisedfield.operators import (
+    _check_accuracy,
+    _check_bc,
+    _check_diff_method,
+    _diff,
+    _spectral_diff,
+)
 from discretisedfield.plotting.util import hv_key_dim
 
+log = logging.getLogger(__name__)
+
+# Maximum number of cells passed to a vectorized callable in a single call. Larger
+# meshes are evaluated in slabs along the first spatial direction to limit the size of
+# temporary arrays created inside the callable.
+_CALLABLE_CHUNK_SIZE = 2**18
+# Number of cells used to test whether a callable accepts arrays of points.
+_CALLABLE_PROBE_SIZE = 8
+# Number of cells processed at once in Field.stats.
+_REDUCTION_CHUNK_SIZE = 2**16
+
 # TODO: tutorials, line operations
 
 
@@ -77,6 +102,64 @@ class Field(_FieldIO):
         the same as spatial dimensions if the number of value and spatial dimensions are
         the same, else it is empty.
 
+    vectorized : bool, optional
+
+        If ``True``, callables passed as ``value``, ``norm``, or ``valid`` are called
+        with coordinate arrays of many cells instead of once per cell. If ``False``,
+        they are called once per cell. If ``None``, it is tested automatically
+        whether a callable accepts arrays. Please refer to
+        ``discretisedfield.Field.update_field_values`` for details. Defaults to
+        ``None``.
+
+    workers : int, optional
+
+        Number of processes used to evaluate a callable ``value`` that is evaluated
+        cell by cell. Please refer to ``discretisedfield.Field.update_field_values``
+        for details. Defaults to ``None``.
+
+    copy : bool, optional
+
+        If ``False`` and ``value`` is a ``numpy.ndarray`` with shape ``(*mesh.n,
+        nvdim)`` (or ``mesh.n`` for scalar fields) and the ``dtype`` of the field,
+        the array is used directly without making a copy. The field and the array then
+        share memory, i.e. modifying one modifies the other. If a copy is required
+        (e.g. because of a different shape or ``dtype``) or ``norm`` is set, the
+        values are copied regardless of this argument. Defaults to ``True``.
+
+    Notes
+    -----
+    To avoid unnecessary copies of large arrays, field components (e.g. ``field.x``),
+    ``field.sel(...)``, and ``field[subregion]`` return fields whose values are views
+    into the values of the original field. Modifying the values of such a field in
+    place (e.g. ``field.x.array[...] = 0``) modifies the original field. Assigning a
+    new value (e.g. ``field.x.update_field_values(0)``) replaces the array of the
+    derived field only and does not change the original field. The same applies to the
+    ``valid`` arrays of these fields.
+
+    The values of ``norm``, ``orientation``, the derivatives used by ``jacobian``,
+    ``grad``, ``div``, ``curl``, and ``laplace``, and the interpolators used by
+    ``interp`` are cached and only recomputed after the field values (or, for the
+    derivatives and interpolators, the valid cells) have changed. The derivatives are
+    cached per component and direction, i.e. each operator only computes the
+    derivatives it needs.
+    Fields returned from the cache (e.g. ``field.norm``) share read-only arrays, which
+    are copied the first time they are accessed with ``array`` (copy on write), i.e.
+    modifying one of them does not modify the others. Once ``field.array`` has been
+    accessed (for the field or for a view into it), or if the array is shared with the
+    caller because of ``copy=False``, the field values can be modified in place at any
+    time and nothing is cached until a new value is assigned, e.g. with
+    ``field.array = ...`` or ``field.update_field_values(...)``. The memory used by the
+    cache is limited per field by the class attribute ``Field.max_cache_nbytes``;
+    ``Field.max_cache_nbytes = 0`` disables the cache.
+
+    The finite-difference stencils used by ``jacobian``, ``grad``, ``div``, ``curl``,
+    and ``laplace`` are second-order accurate. Fourth- or sixth-order accurate
+    stencils can be selected per field with ``field.diff_accuracy``, and
+    spectral derivatives in periodic directions with ``field.diff_method =
+    'spectral'``. Directions that are not periodic use one-sided stencils at the
+    boundaries unless Neumann or Dirichlet boundary conditions are selected with
+    ``field.diff_bc`` (see :py:func:`~discretisedfield.Field.diff`).
+
     Examples
     --------
     1. Defining a uniform three-dimensional vector field on a nano-sized thin
@@ -136,15 +219,25 @@ class Field(_FieldIO):
 
     __slots__ = [
         "_array",
+        "_cache",
+        "_diff_accuracy",
+        "_diff_bc",
+        "_diff_method",
         "_mesh",
         "_nvdim",
         "_unit",
         "_valid",
         "_vdim_mapping",
         "_vdims",
+        "_version",
         "dtype",
     ]
 
+    #: Maximum number of bytes of derived values (``norm``, ``orientation``,
+    #: derivatives, and interpolators) cached per field (256 MiB). ``None`` means no
+    #: limit and ``0`` disables the cache.
+    max_cache_nbytes = 2**28
+
     # removed attribute: new method/property
     # implemented in __getattr__
     # to exclude methods from tap completion and documentation
@@ -167,11 +260,19 @@ class Field(_FieldIO):
         unit=None,
         valid=True,
         vdim_mapping=None,
+        vectorized=None,
+        workers=None,
+        copy=True,
         **kwargs,
     ):
         if not isinstance(mesh, df.Mesh):
             raise TypeError("'mesh' must be of class discretisedfield.Mesh.")
         self._mesh = mesh
+        self._version = [0]  # shared with fields whose array is a view, see _cached
+        self._cache = (0, {})
+        self._diff_accuracy = 2
+        self._diff_method = "finite-difference"
+        self._diff_bc = None
 
         if not isinstance(nvdim, numbers.Integral):
             raise TypeError("'nvdim' must be of type int.")
@@ -189,8 +290,21 @@ class Field(_FieldIO):
         # before the norm is set as the valid setter has the option
         # to set valid based on the norm.
         self.valid = True
-        self.update_field_values(value)
+        array = None if copy else _array_without_copy(value, mesh.n, nvdim, dtype)
+        if array is None:
+            self.update_field_values(value, vectorized=vectorized, workers=workers)
+        else:
+            self._array = array
+            self._version[0] = None  # the array is shared with the caller
+        if vectorized is not None and callable(norm):
+            norm = self._as_array(
+                norm, self.mesh, nvdim=1, dtype=None, vectorized=vectorized
+            )
         self.norm = norm
+        if vectorized is not None and callable(valid):
+            valid = self._as_array(
+                valid, self.mesh, nvdim=1, dtype=bool, vectorized=vectorized
+            )[..., 0]
         self.valid = valid
 
         # required in here for correct initialisation:
@@ -200,6 +314,81 @@ class Field(_FieldIO):
 
         self.vdim_mapping = vdim_mapping
 
+    @classmethod
+    def _from_array(
+        cls,
+        mesh,
+        array,
+        valid=None,
+        vdims=None,
+        vdim_mapping=None,
+        unit=None,
+        dtype=None,
+    ):
+        """Create a field from already validated data.
+
+        This is a fast alternative to ``__init__`` for internal use, e.g. for results
+        of operations on existing fields. No checks are performed and ``array`` (shape
+        ``(*mesh.n, nvdim)``) and ``valid`` (boolean array with shape ``mesh.n``) are
+        not copied. ``None`` for ``valid``, ``vdims``, or ``vdim_mapping`` results in
+        the same defaults as in ``__init__``.
+
+        """
+        if cls.__init__ is not Field.__init__:
+            # subclasses may require additional initialisation
+            return cls(
+                mesh,
+                nvdim=array.shape[-1],
+                value=array,
+                vdims=vdims,
+                dtype=dtype,
+                unit=unit,
+                valid=True if valid is None else valid,
+                vdim_mapping=vdim_mapping,
+                copy=False,
+            )
+
+        nvdim = array.shape[-1]
+        # same dtype as in _as_array for array_like values
+        target_dtype = dtype or max(array.dtype, np.float64)
+        if array.dtype != target_dtype:
+            array = array.astype(target_dtype)
+
+        if vdims is None:
+            if 2 <= nvdim <= 3:
+                vdims = ["x", "y", "z"][:nvdim]
+            elif nvdim > 3:
+                vdims = [f"v{i}" for i in range(nvdim)]
+        else:
+            vdims = list(vdims) or None
+
+        if vdim_mapping is None:
+            if nvdim > 1 and nvdim == mesh.region.ndim:
+                vdim_mapping = dict(zip(vdims, mesh.region.dims))
+            else:
+                vdim_mapping = {}
+        elif len(vdim_mapping) == 1 and nvdim == 1 and vdims is None:
+            # no mapping for scalar fields unless vdims is set manually
+            vdim_mapping = {}
+        else:
+            vdim_mapping = dict(vdim_mapping)
+
+        field = object.__new__(cls)
+        field._version = [0]
+        field._cache = (0, {})
+        field._diff_accuracy = 2
+        field._diff_method = "finite-difference"
+        field._diff_bc = None
+        field._mesh = mesh
+        field._nvdim = nvdim
+        field.dtype = dtype
+        field._unit = unit
+        field._array = array
+        field._valid = valid
+        field._vdims = vdims
+        field._vdim_mapping = vdim_mapping
+        return field
+
     @property
     def mesh(self):
         """The mesh on which the field is defined.
@@ -244,7 +433,126 @@ class Field(_FieldIO):
             raise TypeError("'unit' must be of type str.")
         self._unit = unit
 
-    def update_field_values(self, value):
+    @property
+    def diff_accuracy(self):
+        """Default accuracy of the finite-difference stencils of the field.
+
+        The accuracy (2, 4, or 6) is used by ``jacobian``, ``grad``, ``div``,
+        ``curl``, and ``laplace``, and by ``diff`` if no ``accuracy`` is passed. It
+        is a property of the field (and of its components and other views into it,
+        which are created after setting it) and not of the results of operations,
+        which use the default accuracy 2.
+
+        Returns
+        -------
+        int
+
+            Order of accuracy of the finite-difference stencils.
+
+        Examples
+        --------
+        1. Fourth-order accurate derivatives.
+
+        >>> import discretisedfield as df
+        ...
+        >>> mesh = df.Mesh(p1=0, p2=10, n=10)
+        >>> f = df.Field(mesh, nvdim=1, value=lambda x: x**3)
+        >>> f.diff_accuracy
+        2
+        >>> f.diff_accuracy = 4
+        >>> float(f.grad.array[5, 0])
+        90.75
+
+        """
+        return self._diff_accuracy
+
+    @diff_accuracy.setter
+    def diff_accuracy(self, accuracy):
+        _check_accuracy(accuracy)
+        self._diff_accuracy = accuracy
+
+    @property
+    def diff_method(self):
+        """Default method of the derivatives of the field.
+
+        The method (``'finite-difference'`` or ``'spectral'``) is used by
+        ``jacobian``, ``grad``, ``div``, ``curl``, and ``laplace``, and by ``diff``
+        if no ``method`` is passed. Spectral derivatives are only used in periodic
+        directions. Like ``diff_accuracy``, it is a property of the field (and of its
+        views) and not of the results of operations.
+
+        Returns
+        -------
+        str
+
+            Method of the derivatives.
+
+        Examples
+        --------
+        1. Spectral derivatives of a periodic field.
+
+        >>> import discretisedfield as df
+        >>> import numpy as np
+        ...
+        >>> mesh = df.Mesh(p1=0, p2=2 * np.pi, n=16, bc='x')
+        >>> f = df.Field(mesh, nvdim=1, value=lambda x: np.sin(x))
+        >>> f.diff_method
+        'finite-difference'
+        >>> f.diff_method = 'spectral'
+        >>> np.allclose(f.grad.array[..., 0], np.cos(mesh.cells.x))
+        True
+
+        """
+        return self._diff_method
+
+    @diff_method.setter
+    def diff_method(self, method):
+        _check_diff_method(method)
+        self._diff_method = method
+
+    @property
+    def diff_bc(self):
+        """Default boundary condition of the derivatives of the field.
+
+        The boundary condition (``None``, ``'neumann'``, or ``'dirichlet'``) is used
+        in the directions in which the mesh is not periodic by ``jacobian``,
+        ``grad``, ``div``, ``curl``, and ``laplace``, and by ``diff`` if no ``bc``
+        is passed (see :py:func:`~discretisedfield.Field.diff`). The default
+        ``None`` uses one-sided stencils at the boundaries. The Neumann and
+        Dirichlet boundary conditions of ``mesh.bc`` are not used for derivatives.
+        Like ``diff_accuracy``, it is a property of the field (and of its views) and
+        not of the results of operations.
+
+        Returns
+        -------
+        str
+
+            Boundary condition of the derivatives.
+
+        Examples
+        --------
+        1. Laplacian with homogeneous Dirichlet boundary conditions.
+
+        >>> import discretisedfield as df
+        >>> import numpy as np
+        ...
+        >>> mesh = df.Mesh(p1=0, p2=np.pi, n=100)
+        >>> f = df.Field(mesh, nvdim=1, value=lambda x: np.sin(x))
+        >>> f.diff_bc is None
+        True
+        >>> f.diff_bc = 'dirichlet'
+        >>> np.allclose(f.laplace.array, -f.array, atol=1e-4)
+        True
+
+        """
+        return self._diff_bc
+
+    @diff_bc.setter
+    def diff_bc(self, bc):
+        _check_bc(bc)
+        self._diff_bc = bc
+
+    def update_field_values(self, value, vectorized=None, workers=None):
         """Set field value representation.
 
         The value of the field can be set using a scalar value for ``nvdim=1``
@@ -278,6 +586,42 @@ class Field(_FieldIO):
             contained within one subregion ``default`` is used if specified,
             else these values are set to 0.
 
+        vectorized : bool, optional
+
+            If ``True``, a callable ``value`` is not called for every single cell.
+            Instead of a single point it receives a tuple of coordinate arrays, one per
+            spatial dimension, in the broadcasting layout of ``numpy.ogrid`` (i.e. the
+            array for the ``i``-th dimension has its cells along axis ``i`` and length
+            one along all other axes). It must return either an array that can be
+            broadcast to ``(*shape, nvdim)`` or a sequence of ``nvdim`` arrays (one
+            per vector component) that can be broadcast to ``shape``, where ``shape``
+            is the broadcast shape of the coordinate arrays. To limit the memory
+            required for large meshes, the mesh is split into slabs along the first
+            spatial direction and the callable is called once per slab. This is much
+            faster than calling the function for every cell, but the function must
+            only use element-wise array operations (e.g. ``numpy.where`` instead of
+            ``if``). If ``False``, the callable is called for every cell. If ``None``,
+            the callable is first tested on a few cells: if it raises an exception
+            (or warning) for array input or returns results that differ from calling
+            it for the individual cells, it is called for every cell, otherwise it
+            is evaluated for slabs of cells. Note that the callable is therefore
+            called a few more times than there are slabs or cells. The ``default``
+            of a ``dict`` value is treated the same way, but receives one-dimensional
+            arrays of coordinates of the cells outside all subregions. Defaults to
+            ``None``.
+
+        workers : int, optional
+
+            If a callable ``value`` is evaluated cell by cell (see ``vectorized``)
+            and ``workers > 1``, the mesh is split into contiguous slabs along the
+            last spatial direction, which are evaluated in parallel by a
+            ``concurrent.futures.ProcessPoolExecutor`` with ``workers`` processes.
+            The results are written to shared memory and are identical to the serial
+            evaluation. The callable must be picklable, i.e. lambda functions and
+            functions defined inside other functions are not supported. Starting the
+            processes has a significant overhead, therefore this is only useful for
+            expensive callables. Defaults to ``None`` (serial evaluation).
+
         Raises
         ------
         ValueError
@@ -289,6 +633,7 @@ class Field(_FieldIO):
         1. Different ways of setting the field value.
 
         >>> import discretisedfield as df
+        >>> import numpy as np
         ...
         >>> p1 = (0, 0, 0)
         >>> p2 = (2, 2, 1)
@@ -319,6 +664,18 @@ class Field(_FieldIO):
         >>> field((1.5, 1.5, 0.5))
         array([ 0.,  0., -1.])
 
+        The same function written with array operations can be evaluated for all cells
+        at once.
+
+        >>> def vectorized_function(point):
+        ...     x, y, z = point
+        ...     return (0, 0, np.where(x <= 1, 1, -1))
+        >>> field.update_field_values(vectorized_function, vectorized=True)
+        >>> field((0.5, 1.5, 0.5))
+        array([0., 0., 1.])
+        >>> field((1.5, 1.5, 0.5))
+        array([ 0.,  0., -1.])
+
         2. Field with subregions in mesh
 
         >>> import discretisedfield as df
@@ -354,7 +711,14 @@ class Field(_FieldIO):
         .. seealso:: :py:func:`~discretisedfield.Field.array`
 
         """
-        self.array = self._as_array(value, self.mesh, self.nvdim, dtype=self.dtype)
+        self.array = self._as_array(
+            value,
+            self.mesh,
+            self.nvdim,
+            dtype=self.dtype,
+            vectorized=vectorized,
+            workers=workers,
+        )
 
     @property
     def vdims(self):
@@ -453,11 +817,89 @@ class Field(_FieldIO):
         array([1., 1., 1.])
 
         """
+        if not self._array.flags.writeable:
+            # copy on write: the array is shared with other fields, see _cached
+            self._array = self._array.copy()
+            self._version = [None]
+        else:
+            # the array can be modified in place by the caller at any time
+            self._version[0] = None
         return self._array
 
     @array.setter
     def array(self, val):
-        self._array = self._as_array(val, self.mesh, self.nvdim, dtype=self.dtype)
+        array = self._as_array(val, self.mesh, self.nvdim, dtype=self.dtype)
+        self._array = array
+        # a new array, i.e. a view is detached from the field it was taken from
+        shared = isinstance(val, np.ndarray) and np.may_share_memory(array, val)
+        self._version = [None if shared else 0]
+        self._cache = (0, {})
+
+    def _touch(self):
+        """Invalidate cached derived values after the field values have been modified
+        in place."""
+        if self._version[0] is not None:
+            self._version[0] += 1
+
+    def _writable_array(self):
+        """Array into which the result of an operation is written (``out``).
+
+        Unlike the ``array`` property, the array is not exposed, i.e. the cached
+        derived values are only invalidated and not disabled.
+        """
+        if not self._array.flags.writeable:
+            # shared with other fields, same as setting a new array
+            self._array = self._array.copy()
+            self._version = [0]
+            self._cache = (0, {})
+        else:
+            self._touch()
+        return self._array
+
+    def _valid_key(self):
+        """Valid cells as part of the keys of ``_cached`` for derived values that
+        depend on them.
+
+        The valid array can be modified in place at any time, hence the key contains
+        its values (packed into bits).
+
+        """
+        return None if self._valid is None else np.packbits(self._valid).tobytes()
+
+    def _cached(self, key, function):
+        """Derived array ``function()``, cached until the field values change.
+
+        ``function`` must return a new array or any other object with an ``nbytes``
+        attribute, which is used to limit the size of the cache. Cached arrays are
+        read-only because all fields returned for ``key`` share them (the ``array``
+        property copies them on write).
+
+        The version counter ``_version`` is shared between a field and the fields
+        whose array is a view into its array (components, ``sel``, and
+        ``__getitem__``), i.e. modifying one of them invalidates the derived values of
+        all of them. ``None`` means that the array has been exposed (see ``array``)
+        and nothing is cached.
+
+        """
+        if self._version[0] is None:
+            self._cache = (None, {})
+            return function()
+        version, cache = self._cache
+        if version != self._version[0]:
+            cache = {}
+            self._cache = (self._version[0], cache)
+        elif key in cache:
+            return cache[key]
+
+        value = function()
+        max_nbytes = self.max_cache_nbytes
+        if max_nbytes is None or (
+            sum(cached.nbytes for cached in cache.values()) + value.nbytes <= max_nbytes
+        ):
+            if isinstance(value, np.ndarray):
+                value.flags.writeable = False
+            cache[key] = value
+        return value
 
     @property
     def norm(self):
@@ -524,22 +966,25 @@ class Field(_FieldIO):
         .. seealso:: :py:func:`~discretisedfield.Field.__abs__`
 
         """
-        res = np.linalg.norm(self.array, axis=-1, keepdims=True)
-
-        return self.__class__(
-            self.mesh, nvdim=1, value=res, unit=self.unit, valid=self.valid
+        res = self._cached(
+            "norm", lambda: np.linalg.norm(self._array, axis=-1, keepdims=True)
+        )
+        return self._from_array(
+            self.mesh, res, unit=self.unit, valid=_copy_valid(self._valid)
         )
 
     @norm.setter
     def norm(self, val):
         if val is not None:
-            self.array = np.divide(
-                self.array,
-                self.norm.array,
-                out=np.zeros_like(self.array),
-                where=self.norm.array != 0.0,
+            norm = self.norm._array
+            array = np.divide(
+                self._array,
+                norm,
+                out=np.zeros_like(self._array),
+                where=norm != 0.0,
             )
-            self.array *= self._as_array(val, self.mesh, nvdim=1, dtype=None)
+            array *= self._as_array(val, self.mesh, nvdim=1, dtype=None)
+            self.array = array
 
     @property
     def valid(self):
@@ -551,16 +996,22 @@ class Field(_FieldIO):
         the string ``"norm"`` (which masks zero values), or
         None (which sets all values to True).
 
+        Internally, a field with only valid values does not store a boolean array.
+        The array is created when this property is accessed for the first time.
+
         """
+        if self._valid is None:
+            self._valid = np.ones(self.mesh.n, dtype=bool)
         return self._valid
 
     @valid.setter
     def valid(self, valid):
-        if valid is not None:
-            if isinstance(valid, str) and valid == "norm":
-                valid = ~np.isclose(self.norm.array, 0)
-        else:
-            valid = True
+        if valid is None or (isinstance(valid, (bool, np.bool_)) and valid):
+            # all values are valid, see _and_valid
+            self._valid = None
+            return
+        if isinstance(valid, str) and valid == "norm":
+            valid = ~np.isclose(self.norm._array, 0)
         # Using self._as_array creates an array with shape (*mesh.n, 1).
         # We only want a shape of mesh.n so we can directly use it
         # to index field.array i.e. field.array[field.valid].
@@ -633,12 +1084,11 @@ class Field(_FieldIO):
         .. seealso:: :py:func:`~discretisedfield.Field.norm`
 
         """
-        return self.__class__(
+        return self._from_array(
             self.mesh,
-            nvdim=self.nvdim,
-            value=np.abs(self.array),
+            np.abs(self._array),
             unit=self.unit,
-            valid=self.valid,
+            valid=_copy_valid(self._valid),
             vdim_mapping=self.vdim_mapping,
         )
 
@@ -679,22 +1129,24 @@ class Field(_FieldIO):
 
         """
 
-        orientation_array = np.divide(
-            self.array,
-            self.norm.array,
-            where=np.invert(np.isclose(self.norm.array, 0)),
-            out=np.zeros_like(self.array),
-        )
-        return self.__class__(
+        def orientation_array():
+            norm = self.norm._array
+            return np.divide(
+                self._array,
+                norm,
+                where=np.invert(np.isclose(norm, 0)),
+                out=np.zeros_like(self._array),
+            )
+
+        return self._from_array(
             self.mesh,
-            nvdim=self.nvdim,
-            value=orientation_array,
+            self._cached("orientation", orientation_array),
             vdims=self.vdims,
-            valid=self.valid,
+            valid=_copy_valid(self._valid),
             vdim_mapping=self.vdim_mapping,
         )
 
-    def mean(self, direction=None):
+    def mean(self, direction=None, *, where=None, valid_only=False, subregion=None):
         """Field mean.
 
         It computes the arithmetic mean along the specified direction of the field.
@@ -704,6 +1156,9 @@ class Field(_FieldIO):
         than ``region.dims``) are selected, the method returns a field of appropriate
         geometric dimensions with the calculated mean value.
 
+        The mean can be restricted to a subset of cells using ``where``,
+        ``valid_only``, and ``subregion``. The cells are selected without copying the
+        field values.
 
         Parameters
         ----------
@@ -714,6 +1169,22 @@ class Field(_FieldIO):
             compute the mean of the entire volume and return an array of the
             averaged vector components.
 
+        where : array_like or discretisedfield.Field, optional
+
+            Boolean array of shape ``mesh.n`` or scalar field defined on the same mesh.
+            Only cells where ``where`` is ``True`` are included. Defaults to ``None``,
+            i.e. all cells are included.
+
+        valid_only : bool, optional
+
+            If ``True``, only valid cells (see ``field.valid``) are included. Defaults
+            to ``False``.
+
+        subregion : str or discretisedfield.Region, optional
+
+            Name of a subregion (in ``mesh.subregions``) or region. If specified, only
+            the cells in the subregion are included and fields returned for
+            directional means are defined on the subregion. Defaults to ``None``.
 
         Returns
         -------
@@ -724,7 +1195,9 @@ class Field(_FieldIO):
         discretisedfield.Field
 
             Field of reduced geometrical dimensions holding the mean value along the
-            selected direction(s).
+            selected direction(s). If cells are excluded with ``where`` or
+            ``valid_only``, cells of the resulting field for which no cell is
+            included are invalid.
 
         Examples
         --------
@@ -773,48 +1246,333 @@ class Field(_FieldIO):
         >>> field.mean(direction=['x', 'y'])(0.5)
         array([0., 0., 1.])
 
+        5. Computing the mean over the valid cells or a subregion.
+
+        >>> subregions = {'left': df.Region(p1=(0, 0, 0), p2=(2, 5, 5))}
+        >>> mesh = df.Mesh(p1=p1, p2=p2, cell=cell, subregions=subregions)
+        >>> field = df.Field(
+        ...     mesh, nvdim=1, value=lambda p: p[0], valid=lambda p: p[0] > 3
+        ... )
+        >>> field.mean(valid_only=True)
+        array([4.])
+        >>> field.mean(subregion='left')
+        array([1.])
+        >>> field.mean(where=field.array[..., 0] < 1)
+        array([0.5])
+
+        .. seealso:: :py:func:`~discretisedfield.Field.sum`
+
+        """
+        return self._reduce("mean", direction, where, valid_only, subregion)
+
+    def sum(self, direction=None, *, where=None, valid_only=False, subregion=None):
+        """Field sum.
+
+        It computes the sum of the field values along the specified direction(s). The
+        parameters and the returned values are the same as for
+        :py:func:`~discretisedfield.Field.mean`.
+
+        Examples
+        --------
+        1. Computing the sum of the valid cells.
+
+        >>> import discretisedfield as df
+        ...
+        >>> mesh = df.Mesh(p1=(0, 0, 0), p2=(5, 5, 5), cell=(1, 1, 1))
+        >>> field = df.Field(mesh, nvdim=2, value=(1, 2), valid=lambda p: p[0] < 2)
+        >>> field.sum()
+        array([125., 250.])
+        >>> field.sum(valid_only=True)
+        array([ 50., 100.])
+
+        .. seealso:: :py:func:`~discretisedfield.Field.mean`
+
+        """
+        return self._reduce("sum", direction, where, valid_only, subregion)
+
+    def std(self, direction=None, *, where=None, valid_only=False, subregion=None):
+        """Field standard deviation.
+
+        It computes the (population) standard deviation of the field values along the
+        specified direction(s), separately for each vector component. The parameters
+        and the returned values are the same as for
+        :py:func:`~discretisedfield.Field.mean`.
+
+        Examples
+        --------
+        1. Computing the standard deviation of a field.
+
+        >>> import discretisedfield as df
+        ...
+        >>> mesh = df.Mesh(p1=0, p2=4, cell=1)
+        >>> field = df.Field(mesh, nvdim=1, value=lambda x: x)
+        >>> field.std()
+        array([1.11803399])
+        >>> field.std(where=mesh.cells.x < 2)
+        array([0.5])
+
+        .. seealso:: :py:func:`~discretisedfield.Field.mean`
+
+        """
+        return self._reduce("std", direction, where, valid_only, subregion)
+
+    def min(self, direction=None, *, where=None, valid_only=False, subregion=None):
+        """Field minimum.
+
+        It computes the minimum of the field values along the specified direction(s),
+        separately for each vector component. The parameters and the returned values
+        are the same as for :py:func:`~discretisedfield.Field.mean`.
+
+        Raises
+        ------
+        ValueError
+
+            If the minimum over all directions is computed and no cell is included.
+
+        Examples
+        --------
+        1. Computing the minimum of a field.
+
+        >>> import discretisedfield as df
+        ...
+        >>> mesh = df.Mesh(p1=0, p2=4, cell=1)
+        >>> field = df.Field(mesh, nvdim=2, value=lambda x: (x, -x))
+        >>> field.min()
+        array([ 0.5, -3.5])
+        >>> field.min(where=mesh.cells.x > 1)
+        array([ 1.5, -3.5])
+
+        .. seealso:: :py:func:`~discretisedfield.Field.max`
+
+        """
+        return self._reduce("min", direction, where, valid_only, subregion)
+
+    def max(self, direction=None, *, where=None, valid_only=False, subregion=None):
+        """Field maximum.
+
+        It computes the maximum of the field values along the specified direction(s),
+        separately for each vector component. The parameters and the returned values
+        are the same as for :py:func:`~discretisedfield.Field.mean`.
+
+        Raises
+        ------
+        ValueError
+
+            If the maximum over all directions is computed and no cell is included.
+
+        Examples
+        --------
+        1. Computing the maximum of a field.
+
+        >>> import discretisedfield as df
+        ...
+        >>> mesh = df.Mesh(p1=0, p2=4, cell=1)
+        >>> field = df.Field(mesh, nvdim=2, value=lambda x: (x, -x))
+        >>> field.max()
+        array([ 3.5, -0.5])
+        >>> field.max(where=mesh.cells.x > 1)
+        array([ 3.5, -1.5])
+
+        .. seealso:: :py:func:`~discretisedfield.Field.min`
+
         """
-        # Mean over all directions implicitly.
+        return self._reduce("max", direction, where, valid_only, subregion)
+
+    def stats(self, direction=None, *, where=None, valid_only=False, subregion=None):
+        """Field statistics computed in a single pass.
+
+        It computes the mean, standard deviation, minimum, and maximum of every vector
+        component, the mean norm, and the fraction of valid cells. All statistics are
+        computed in one pass over the field array, which is processed in chunks using
+        numerically stable streaming accumulators (Welford's algorithm). This is
+        faster than computing the statistics separately and the results agree with
+        :py:func:`~discretisedfield.Field.mean`,
+        :py:func:`~discretisedfield.Field.std`, etc.
+
+        The parameters ``direction``, ``where``, ``valid_only``, and ``subregion`` are
+        the same as for :py:func:`~discretisedfield.Field.mean`.
+
+        Parameters
+        ----------
+        direction : None, string or tuple of strings, optional.
+
+            Directions along which the statistics are computed. Defaults to all
+            directions.
+
+        where : array_like or discretisedfield.Field, optional
+
+            Boolean array of shape ``mesh.n`` or scalar field defined on the same mesh
+            selecting the included cells. Defaults to ``None``.
+
+        valid_only : bool, optional
+
+            If ``True``, only valid cells are included. Defaults to ``False``.
+
+        subregion : str or discretisedfield.Region, optional
+
+            Name of a subregion (in ``mesh.subregions``) or region. Defaults to
+            ``None``.
+
+        Returns
+        -------
+        dict
+
+            Dictionary with keys ``'mean'``, ``'std'``, ``'min'``, ``'max'`` (arrays
+            of shape ``(nvdim,)``), ``'mean_norm'``, and ``'valid_fraction'`` (fraction
+            of the included cells that are valid). If one or more (but not all)
+            directions are selected, the values are fields of reduced geometrical
+            dimensions.
+
+        Raises
+        ------
+        ValueError
+
+            If the statistics over all directions are computed and no cell is
+            included.
+
+        Examples
+        --------
+        1. Computing the statistics of a field.
+
+        >>> import discretisedfield as df
+        ...
+        >>> mesh = df.Mesh(p1=0, p2=4, cell=1)
+        >>> field = df.Field(
+        ...     mesh, nvdim=2, value=lambda x: (x, -x), valid=lambda x: x < 3
+        ... )
+        >>> stats = field.stats()
+        >>> stats['mean']
+        array([ 2., -2.])
+        >>> stats['max']
+        array([ 3.5, -0.5])
+        >>> stats['valid_fraction']
+        0.75
+        >>> field.stats(valid_only=True)['mean']
+        array([ 1.5, -1.5])
+
+        2. Computing the statistics along a direction.
+
+        >>> mesh = df.Mesh(p1=(0, 0), p2=(4, 2), cell=(1, 1))
+        >>> field = df.Field(mesh, nvdim=1, value=lambda p: p[0])
+        >>> field.stats('x')['std']
+        Field(...)
+
+        .. seealso:: :py:func:`~discretisedfield.Field.mean`
+
+        """
+        mesh, array, valid, mask = self._reduction_cells(where, valid_only, subregion)
+        axis = self._reduction_axis(mesh, direction)
+        stats, count = _accumulated_stats(array, valid, mask, axis)
+
+        if len(axis) == mesh.region.ndim:
+            if count == 0:
+                raise ValueError("Cannot compute the statistics of zero cells.")
+            stats["mean_norm"] = stats["mean_norm"].item()
+            stats["valid_fraction"] = stats["valid_fraction"].item()
+            return stats
+
+        valid = None if mask is None else count > 0
+        return {
+            key: self._reduced_field(
+                mesh,
+                axis,
+                value,
+                valid,
+                vector=key not in ("mean_norm", "valid_fraction"),
+            )
+            for key, value in stats.items()
+        }
+
+    def _reduce(self, reduction, direction, where, valid_only, subregion):
+        """Reduction over ``direction`` restricted to the selected cells."""
+        mesh, array, _, mask = self._reduction_cells(where, valid_only, subregion)
+        axis = self._reduction_axis(mesh, direction)
+        if reduction == "std":
+            # streaming over chunks avoids full-size temporaries of the deviations
+            stats, count = _accumulated_stats(
+                array, None, mask, axis, moments_only=True
+            )
+            res = stats["std"]
+        else:
+            res, count = _masked_reduce(reduction, array, axis, mask)
+        # Reduction over all directions.
+        if len(axis) == mesh.region.ndim:
+            if reduction in ("min", "max") and count == 0:
+                raise ValueError(f"Cannot compute the {reduction} of zero cells.")
+            return res
+
+        return self._reduced_field(mesh, axis, res, None if mask is None else count > 0)
+
+    @staticmethod
+    def _reduction_axis(mesh, direction):
+        """Spatial axes of the reduction over ``direction``."""
+        # Reduction over all directions implicitly.
         if direction is None:
-            return self.array.mean(axis=tuple(range(self.mesh.region.ndim)))
+            return tuple(range(mesh.region.ndim))
         elif isinstance(direction, (tuple, list)):
             if len(direction) != len(set(direction)):
                 raise ValueError("Duplicate directions are not allowed.")
-            # Mean over all directions explicitly.
-            if sorted(direction) == sorted(self.mesh.region.dims):
-                return self.array.mean(axis=tuple(range(self.mesh.region.ndim)))
-            else:
-                # Multiple directions mean
-                mesh = self.mesh
-                axis = np.zeros(len(direction), dtype=int)
-                for i, d in enumerate(direction):
-                    mesh = mesh.sel(d)
-                    axis[i] = self.mesh.region._dim2index(d)
-                array = self.array.mean(axis=tuple(axis))
-                return self.__class__(
-                    mesh,
-                    nvdim=self.nvdim,
-                    value=array,
-                    unit=self.unit,
-                    vdims=self.vdims,
-                    vdim_mapping=self.vdim_mapping,
-                )
+            return tuple(mesh.region._dim2index(d) for d in direction)
         elif isinstance(direction, str):
-            axis = self.mesh.region._dim2index(direction)
-            return self.__class__(
-                self.mesh.sel(direction),
-                nvdim=self.nvdim,
-                value=self.array.mean(axis=axis),
-                vdims=self.vdims,
-                unit=self.unit,
-                vdim_mapping=self.vdim_mapping,
-            )
+            return (mesh.region._dim2index(direction),)
         else:
             raise ValueError(
                 "Direction must be None, string or tuple of strings, not"
                 f" {type(direction)}."
             )
 
+    def _reduced_field(self, mesh, axis, array, valid, vector=True):
+        """Field of the result of a reduction over ``axis``."""
+        for d in sorted(axis, reverse=True):
+            mesh = mesh.sel(mesh.region.dims[d])
+        if not vector:
+            return self._from_array(mesh, array[..., np.newaxis], valid=valid)
+        return self._from_array(
+            mesh,
+            array,
+            vdims=self.vdims,
+            unit=self.unit,
+            valid=valid,
+            vdim_mapping=self.vdim_mapping,
+        )
+
+    def _reduction_cells(self, where, valid_only, subregion):
+        """Mesh, array, valid, and mask (``None`` if all cells are selected) of the
+        cells selected with ``where``, ``valid_only``, and ``subregion``. The arrays
+        are views of the field arrays."""
+        mask = None
+        if where is not None:
+            if isinstance(where, self.__class__):
+                if where.nvdim != 1 or not where.mesh.allclose(self.mesh):
+                    raise ValueError(
+                        "'where' must be a scalar field defined on the same mesh."
+                    )
+                where = where._array[..., 0]
+            mask = np.asarray(where, dtype=bool)
+            if mask.shape != tuple(self.mesh.n):
+                raise ValueError(
+                    f"The shape of 'where' {mask.shape} must be equal to"
+                    f" {self.mesh.n=}."
+                )
+        if valid_only:
+            mask = _and_valid(mask, self._valid)
+
+        if subregion is None:
+            return self.mesh, self._array, self._valid, mask
+        mesh = self.mesh[subregion]
+        slices = self.mesh.region2slices(mesh.region)
+        mask = None if mask is None else mask[slices]
+        # subregions defined with labels only contain the labelled cells of the box
+        labelled = self.mesh._subregion_mask(subregion, slices)
+        if labelled is not None:
+            mask = labelled if mask is None else mask & labelled
+        return (
+            mesh,
+            self._array[slices],
+            None if self._valid is None else self._valid[slices],
+            mask,
+        )
+
     def __repr__(self):
         """Representation string.
 
@@ -856,18 +1614,25 @@ class Field(_FieldIO):
         ``point`` belongs to. It returns a tuple, whose length is the same as
         the dimension (``nvdim``) of the field.
 
+        Multiple points can be sampled at once by passing an array of points with
+        shape ``(N, ndim)``. The cells are found for all points at once (see
+        :py:func:`~discretisedfield.Mesh.point2index`), which is much faster than
+        sampling the points one by one.
+
         Parameters
         ----------
         point : array_like
 
             For example, in three dimensions, the mesh point coordinate
-            :math:`\mathbf{p} = (p_{x}, p_{y}, p_{z})`.
+            :math:`\mathbf{p} = (p_{x}, p_{y}, p_{z})`, or an array of points with
+            shape ``(N, ndim)``.
 
         Returns
         -------
         tuple
 
-            A tuple, whose length is the same as the dimension of the field.
+            A tuple, whose length is the same as the dimension of the field. For
+            multiple points, an array of values with shape ``(N, nvdim)``.
 
         Example
         -------
@@ -885,8 +1650,123 @@ class Field(_FieldIO):
         >>> field(point)
         array([1., 3., 4.])
 
+        2. Sampling the field at multiple points.
+
+        >>> field(np.array([[10, 2, 3], [0, 0, 0]])).shape
+        (2, 3)
+
         """
-        return self.array[self.mesh.point2index(point)]
+        index = self.mesh.point2index(point)
+        if isinstance(index, np.ndarray):
+            if self._array.flags.c_contiguous:
+                # much faster than indexing with a tuple of index arrays
+                flat = np.ravel_multi_index(tuple(index.T), self.mesh.n)
+                return np.take(self._array.reshape(-1, self.nvdim), flat, axis=0)
+            return self._array[tuple(index.T)]
+        return self._array[index].copy()
+
+    def interp(self, points, method="linear", workers=None):
+        r"""Interpolate the field at arbitrary points.
+
+        In contrast to sampling the field with ``field(points)``, which returns the
+        value of the cell containing the point, the values are interpolated between
+        the cell midpoints (multilinear or cubic not-a-knot spline). Between
+        the outermost cell midpoints and the region boundary the value at the
+        outermost midpoint is used (same as in ``Remapper``). Directions with a
+        single cell are ignored, i.e. the field is constant in these directions.
+
+        All components are interpolated together and the interpolator is cached
+        until the field values change (see :py:class:`~discretisedfield.Field`),
+        i.e. repeatedly sampling the same field only requires the evaluation. Invalid
+        cells (see ``valid``) are replaced by the value of the nearest valid cell
+        before interpolating, i.e. only valid values are used.
+
+        Parameters
+        ----------
+        points : array_like
+
+            A single point with shape ``(ndim,)`` or an array of points with shape
+            ``(N, ndim)``. All points must be inside the region of the mesh.
+
+        method : str, optional
+
+            One of ``'nearest'`` (value of the cell containing the point),
+            ``'linear'``, or ``'cubic'`` (requires at least four cells in all
+            directions with more than one cell, building the spline is more
+            expensive than evaluating it). Defaults to ``'linear'``.
+
+        workers : int, optional
+
+            If ``workers > 1``, the points are split into chunks which are evaluated
+            in parallel by a ``concurrent.futures.ThreadPoolExecutor`` with
+            ``workers`` threads. This only speeds up the evaluation of large numbers
+            of points. Defaults to ``None`` (serial evaluation).
+
+        Returns
+        -------
+        numpy.ndarray
+
+            Interpolated values with shape ``(N, nvdim)``, or ``(nvdim,)`` for a
+            single point.
+
+        Raises
+        ------
+        ValueError
+
+            If the method is unknown, the points have the wrong shape or are outside
+            the region, the mesh has too few cells for ``method='cubic'``, or all
+            cells are invalid.
+
+        ImportError
+
+            If ``method='cubic'`` and scipy is older than 1.12.
+
+        Examples
+        --------
+        1. Linear interpolation between the cell midpoints.
+
+        >>> import discretisedfield as df
+        ...
+        >>> mesh = df.Mesh(p1=(0, 0), p2=(10, 10), cell=(1, 1))
+        >>> field = df.Field(mesh, nvdim=2, value=lambda p: (p[0], p[1] + p[0]))
+        >>> field(np.array([[2.2, 3.0]]))
+        array([[2.5, 6. ]])
+        >>> field.interp(np.array([[2.2, 3.0]]))
+        array([[2.2, 5.2]])
+        >>> field.interp((2.2, 3.0), method='nearest')
+        array([2.5, 6. ])
+
+        """
+        methods = ("nearest", "linear", "cubic")
+        if method not in methods:
+            raise ValueError(f"Unknown {method=}; must be one of {methods}.")
+        points = np.asarray(points)
+        single = points.ndim == 1
+        if single:
+            points = points[np.newaxis]
+        if not np.issubdtype(points.dtype, np.integer) and not np.issubdtype(
+            points.dtype, np.floating
+        ):
+            raise TypeError(f"The elements of {points.dtype=} must be real numbers.")
+        if points.ndim != 2 or points.shape[1] != self.mesh.region.ndim:
+            raise ValueError(
+                f"Wrong dimensional points {points.shape=} but"
+                f" {self.mesh.region.ndim=}."
+            )
+        outside = ~self.mesh.region.contains(points)
+        if np.any(outside):
+            raise ValueError(
+                f"{np.count_nonzero(outside)} points (e.g."
+                f" {points[np.argmax(outside)]}) are outside the region"
+                f" {self.mesh.region=}."
+            )
+
+        interpolator = self._cached(
+            ("interp", method, self._valid_key()),
+            lambda: _Interpolator(self.mesh, self._array, self._valid, method),
+        )
+        values = interpolator(points, workers)
+        return values[0] if single else values
 
     def __getattr__(self, attr):
         """Extract the component of the vector field.
@@ -970,19 +1850,23 @@ class Field(_FieldIO):
                 " instead."
             )
         if self.vdims is not None and attr in self.vdims:
-            attr_array = self.array[..., self.vdims.index(attr), np.newaxis]
+            attr_array = self._array[..., self.vdims.index(attr), np.newaxis]
             try:
                 vdim_mapping = {attr: self.vdim_mapping[attr]}
             except KeyError:
                 vdim_mapping = {}
-            return self.__class__(
-                mesh=self.mesh,
-                nvdim=1,
-                value=attr_array,
+            component = self._from_array(
+                self.mesh,
+                attr_array,
                 unit=self.unit,
-                valid=self.valid,
+                valid=self._valid,
                 vdim_mapping=vdim_mapping,
             )
+            component._version = self._version  # view into self.array
+            component._diff_accuracy = self._diff_accuracy
+            component._diff_method = self._diff_method
+            component._diff_bc = self._diff_bc
+            return component
         else:
             raise AttributeError(f"Object has no attribute {attr}.")
 
@@ -1056,10 +1940,60 @@ class Field(_FieldIO):
         --------
         :py:func:`~discretisedfield.Mesh.__iter__`
         :py:func:`~discretisedfield.Mesh.indices`
+        :py:func:`~discretisedfield.Field.iter_blocks`
+
+        """
+        for _, values in self.iter_blocks():
+            yield from values
+
+    def iter_blocks(self, max_cells=2**16):
+        """Generator yielding the coordinates and values of blocks of cells.
+
+        The cells are in the same order as in ``Mesh.indices`` and ``Field.__iter__``
+        (first index changing fastest), split into blocks of at most ``max_cells``
+        cells (but at least one layer of cells perpendicular to the last spatial
+        direction). This allows processing all cells with array operations while
+        limiting the size of temporary arrays.
+
+        Parameters
+        ----------
+        max_cells : int, optional
+
+            Maximum number of cells per block. Defaults to ``2**16``.
+
+        Yields
+        ------
+        tuple
+
+            Cell midpoints with shape ``(M, ndim)`` and field values with shape ``(M,
+            nvdim)``. The values are a copy, i.e. modifying them does not change the
+            field.
+
+        Examples
+        --------
+        1. Iterating through blocks of cells.
+
+        >>> import discretisedfield as df
+        ...
+        >>> mesh = df.Mesh(p1=(0, 0, 0), p2=(2, 2, 2), cell=(1, 1, 1))
+        >>> field = df.Field(mesh, nvdim=1, value=lambda p: p[2])
+        >>> for coords, values in field.iter_blocks(max_cells=4):
+        ...     print(coords.shape, values[:, 0])
+        (4, 3) [0.5 0.5 0.5 0.5]
+        (4, 3) [1.5 1.5 1.5 1.5]
 
         """
-        for point in self.mesh:
-            yield self(point)
+        array = self._array
+        # reshape copies non-contiguous arrays (e.g. components or sel results), which
+        # must not happen for every block
+        flat_array = array.reshape(-1, self.nvdim) if array.flags.c_contiguous else None
+        for index in self.mesh._index_blocks(max_cells):
+            if flat_array is None:
+                values = array[tuple(index.T)]
+            else:
+                flat = np.ravel_multi_index(tuple(index.T), self.mesh.n)
+                values = np.take(flat_array, flat, axis=0)
+            yield self.mesh.index2point(index), values
 
     def __eq__(self, other):
         """Relational operator ``==``.
@@ -1114,7 +2048,7 @@ class Field(_FieldIO):
         return (
             self.mesh == other.mesh
             and self.nvdim == other.nvdim
-            and np.array_equal(self.array, other.array)
+            and np.array_equal(self._array, other._array)
         )
 
     def allclose(self, other, rtol=1e-5, atol=1e-8):
@@ -1186,7 +2120,7 @@ class Field(_FieldIO):
             # The above equation is not symmetric in a and b, so that allclose(a, b)
             # might be different from allclose(b, a)
             # We want it relative to the original array
-            return np.allclose(other.array, self.array, rtol=rtol, atol=atol)
+            return np.allclose(other._array, self._array, rtol=rtol, atol=atol)
         else:
             return False
 
@@ -1199,7 +2133,7 @@ class Field(_FieldIO):
         if not isinstance(other, self.__class__):
             raise TypeError(f"Object of type {type(other)} not supported.")
 
-        if not self.mesh.allclose(other.mesh):
+        if self.mesh is not other.mesh and not self.mesh.allclose(other.mesh):
             raise ValueError(
                 "To perform this operation both fields must have the same mesh."
             )
@@ -1213,17 +2147,28 @@ class Field(_FieldIO):
                 " number of vector components."
             )
 
-    def _apply_operator(self, other, function, operator):
-        valid = self.valid
+    def _check_out(self, out, nvdim):
+        """Check that ``out`` can store the result of an operation on this field."""
+        if not isinstance(out, self.__class__):
+            raise TypeError(f"Invalid {type(out)=}; must be of type {self.__class__}.")
+        if out.nvdim != nvdim:
+            raise ValueError(f"Invalid {out.nvdim=}; the result has {nvdim=}.")
+        if out.mesh is not self.mesh and not self.mesh.allclose(out.mesh):
+            raise ValueError("The field passed as 'out' must have the same mesh.")
+
+    def _apply_operator(self, other, function, operator, inplace=False):
+        valid = self._valid
         if isinstance(other, self.__class__):
             self._check_same_mesh_and_field_dim(other, ignore_scalar=True)
-            valid = np.logical_and(valid, other.valid)
-            other = other.array
+            valid = _and_valid(valid, other._valid)
+            other = other._array
+        elif isinstance(other, df.LazyField):
+            return NotImplemented  # the reflected operator of LazyField is used
         elif isinstance(other, numbers.Complex):
             pass
         elif isinstance(other, (tuple, list, np.ndarray)):
             if not (
-                self.array.shape == np.shape(other)
+                self._array.shape == np.shape(other)
                 or self.nvdim == len(other)
                 or self.nvdim == 1
             ):
@@ -1239,12 +2184,31 @@ class Field(_FieldIO):
             )
             raise TypeError(msg)
 
-        res_array = function(self.array, other)
+        if inplace:
+            # Fall back to the binary operator (Python does this automatically if
+            # NotImplemented is returned) if the result does not fit into the array
+            # or the array is read-only.
+            if (
+                np.broadcast_shapes(self._array.shape, np.shape(other))
+                != self._array.shape
+                or not self._array.flags.writeable
+            ):
+                return NotImplemented
+            try:
+                function(self._array, other, out=self._array)
+            except TypeError:  # numpy cannot cast the result to self.dtype
+                return NotImplemented
+            self._touch()
+            self._valid = valid
+            return self
+
+        if valid is self._valid:
+            valid = _copy_valid(valid)
+        res_array = function(self._array, other)
         vdims = self.vdims if self.nvdim == res_array.shape[-1] else None
-        return self.__class__(
+        return self._from_array(
             self.mesh,
-            nvdim=res_array.shape[-1],
-            value=res_array,
+            res_array,
             vdims=vdims,
             valid=valid,
             vdim_mapping=self.vdim_mapping,
@@ -1331,12 +2295,11 @@ class Field(_FieldIO):
         array([   0., 1000.,    3.])
 
         """
-        return self.__class__(
+        return self._from_array(
             self.mesh,
-            nvdim=self.nvdim,
-            value=-self.array,
+            -self._array,
             vdims=self.vdims,
-            valid=self.valid,
+            valid=_copy_valid(self._valid),
             vdim_mapping=self.vdim_mapping,
         )
 
@@ -1464,6 +2427,38 @@ class Field(_FieldIO):
     def __radd__(self, other):
         return self + other
 
+    def __iadd__(self, other):
+        """In-place ``+=`` operator.
+
+        The values of the second operand are added to the field array in place, i.e.
+        no new field or array is created and other references to the field (or to
+        its ``array``) see the updated values. The same operands as for
+        :py:func:`~discretisedfield.Field.__add__` are supported. If the result does
+        not fit into the field array, e.g. because adding a vector field to a scalar
+        field changes ``nvdim`` or because adding ``float`` values to an ``int``
+        field changes ``dtype``, ``f += other`` falls back to ``f = f + other``.
+
+        Example
+        -------
+        1. Accumulate vector fields.
+
+        >>> import discretisedfield as df
+        ...
+        >>> mesh = df.Mesh(p1=(0, 0, 0), p2=(5, 3, 1), cell=(1, 1, 1))
+        >>> total = df.Field(mesh, nvdim=3, value=(0, 0, 0))
+        >>> array = total.array
+        >>> for i in range(3):
+        ...     total += df.Field(mesh, nvdim=3, value=(i, 1, -1))
+        >>> total.mean()
+        array([ 3.,  3., -3.])
+        >>> total.array is array
+        True
+
+        .. seealso:: :py:func:`~discretisedfield.Field.__add__`
+
+        """
+        return self._apply_operator(other, np.add, "+=", inplace=True)
+
     def __sub__(self, other):
         """Binary ``-`` operator.
 
@@ -1524,6 +2519,15 @@ class Field(_FieldIO):
     def __rsub__(self, other):
         return -self + other
 
+    def __isub__(self, other):
+        """In-place ``-=`` operator.
+
+        .. seealso:: :py:func:`~discretisedfield.Field.__iadd__`,
+            :py:func:`~discretisedfield.Field.__sub__`
+
+        """
+        return self._apply_operator(other, np.subtract, "-=", inplace=True)
+
     def __mul__(self, other):
         """Binary ``*`` operator.
 
@@ -1594,6 +2598,15 @@ class Field(_FieldIO):
     def __rmul__(self, other):
         return self * other
 
+    def __imul__(self, other):
+        """In-place ``*=`` operator.
+
+        .. seealso:: :py:func:`~discretisedfield.Field.__iadd__`,
+            :py:func:`~discretisedfield.Field.__mul__`
+
+        """
+        return self._apply_operator(other, np.multiply, "*=", inplace=True)
+
     def __truediv__(self, other):
         """Binary ``/`` operator.
 
@@ -1663,7 +2676,16 @@ class Field(_FieldIO):
         # TODO: Fix error messages - wrong order
         return self._apply_operator(other, lambda x, y: np.divide(y, x), "/")
 
-    def dot(self, other):
+    def __itruediv__(self, other):
+        """In-place ``/=`` operator.
+
+        .. seealso:: :py:func:`~discretisedfield.Field.__iadd__`,
+            :py:func:`~discretisedfield.Field.__truediv__`
+
+        """
+        return self._apply_operator(other, np.divide, "/=", inplace=True)
+
+    def dot(self, other, out=None):
         """Dot product.
 
         This method computes the dot product between two fields. Both fields
@@ -1675,11 +2697,16 @@ class Field(_FieldIO):
 
             Second operand.
 
+        out : discretisedfield.Field, optional
+
+            Scalar field (``nvdim=1``) defined on the same mesh into which the result
+            is written. If not specified, a new field is created.
+
         Returns
         -------
         discretisedfield.Field
 
-            Resulting field.
+            Resulting field (``out`` if specified).
 
         Raises
         ------
@@ -1703,23 +2730,42 @@ class Field(_FieldIO):
         >>> f1.dot(f2).mean()
         array([5.])
 
+        2. Write the dot product into an existing field.
+
+        >>> res = df.Field(mesh, nvdim=1)
+        >>> f1.dot(f2, out=res) is res
+        True
+        >>> res.mean()
+        array([5.])
+
         """
-        valid = self.valid
+        if out is not None:
+            self._check_out(out, nvdim=1)
         if isinstance(other, self.__class__):
             self._check_same_mesh_and_field_dim(other)
-            valid = np.logical_and(valid, other.valid)
-            other = other.array
-        elif not isinstance(other, (tuple, list, np.ndarray)):
+            valid = _and_valid(self._valid, other._valid)
+            other = other._array
+        elif isinstance(other, (tuple, list, np.ndarray)):
+            valid = _copy_valid(self._valid)
+        else:
             msg = (
                 f"Unsupported operand type(s) for dot product: {type(self)=} and"
                 f" {type(other)=}."
             )
             raise TypeError(msg)
 
-        res_array = np.einsum("...l,...l->...", self.array, other)
-        return self.__class__(
-            self.mesh, nvdim=1, value=res_array[..., np.newaxis], valid=valid
-        )
+        if out is not None:
+            np.einsum(
+                "...l,...l->...",
+                self._array,
+                other,
+                out=out._writable_array()[..., 0],
+            )
+            out._valid = valid
+            return out
+
+        res_array = np.einsum("...l,...l->...", self._array, other)
+        return self._from_array(self.mesh, res_array[..., np.newaxis], valid=valid)
 
     def __matmul__(self, other):
         return self.dot(other)
@@ -1727,7 +2773,7 @@ class Field(_FieldIO):
     def __rmatmul__(self, other):
         return self.dot(other)
 
-    def cross(self, other):
+    def cross(self, other, out=None):
         """Cross product.
 
         This method computes the cross product between two fields. Both fields
@@ -1739,11 +2785,17 @@ class Field(_FieldIO):
 
             Second operand.
 
+        out : discretisedfield.Field, optional
+
+            Vector field (``nvdim=3``) defined on the same mesh into which the result
+            is written. It can be one of the operands. If not specified, a new field
+            is created.
+
         Returns
         -------
         discretisedfield.Field
 
-            Resulting field.
+            Resulting field (``out`` if specified).
 
         Raises
         ------
@@ -1770,7 +2822,8 @@ class Field(_FieldIO):
         array([ 0., -1.,  0.])
 
         """
-        valid = self.valid
+        if out is not None:
+            self._check_out(out, nvdim=3)
         if isinstance(other, self.__class__):
             self._check_same_mesh_and_field_dim(other)
             if self.nvdim != 3 or other.nvdim != 3:
@@ -1779,21 +2832,24 @@ class Field(_FieldIO):
                     f" {other.nvdim=} fields."
                 )
                 raise ValueError(msg)
-            valid = np.logical_and(valid, other.valid)
-            other = other.array
-        elif not isinstance(other, (tuple, list, np.ndarray)):
+            valid = _and_valid(self._valid, other._valid)
+            other = other._array
+        elif isinstance(other, (tuple, list, np.ndarray)):
+            valid = _copy_valid(self._valid)
+        else:
             msg = (
                 f"Unsupported operand type(s) for cross product: {type(self)=} and"
                 f" {type(other)=}."
             )
             raise TypeError(msg)
 
-        return self.__class__(
-            self.mesh,
-            nvdim=3,
-            value=np.cross(self.array, other),
-            vdims=self.vdims,
-            valid=valid,
+        if out is not None:
+            _cross(self._array, np.asarray(other), out._writable_array())
+            out._valid = valid
+            return out
+
+        return self._from_array(
+            self.mesh, np.cross(self._array, other), vdims=self.vdims, valid=valid
         )
 
     def __and__(self, other):
@@ -1858,12 +2914,12 @@ class Field(_FieldIO):
         True
 
         """
-        valid = self.valid
+        valid = self._valid
         if isinstance(other, self.__class__):
             if self.mesh != other.mesh:
                 msg = "Cannot apply operator << on fields defined on different meshes."
                 raise ValueError(msg)
-            valid = np.logical_and(valid, other.valid)
+            valid = _and_valid(valid, other._valid)
         elif isinstance(other, numbers.Complex):
             return self << self.__class__(self.mesh, nvdim=1, value=other)
         elif isinstance(other, (tuple, list, np.ndarray)):
@@ -1874,8 +2930,8 @@ class Field(_FieldIO):
             )
             raise TypeError(msg)
 
-        array_list = [self.array[..., i] for i in range(self.nvdim)]
-        array_list += [other.array[..., i] for i in range(other.nvdim)]
+        array_list = [self._array[..., i] for i in range(self.nvdim)]
+        array_list += [other._array[..., i] for i in range(other.nvdim)]
 
         if self.vdims is None or other.vdims is None:
             vdims = None
@@ -1892,10 +2948,9 @@ class Field(_FieldIO):
             # keys are missing or not unique -> the user has to set the mapping manually
             vdim_mapping = None
 
-        return self.__class__(
+        return self._from_array(
             self.mesh,
-            nvdim=len(array_list),
-            value=np.stack(array_list, axis=-1),
+            np.stack(array_list, axis=-1),
             vdims=vdims,
             valid=valid,
             vdim_mapping=vdim_mapping,
@@ -1968,17 +3023,16 @@ class Field(_FieldIO):
         d = {}
         for key, value in pad_width.items():
             d[self.mesh.region._dim2index(key)] = value
-        padding_sequence = dfu.assemble_index((0, 0), len(self.array.shape), d)
-        padded_array = np.pad(self.array, padding_sequence, mode=mode, **kwargs)
+        padding_sequence = dfu.assemble_index((0, 0), len(self._array.shape), d)
+        padded_array = np.pad(self._array, padding_sequence, mode=mode, **kwargs)
 
         padding_sequence = dfu.assemble_index((0, 0), len(self.valid.shape), d)
         padded_valid = np.pad(self.valid, padding_sequence, mode=mode, **kwargs)
         padded_mesh = self.mesh.pad(pad_width)
 
-        return self.__class__(
+        return self._from_array(
             padded_mesh,
-            nvdim=self.nvdim,
-            value=padded_array,
+            padded_array,
             vdims=self.vdims,
             unit=self.unit,
             vdim_mapping=self.vdim_mapping,
@@ -2043,7 +3097,7 @@ class Field(_FieldIO):
                 nvdim=self.nvdim,
                 vdims=self.vdims,
                 unit=self.unit,
-                valid=self.valid,
+                valid=_copy_valid(self._valid),
                 vdim_mapping=self.vdim_mapping,
             )
 
@@ -2181,22 +3235,30 @@ class Field(_FieldIO):
             ) / self.mesh.cell[direction_idx] ** 2
 
         # Remove padded values (if any).
-        if derivative_array.shape != self.array.shape:
+        if derivative_array.shape != self._array.shape:
             derivative_array = derivative_array[
                 dfu.assemble_index(slice(None), 4, {direction_idx: slice(1, -1)})
             ]
 
-        return self.__class__(
+        return self._from_array(
             self.mesh,
-            nvdim=self.nvdim,
-            value=derivative_array,
+            derivative_array,
             vdims=self.vdims,
             unit=self.unit,
-            valid=self.valid,
+            valid=_copy_valid(self._valid),
             vdim_mapping=self.vdim_mapping,
         )
 
-    def diff(self, direction, order=1, restrict2valid=True):
+    def diff(
+        self,
+        direction,
+        order=1,
+        restrict2valid=True,
+        out=None,
+        accuracy=None,
+        method=None,
+        bc=None,
+    ):
         """Directional derivative.
 
         This method computes a directional derivative of the field and returns
@@ -2211,6 +3273,18 @@ class Field(_FieldIO):
         are used at the boundaries and the second order accurate finite difference
         stencils are used in the interior.
 
+        Fourth or sixth order accurate stencils can be used by passing ``accuracy``
+        (or setting ``field.diff_accuracy``). The interior cells then use central
+        stencils and the cells close to the boundaries (or to invalid cells) use
+        off-centre stencils with the same accuracy. If a contiguous part of the field
+        has too few cells for these stencils, the next lower accuracy is used for
+        this part.
+
+        In periodic directions, the derivative can also be computed spectrally with
+        ``method='spectral'`` using a fast Fourier transform. Spectral derivatives
+        are exact for band-limited periodic data and require that all cells are
+        valid (or ``restrict2valid=False``).
+
         Directional derivative cannot be computed if less or equal discretisation
         cells exists in a specified direction than the order.
         In that case, a zero field is returned.
@@ -2220,10 +3294,18 @@ class Field(_FieldIO):
         changed to compute the directional derivative across the whole field
         by setting ``restrict2valid`` to ``False``.
 
-        Computing of the directional derivative depends
-        strongly on the boundary condition specified. In this method,
-        only periodic boundary conditions at the edges of the region
-        are supported. To enable periodic boundary conditions, set ``mesh.bc``.
+        Computing of the directional derivative depends strongly on the boundary
+        conditions. For periodic boundary conditions (specified in ``mesh.bc``), the
+        cells on the opposite side are used. In other directions, one-sided stencils
+        are used at the boundaries unless a boundary condition is passed with ``bc``
+        (or set with ``field.diff_bc``): for Neumann boundary conditions
+        (``bc='neumann'``) the cells at the boundary are mirrored (zero gradient), and
+        for Dirichlet boundary conditions (``bc='dirichlet'``) they are mirrored with
+        opposite sign, i.e. the value at the boundary faces is zero. Only homogeneous
+        (zero) Dirichlet boundary conditions are supported; for a non-zero boundary
+        value ``g``, the derivative of ``field - g`` can be used if ``g`` is constant.
+        The Neumann and Dirichlet boundary conditions of ``mesh.bc`` are not used.
+        The boundary conditions are applied without copying (padding) the field.
 
         Parameters
         ----------
@@ -2242,12 +3324,34 @@ class Field(_FieldIO):
             the directional derivative is computed across the whole field.
             The default value is ``True``.
 
+        out : discretisedfield.Field, optional
+
+            Field with the same ``nvdim`` defined on the same mesh into which the
+            derivative is written. It can be the field itself. If not specified, a new
+            field is created.
+
+        accuracy : int, optional
+
+            Order of accuracy of the finite-difference stencils. It can be 2, 4, or 6.
+            Defaults to ``field.diff_accuracy``, which is 2.
+
+        method : str, optional
+
+            ``'finite-difference'`` or ``'spectral'``. Defaults to
+            ``field.diff_method`` (which is ``'finite-difference'``) in periodic
+            directions and to ``'finite-difference'`` otherwise.
+
+        bc : str, optional
+
+            Boundary condition if ``direction`` is not periodic: ``'neumann'``,
+            ``'dirichlet'``, or ``None`` (one-sided stencils). Defaults to
+            ``field.diff_bc``, which is ``None``.
 
         Returns
         -------
         discretisedfield.Field
 
-            Directional derivative.
+            Directional derivative (``out`` if specified).
 
         Raises
         ------
@@ -2255,6 +3359,12 @@ class Field(_FieldIO):
 
             If order ``n`` higher than 2 is asked for.
 
+        ValueError
+
+            If ``accuracy`` is not 2, 4, or 6, if ``method`` is unknown, or if
+            spectral derivatives are requested in a non-periodic direction or for a
+            field with invalid cells.
+
         Example
         -------
         1. Compute the first-order directional derivative of a scalar field in
@@ -2315,58 +3425,180 @@ class Field(_FieldIO):
         >>> f.diff('x', order=1).array.tolist()
         [[1.0], [1.0], [1.0], [1.0], [1.0], [0.0], [0.0], [0.0], [0.0], [0.0]]
 
+        4. Compute the derivative of :math:`f(x) = x^4` with fourth order accurate
+        stencils, which are exact for polynomials up to degree four.
+
+        >>> f = df.Field(mesh, nvdim=1, value=lambda x: x**4)
+        >>> np.allclose(f.diff('x', accuracy=4).array[..., 0], 4 * mesh.cells.x**3)
+        True
+
+        5. Compute the spectral derivative of a periodic field.
+
+        >>> mesh = df.Mesh(p1=0, p2=2 * np.pi, n=16, bc='x')
+        >>> f = df.Field(mesh, nvdim=1, value=lambda x: np.sin(3 * x))
+        >>> d = f.diff('x', method='spectral')
+        >>> np.allclose(d.array[..., 0], 3 * np.cos(3 * mesh.cells.x))
+        True
+
+        6. Compute the second derivative of :math:`f(x) = \\sin(x)`, which is zero at
+        both boundaries, with homogeneous Dirichlet boundary conditions.
+
+        >>> mesh = df.Mesh(p1=0, p2=np.pi, n=100)
+        >>> f = df.Field(mesh, nvdim=1, value=lambda x: np.sin(x))
+        >>> d = f.diff('x', order=2, bc='dirichlet')
+        >>> np.allclose(d.array[..., 0], -np.sin(mesh.cells.x), atol=1e-4)
+        True
+
         """
         # Check order of derivative
         if order not in (1, 2):
             raise NotImplementedError(f"Derivative of {order=} is not implemented.")
 
+        if accuracy is None:
+            accuracy = self.diff_accuracy
+        else:
+            _check_accuracy(accuracy)
+        bc = self.mesh._bc_type(direction, self.diff_bc if bc is None else bc)
+        if method is None:
+            method = self.diff_method
+            if bc != "periodic":
+                # the default only applies to periodic directions
+                method = "finite-difference"
+        else:
+            _check_diff_method(method)
+
+        if out is not None:
+            self._check_out(out, nvdim=self.nvdim)
+
         direction_idx = self.mesh.region._dim2index(direction)
 
-        # If direction is periodic pad the field
-        if direction in self.mesh.bc:
-            field = self.pad({direction: (1, 1)}, mode="wrap")
-        else:
-            field = self
-
-        # Use only valid values for the derivative if restrict2valid is True
-        # or use all values if restrict2valid is False
-        valid = field.valid if restrict2valid else np.ones_like(field.valid, dtype=bool)
-
-        out = np.zeros_like(field.array)
-
-        # Loop over all cells in the plane perpendicular to the direction of the
-        # derivative. Use sel method in a way that keeps the dimensionality but
-        # only returns a single layer in the direction of the derivative
-        point = field.mesh.region.pmin[direction_idx]
-        for idx in field.mesh.sel(**{direction: (point, point)}).indices:
-            idx = list(idx)
-            idx[direction_idx] = slice(None)
-            valid_arr = valid[tuple(idx)]
-            # Loop over all value dimensions of the vector field and
-            # compute the derivative for each value dimension.
-            for dim in range(field.nvdim):
-                out[tuple([*idx, dim])] = _split_diff_combine(
-                    field.array[tuple([*idx, dim])],
-                    valid_arr,
-                    order,
-                    field.mesh.cell[direction_idx],
+        if method == "spectral":
+            if bc != "periodic":
+                raise ValueError(
+                    "Spectral derivatives require periodic boundary conditions in"
+                    f" {direction=}, not {self.mesh.bc=}."
                 )
+            if restrict2valid:
+                self._check_spectral_valid()
+            res = _spectral_diff(
+                self._array, direction_idx, order, self.mesh.cell[direction_idx]
+            )
+            if out is not None:
+                out._writable_array()[...] = res
+        else:
+            # Use only valid values for the derivative if restrict2valid is True
+            # or use all values if restrict2valid is False.
+            res = _diff(
+                self._array,
+                self._valid if restrict2valid else None,
+                direction_idx,
+                order,
+                self.mesh.cell[direction_idx],
+                bc=bc,
+                out=None if out is None else out._writable_array(),
+                accuracy=accuracy,
+            )
 
-        # Remove the padding if periodic is True
-        if direction in self.mesh.bc:
-            slices = field.mesh.region2slices(self.mesh.region)
-            out = out[slices]
+        if out is not None:
+            out._valid = _copy_valid(self._valid)
+            return out
 
-        return self.__class__(
+        return self._from_array(
             self.mesh,
-            nvdim=self.nvdim,
-            value=out,
+            res,
             vdims=self.vdims,
             unit=self.unit,
-            valid=self.valid,
+            valid=_copy_valid(self._valid),
             vdim_mapping=self.vdim_mapping,
         )
 
+    @property
+    def jacobian(self):
+        r"""Jacobian matrix.
+
+        This property computes the first derivatives of all components of the field
+        in all spatial directions:
+
+        .. math::
+
+            J_{ij} = \frac{\partial f_i}{\partial x_j}
+
+        The derivatives are the same as the ones computed with
+        :py:func:`~discretisedfield.Field.diff` (including boundary conditions and
+        invalid cells). The accuracy of the stencils is set with
+        ``field.diff_accuracy`` and spectral derivatives in periodic directions can
+        be used by setting ``field.diff_method = 'spectral'``. The derivatives of the
+        individual components are cached until the field values or the valid cells
+        change and reused by ``grad``, ``div``, and ``curl``.
+
+        Returns
+        -------
+        numpy.ndarray
+
+            Jacobian matrix with shape ``(*mesh.n, nvdim, ndim)``.
+
+        Example
+        -------
+        1. Compute the Jacobian matrix of a vector field.
+
+        >>> import discretisedfield as df
+        ...
+        >>> mesh = df.Mesh(p1=(0, 0, 0), p2=(10, 10, 10), cell=(1, 1, 1))
+        >>> f = df.Field(mesh, nvdim=3, value=lambda p: (2 * p[1], 3 * p[0], p[2]))
+        >>> f.jacobian.shape
+        (10, 10, 10, 3, 3)
+        >>> f.jacobian.mean(axis=(0, 1, 2))
+        array([[0., 2., 0.],
+               [3., 0., 0.],
+               [0., 0., 1.]])
+
+        .. seealso:: :py:func:`~discretisedfield.Field.diff`
+
+        """
+        ndim = self.mesh.region.ndim
+        jacobian = np.empty(
+            (*self.mesh.n, self.nvdim, ndim),
+            dtype=np.result_type(self._array.dtype, np.float64),
+        )
+        for component in range(self.nvdim):
+            for axis in range(ndim):
+                jacobian[..., component, axis] = self._derivative(axis, component)
+        return jacobian
+
+    def _derivative(self, axis, component, order=1):
+        """Derivative of one component along one axis with shape ``mesh.n``.
+
+        The derivative is cached (read-only, see ``_cached``) for the current valid
+        cells, i.e. the derived operators only compute the derivatives they need and
+        share them.
+
+        """
+        accuracy = self.diff_accuracy
+        method = self.diff_method
+        cell = self.mesh.cell[axis]
+        bc = self.mesh._bc_type(self.mesh.region.dims[axis], self.diff_bc)
+        array = self._array[..., component : component + 1]
+
+        def derivative():
+            if method == "spectral" and bc == "periodic":
+                self._check_spectral_valid()
+                res = _spectral_diff(array, axis, order, cell)
+            else:
+                res = _diff(
+                    array, self._valid, axis, order, cell, bc=bc, accuracy=accuracy
+                )
+            return res[..., 0]
+
+        key = ("derivative", axis, component, order, accuracy, method, bc)
+        return self._cached((*key, self._valid_key()), derivative)
+
+    def _check_spectral_valid(self):
+        """Spectral derivatives cannot be restricted to the valid cells."""
+        if self._valid is not None and not self._valid.all():
+            raise ValueError(
+                "Spectral derivatives cannot be computed for fields with invalid cells."
+            )
+
     @property
     def grad(self):
         r"""Gradient.
@@ -2441,14 +3673,11 @@ class Field(_FieldIO):
             msg = f"Cannot compute gradient for nvdim={self.nvdim} field."
             raise ValueError(msg)
 
-        # Create a list of derivatives for each dimension
-        derivatives = [self.diff(dim) for dim in self.mesh.region.dims]
-
-        result = derivatives[0]
-        for derivative in derivatives[1:]:
-            result = result << derivative
-
-        return result
+        grad = np.stack(
+            [self._derivative(axis, 0) for axis in range(self.mesh.region.ndim)],
+            axis=-1,
+        )
+        return self._from_array(self.mesh, grad, valid=_copy_valid(self._valid))
 
     @property
     def div(self):
@@ -2523,8 +3752,12 @@ class Field(_FieldIO):
                     f"is not present in {self.mesh.region.dims=}."
                 )
 
-        return sum(
-            getattr(self, vdim).diff(self.vdim_mapping[vdim]) for vdim in self.vdims
+        dims = self.mesh.region.dims
+        div = 0
+        for i, vdim in enumerate(self.vdims):
+            div = div + self._derivative(dims.index(self.vdim_mapping[vdim]), i)
+        return self._from_array(
+            self.mesh, div[..., np.newaxis], valid=_copy_valid(self._valid)
         )
 
     @property
@@ -2615,19 +3848,23 @@ class Field(_FieldIO):
                     f" is not present in {self.mesh.region.dims=}."
                 )
 
+        dims = self.mesh.region.dims
+
+        def derivative(component, direction):
+            i = self.vdims.index(self._r_dim_mapping[component])
+            return self._derivative(dims.index(direction), i)
+
         # Use dims order instead of vdims
-        x, y, z = self.mesh.region.dims
-        curl_x = getattr(self, self._r_dim_mapping[z]).diff(y) - getattr(
-            self, self._r_dim_mapping[y]
-        ).diff(z)
-        curl_y = getattr(self, self._r_dim_mapping[x]).diff(z) - getattr(
-            self, self._r_dim_mapping[z]
-        ).diff(x)
-        curl_z = getattr(self, self._r_dim_mapping[y]).diff(x) - getattr(
-            self, self._r_dim_mapping[x]
-        ).diff(y)
-
-        return curl_x << curl_y << curl_z
+        x, y, z = dims
+        curl = np.stack(
+            [
+                derivative(z, y) - derivative(y, z),
+                derivative(x, z) - derivative(z, x),
+                derivative(y, x) - derivative(x, y),
+            ],
+            axis=-1,
+        )
+        return self._from_array(self.mesh, curl, valid=_copy_valid(self._valid))
 
     @property
     def laplace(self):
@@ -2688,27 +3925,31 @@ class Field(_FieldIO):
 
         """
 
-        # Create a list of derivatives for each dimension
-        if self.nvdim == 1:
-            derivatives = [
-                sum(self.diff(dim, order=2) for dim in self.mesh.region.dims)
-            ]
-        else:
-            derivatives = [
+        laplace = np.stack(
+            [
                 sum(
-                    getattr(self, vdim).diff(dim, order=2)
-                    for dim in self.mesh.region.dims
+                    self._derivative(axis, component, order=2)
+                    for axis in range(self.mesh.region.ndim)
                 )
-                for vdim in self.vdims
-            ]
-
-        result = derivatives[0]
-        for derivative in derivatives[1:]:
-            result = result << derivative
-
-        return result
+                for component in range(self.nvdim)
+            ],
+            axis=-1,
+        )
+        if self.nvdim == 1:
+            return self._from_array(
+                self.mesh, laplace, vdims=self.vdims, valid=_copy_valid(self._valid)
+            )
+        return self._from_array(self.mesh, laplace, valid=_copy_valid(self._valid))
 
-    def integrate(self, direction=None, cumulative=False):
+    def integrate(
+        self,
+        direction=None,
+        cumulative=False,
+        *,
+        where=None,
+        valid_only=False,
+        subregion=None,
+    ):
         r"""Integral.
 
         This method integrates the field over the mesh along the specified direction,
@@ -2730,6 +3971,11 @@ class Field(_FieldIO):
         The method sums all cells up to (excluding) the cell that contains the point x.
         The cell containing x is added with a weight 1/2.
 
+        The integral can be restricted to a subset of cells using ``where``,
+        ``valid_only``, and ``subregion`` (see
+        :py:func:`~discretisedfield.Field.mean`). Excluded cells do not contribute to
+        the integral.
+
         Parameters
         ----------
         direction : str, optional
@@ -2741,6 +3987,21 @@ class Field(_FieldIO):
 
             If ``True``, an cumulative integral is computed. Defaults to ``False``.
 
+        where : array_like or discretisedfield.Field, optional
+
+            Boolean array of shape ``mesh.n`` or scalar field defined on the same mesh.
+            Only cells where ``where`` is ``True`` are integrated. Defaults to
+            ``None``.
+
+        valid_only : bool, optional
+
+            If ``True``, only valid cells are integrated. Defaults to ``False``.
+
+        subregion : str or discretisedfield.Region, optional
+
+            Name of a subregion (in ``mesh.subregions``) or region. If specified, the
+            field is only integrated over the subregion. Defaults to ``None``.
+
         Returns
         -------
         discretisedfield.Field or np.ndarray
@@ -2829,42 +4090,49 @@ class Field(_FieldIO):
         >>> f_plane.integrate(direction='x', cumulative=True)
         Field(...)
 
+        7. Volume integral over the valid cells.
+
+        >>> f = df.Field(mesh, nvdim=1, value=5, valid=lambda p: p[0] < 4)
+        >>> f.integrate(valid_only=True)
+        array([2000.])
+
         """
+        mesh, array, _, mask = self._reduction_cells(where, valid_only, subregion)
+        where = True if mask is None else mask[..., np.newaxis]
+
         if direction is None:
             if cumulative:
                 raise ValueError(
                     "A cumulative integral can only computed along one direction."
                 )
-            sum_ = np.sum(self.array, axis=tuple(range(self.mesh.region.ndim)))
-            return sum_ * self.mesh.dV
+            sum_ = np.sum(array, axis=tuple(range(mesh.region.ndim)), where=where)
+            return sum_ * mesh.dV
         elif not isinstance(direction, str):
             raise TypeError("'direction' must be of type str.")
 
-        axis = self.mesh.region._dim2index(direction)
+        axis = mesh.region._dim2index(direction)
 
         if cumulative:
+            if mask is not None:
+                array = np.where(where, array, 0)
             # Sum all cell values up to (excuding) point x and add half the cell value
             # of the cell containing point x then multiply by the cell size.
-            tmp_array = self.array / 2
-            ndim = self.mesh.region.ndim
+            tmp_array = array / 2
+            ndim = mesh.region.ndim
             left_cells = dfu.assemble_index(slice(None), ndim, {axis: slice(None, -1)})
             right_cells = dfu.assemble_index(slice(None), ndim, {axis: slice(1, None)})
-            tmp_array[right_cells] += np.cumsum(self.array, axis=axis)[left_cells]
-            res_array = tmp_array * self.mesh.cell[axis]
+            tmp_array[right_cells] += np.cumsum(array, axis=axis)[left_cells]
+            res_array = tmp_array * mesh.cell[axis]
         else:
-            res_array = np.sum(self.array, axis=axis) * self.mesh.cell[axis]
+            res_array = np.sum(array, axis=axis, where=where) * mesh.cell[axis]
 
-        if self.mesh.region.ndim == 1 and not cumulative:
+        if mesh.region.ndim == 1 and not cumulative:
             # no 0-dimensional region and mesh
             return res_array
 
-        mesh = self.mesh if cumulative else self.mesh.sel(direction)
-        return self.__class__(
-            mesh,
-            nvdim=self.nvdim,
-            value=res_array,
-            vdims=self.vdims,
-            vdim_mapping=self.vdim_mapping,
+        mesh = mesh if cumulative else mesh.sel(direction)
+        return self._from_array(
+            mesh, res_array, vdims=self.vdims, vdim_mapping=self.vdim_mapping
         )
 
     def line(self, p1, p2, n=100):
@@ -2915,8 +4183,8 @@ class Field(_FieldIO):
         >>> line = field.line(p1=(0, 0, 0), p2=(2, 0, 0), n=5)
 
         """
-        points = list(self.mesh.line(p1=p1, p2=p2, n=n))
-        values = [self(p) for p in points]
+        points = np.array(list(self.mesh.line(p1=p1, p2=p2, n=n))).reshape(n, -1)
+        values = self(points)
 
         return df.Line(
             points=points,
@@ -3012,33 +4280,41 @@ class Field(_FieldIO):
         slices = dfu.assemble_index(
             slice(None), self.mesh.region.ndim + 1, {dim_index: sel_index}
         )
-        array = self.array[slices]
+        array = self._array[slices]
 
-        valid = self.valid[slices[:-1]]
+        valid = None if self._valid is None else self._valid[slices[:-1]]
 
         try:
             mesh = self.mesh.sel(*args, **kwargs)
         except ValueError as e:
             if "p1 and p2 must not be empty" not in str(e):
                 raise
-            return array  # 1 dim case
+            return self.array[slices]  # 1 dim case, see array for copy on write
         else:  # n dim case
-            return self.__class__(
+            field = self._from_array(
                 mesh,
-                nvdim=self.nvdim,
-                value=array,
+                array,
                 vdims=self.vdims,
                 unit=self.unit,
                 valid=valid,
                 vdim_mapping=self.vdim_mapping,
             )
+            field._version = self._version  # view into self.array
+            field._diff_accuracy = self._diff_accuracy
+            field._diff_method = self._diff_method
+            field._diff_bc = self._diff_bc
+            return field
 
-    def resample(self, n):
+    def resample(self, n, method="nearest"):
         """Resample field.
 
         This method computes the field on a new mesh with ``n`` cells. The boundaries
         ``pmin`` and ``pmax`` stay unchanged. The values of the new cells are taken from
-        the nearest old cell, no interpolation is performed.
+        the nearest old cell by default, no interpolation is performed. Alternatively,
+        linear interpolation or a conservative (volume-weighted) average can be used.
+        Internally, ``discretisedfield.Remapper`` is used, which caches the
+        remapping weights, so that resampling many fields defined on the same mesh is
+        fast.
 
         Parameters
         ----------
@@ -3047,6 +4323,12 @@ class Field(_FieldIO):
             Number of cells in each direction. The number of elements must match
             field.mesh.region.ndim.
 
+        method : str, optional
+
+            Resampling method, one of ``'nearest'``, ``'linear'``, or
+            ``'conservative'``. Please refer to ``discretisedfield.Remapper`` for
+            details. Defaults to ``'nearest'``.
+
         Returns
         -------
         discretisedfield.Field
@@ -3085,18 +4367,22 @@ class Field(_FieldIO):
         >>> up_sampled.mesh.n
         array([10, 15, 20])
 
+        3. Average the values of the old cells.
+
+        >>> import discretisedfield as df
+        ...
+        >>> mesh = df.Mesh(p1=0, p2=4, n=4)
+        >>> f = df.Field(mesh, nvdim=1, value=lambda p: p)
+        >>> f.array[..., 0]
+        array([0.5, 1.5, 2.5, 3.5])
+        >>> f.resample(2, method='conservative').array[..., 0]
+        array([1., 3.])
+
+        .. seealso:: :py:class:`~discretisedfield.Remapper`
+
         """
         mesh = df.Mesh(region=self.mesh.region, n=n)
-        return self.__class__(
-            mesh,
-            nvdim=self.nvdim,
-            value=self,
-            vdims=self.vdims,
-            unit=self.unit,
-            dtype=self.dtype,
-            valid=self.__class__(self.mesh, nvdim=1, value=self.valid, dtype=bool),
-            vdim_mapping=self.vdim_mapping,
-        )
+        return df.Remapper(self.mesh, mesh, method=method)(self)
 
     def __getitem__(self, item):
         """Extracts the field on a subregion.
@@ -3106,7 +4392,9 @@ class Field(_FieldIO):
         ``subregions[item]``. Alternatively, a ``discretisedfield.Region``
         object can be passed and a minimum-sized field containing it will be
         returned. The resulting mesh has the same discretisation cell as the
-        original field's mesh.
+        original field's mesh. For subregions defined cell by cell with
+        :py:func:`~discretisedfield.Mesh.set_subregion_labels` the field is defined
+        on the bounding box and the cells outside the subregion are invalid.
 
         Parameters
         ----------
@@ -3174,16 +4462,25 @@ class Field(_FieldIO):
             submesh.index2point((0,) * submesh.region.ndim)
         )
         index_max = np.add(index_min, submesh.n)
-        slices = [slice(i, j) for i, j in zip(index_min, index_max)]
-        return self.__class__(
+        slices = tuple(slice(i, j) for i, j in zip(index_min, index_max))
+        valid = None if self._valid is None else self._valid[slices]
+        # cells of the bounding box outside a subregion defined with labels are invalid
+        labelled = self.mesh._subregion_mask(item, slices)
+        if labelled is not None:
+            valid = labelled if valid is None else valid & labelled
+        field = self._from_array(
             submesh,
-            nvdim=self.nvdim,
-            value=self.array[tuple(slices)],
+            self._array[slices],
             vdims=self.vdims,
             unit=self.unit,
-            valid=self.valid[tuple(slices)],
+            valid=valid,
             vdim_mapping=self.vdim_mapping,
         )
+        field._version = self._version  # view into self.array
+        field._diff_accuracy = self._diff_accuracy
+        field._diff_method = self._diff_method
+        field._diff_bc = self._diff_bc
+        return field
 
     def angle(self, vector):
         r"""Angle between two vectors.
@@ -3233,10 +4530,10 @@ class Field(_FieldIO):
         array([1.57079633])
 
         """
-        valid = self.valid
+        valid = self._valid
         if isinstance(vector, self.__class__):
             self._check_same_mesh_and_field_dim(vector)
-            valid = np.logical_and(valid, vector.valid)
+            valid = _and_valid(valid, vector._valid)
         elif (self.nvdim == 1 and isinstance(vector, numbers.Complex)) or isinstance(
             vector, (tuple, list, np.ndarray)
         ):
@@ -3248,10 +4545,10 @@ class Field(_FieldIO):
             )
             raise TypeError(msg)
 
-        angle_array = np.arccos((self.dot(vector) / (self.norm * vector.norm)).array)
-        return self.__class__(
-            self.mesh, nvdim=1, value=angle_array, unit="rad", valid=valid
-        )
+        if valid is self._valid:
+            valid = _copy_valid(valid)
+        angle_array = np.arccos((self.dot(vector) / (self.norm * vector.norm))._array)
+        return self._from_array(self.mesh, angle_array, unit="rad", valid=valid)
 
     def rotate90(self, ax1, ax2, k=1, reference_point=None, inplace=False):
         """Rotate field and underlying mesh by 90°.
@@ -3335,8 +4632,11 @@ class Field(_FieldIO):
 
         idx1 = self.mesh.region._dim2index(ax1)
         idx2 = self.mesh.region._dim2index(ax2)
-        value = np.rot90(self.array.copy(), k=k, axes=(idx1, idx2))
-        valid = np.rot90(self.valid.copy(), k=k, axes=(idx1, idx2))
+        value = np.rot90(self._array.copy(), k=k, axes=(idx1, idx2))
+        if self._valid is None:
+            valid = None
+        else:
+            valid = np.rot90(self._valid.copy(), k=k, axes=(idx1, idx2))
 
         if self.nvdim > 1:
             # rotate the vector, i.e. the relevant in-plane components
@@ -3362,10 +4662,9 @@ class Field(_FieldIO):
             self.valid = valid
             return self
         else:
-            return self.__class__(
+            return self._from_array(
                 mesh,
-                nvdim=self.nvdim,
-                value=value,
+                value,
                 vdims=self.vdims,
                 dtype=self.dtype,
                 unit=self.unit,
@@ -3433,7 +4732,7 @@ class Field(_FieldIO):
 
         cell_data = rgrid.GetCellData()
         field_norm = vns.numpy_to_vtk(
-            self.norm.array.transpose((2, 1, 0, 3)).reshape(-1)
+            self.norm._array.transpose((2, 1, 0, 3)).reshape(-1)
         )
         field_norm.SetName("norm")
         cell_data.AddArray(field_norm)
@@ -3442,12 +4741,12 @@ class Field(_FieldIO):
             # access to the individual field components, e.g. for colouring.
             for comp in self.vdims:
                 component_array = vns.numpy_to_vtk(
-                    getattr(self, comp).array.transpose((2, 1, 0, 3)).reshape(-1)
+                    getattr(self, comp)._array.transpose((2, 1, 0, 3)).reshape(-1)
                 )
                 component_array.SetName(f"{comp}")
                 cell_data.AddArray(component_array)
         field_array = vns.numpy_to_vtk(
-            self.array.transpose((2, 1, 0, 3)).reshape((-1, self.nvdim))
+            self._array.transpose((2, 1, 0, 3)).reshape((-1, self.nvdim))
         )
         field_array.SetName("field")
         cell_data.AddArray(field_array)
@@ -3653,7 +4952,7 @@ class Field(_FieldIO):
         # Use scipy as faster than numpy
         axes = range(self.mesh.region.ndim)
         ft = spfft.fftshift(
-            spfft.fftn(self.array, axes=axes, **kwargs),
+            spfft.fftn(self._array, axes=axes, **kwargs),
             axes=axes,
         )
 
@@ -3718,7 +5017,7 @@ class Field(_FieldIO):
 
         axes = range(self.mesh.region.ndim)
         ft = spfft.ifftn(
-            spfft.ifftshift(self.array, axes=axes),
+            spfft.ifftshift(self._array, axes=axes),
             axes=axes,
             **kwargs,
         )
@@ -3786,7 +5085,7 @@ class Field(_FieldIO):
 
         axes = range(self.mesh.region.ndim)
         ft = spfft.fftshift(
-            spfft.rfftn(self.array, axes=axes, **kwargs),
+            spfft.rfftn(self._array, axes=axes, **kwargs),
             axes=axes[:-1],
         )
 
@@ -3851,7 +5150,7 @@ class Field(_FieldIO):
 
         axes = range(self.mesh.region.ndim)
         ft = spfft.irfftn(
-            spfft.ifftshift(self.array, axes=axes[:-1]),
+            spfft.ifftshift(self._array, axes=axes[:-1]),
             axes=axes,
             s=shape,
             **kwargs,
@@ -3884,13 +5183,8 @@ class Field(_FieldIO):
                     else:
                         new_vdim_mapping[new_vdim] = f"k_{self.vdim_mapping[vdim]}"
 
-        return self.__class__(
-            mesh,
-            nvdim=self.nvdim,
-            value=array,
-            vdims=new_vdims,
-            unit=self.unit,
-            vdim_mapping=new_vdim_mapping,
+        return self._from_array(
+            mesh, array, vdims=new_vdims, unit=self.unit, vdim_mapping=new_vdim_mapping
         )
 
     @property
@@ -3899,10 +5193,10 @@ class Field(_FieldIO):
         return self.__class__(
             self.mesh,
             nvdim=self.nvdim,
-            value=self.array.real,
+            value=self._array.real,
             vdims=self.vdims,
             unit=self.unit,
-            valid=self.valid,
+            valid=_copy_valid(self._valid),
             vdim_mapping=self.vdim_mapping,
         )
 
@@ -3912,47 +5206,44 @@ class Field(_FieldIO):
         return self.__class__(
             self.mesh,
             nvdim=self.nvdim,
-            value=self.array.imag,
+            value=self._array.imag,
             vdims=self.vdims,
             unit=self.unit,
-            valid=self.valid,
+            valid=_copy_valid(self._valid),
             vdim_mapping=self.vdim_mapping,
         )
 
     @property
     def phase(self):
         """Phase of complex field."""
-        return self.__class__(
+        return self._from_array(
             self.mesh,
-            nvdim=self.nvdim,
-            value=np.angle(self.array),
+            np.angle(self._array),
             vdims=self.vdims,
-            valid=self.valid,
+            valid=_copy_valid(self._valid),
             vdim_mapping=self.vdim_mapping,
         )
 
     @property
     def abs(self):
         """Absolute value of complex field."""
-        return self.__class__(
+        return self._from_array(
             self.mesh,
-            nvdim=self.nvdim,
-            value=np.abs(self.array),
+            np.abs(self._array),
             vdims=self.vdims,
-            valid=self.valid,
+            valid=_copy_valid(self._valid),
             vdim_mapping=self.vdim_mapping,
         )
 
     @property
     def conjugate(self):
         """Complex conjugate of complex field."""
-        return self.__class__(
+        return self._from_array(
             self.mesh,
-            nvdim=self.nvdim,
-            value=self.array.conjugate(),
+            self._array.conjugate(),
             vdims=self.vdims,
             unit=self.unit,
-            valid=self.valid,
+            valid=_copy_valid(self._valid),
             vdim_mapping=self.vdim_mapping,
         )
 
@@ -3971,7 +5262,11 @@ class Field(_FieldIO):
                     raise NotImplementedError()
 
         mesh = [x.mesh for x in inputs if isinstance(x, Field)]
-        inputs = tuple(x.array if isinstance(x, Field) else x for x in inputs)
+        # ufunc.at modifies the first input in place
+        inputs = tuple(
+            (x.array if method == "at" else x._array) if isinstance(x, Field) else x
+            for x in inputs
+        )
         if out:
             kwargs["out"] = tuple(x.array for x in out)
 
@@ -3997,6 +5292,13 @@ class Field(_FieldIO):
         else:
             if not np.array_equal(result.shape[:-1], self.mesh.n):
                 raise NotImplementedError()
+            if not out and result.shape[-1] == self.nvdim:
+                return self._from_array(
+                    self.mesh,
+                    result,
+                    vdims=self.vdims,
+                    vdim_mapping=self.vdim_mapping,
+                )
             try:
                 return self.__class__(
                     self.mesh,
@@ -4008,6 +5310,41 @@ class Field(_FieldIO):
             except Exception as e:
                 raise NotImplementedError() from e
 
+    def lazy(self):
+        """Lazily evaluated field.
+
+        Operations on the returned ``discretisedfield.LazyField`` (arithmetic
+        operators, ``dot``, ``cross``, ``norm``, ``orientation``, and ``diff``) are
+        recorded and only evaluated when ``compute()`` is called. The expression is
+        evaluated in small blocks, which avoids creating full-size intermediate
+        fields.
+
+        Returns
+        -------
+        discretisedfield.LazyField
+
+            Lazy field.
+
+        Example
+        -------
+        1. Compute the norm of the sum of two fields lazily.
+
+        >>> import discretisedfield as df
+        ...
+        >>> mesh = df.Mesh(p1=(0, 0, 0), p2=(10, 10, 10), cell=(1, 1, 1))
+        >>> f1 = df.Field(mesh, nvdim=3, value=(1, 2, 0))
+        >>> f2 = df.Field(mesh, nvdim=3, value=(2, 2, 12))
+        >>> res = (f1.lazy() + f2).norm
+        >>> res
+        LazyField(norm(add(Field(...), Field(...))))
+        >>> res.compute().mean()
+        array([13.])
+
+        .. seealso:: :py:func:`~discretisedfield.LazyField`
+
+        """
+        return df.LazyField(self)
+
     def to_xarray(self, name="field", unit=None):
         """Field value as ``xarray.DataArray``.
 
@@ -4276,17 +5613,17 @@ class Field(_FieldIO):
         )
 
     @functools.singledispatchmethod
-    def _as_array(self, val, mesh, nvdim, dtype):
+    def _as_array(self, val, mesh, nvdim, dtype, **kwargs):
         raise TypeError(f"Unsupported type {type(val)}.")
 
     # to avoid str being interpreted as iterable
     @_as_array.register(str)
-    def _(self, val, mesh, nvdim, dtype):
+    def _(self, val, mesh, nvdim, dtype, **kwargs):
         raise TypeError(f"Unsupported type {type(val)}.")
 
     @_as_array.register(numbers.Complex)
     @_as_array.register(collections.abc.Iterable)
-    def _(self, val, mesh, nvdim, dtype):
+    def _(self, val, mesh, nvdim, dtype, **kwargs):
         if isinstance(val, numbers.Complex) and nvdim > 1 and val != 0:
             raise ValueError(
                 f"Wrong dimension 1 provided for value; expected dimension is {nvdim}"
@@ -4304,50 +5641,93 @@ class Field(_FieldIO):
         return np.full((*mesh.n, nvdim), val, dtype=dtype)
 
     @_as_array.register(collections.abc.Callable)
-    def _(self, val, mesh, nvdim, dtype):
+    def _(self, val, mesh, nvdim, dtype, vectorized=None, workers=None, **kwargs):
         # will only be called on user input
         # dtype must be specified by the user for complex values
         array = np.empty((*mesh.n, nvdim), dtype=dtype)
-        for index, point in zip(mesh.indices, mesh):
-            # Conversion to array and reshaping is required for numpy >= 1.24
-            # and for certain inputs, e.g. a tuple of numpy arrays which can e.g. occur
-            # for 1d vector fields.
-            array[index] = np.asarray(val(point)).reshape(nvdim)
+        if vectorized is None:
+            vectorized = _accepts_arrays(val, mesh, nvdim, array.dtype)
+        if vectorized:
+            _evaluate_in_slabs(val, mesh, nvdim, array)
+            return array
+        if workers is not None and workers > 1:
+            _evaluate_in_processes(val, mesh, nvdim, array, workers)
+            return array
+
+        for index in mesh._index_blocks(_CALLABLE_CHUNK_SIZE):
+            values = np.empty((len(index), nvdim), dtype=array.dtype)
+            for i, point in enumerate(mesh.index2point(index)):
+                # Conversion to array and reshaping is required for numpy >= 1.24
+                # and for certain inputs, e.g. a tuple of numpy arrays which can e.g.
+                # occur for 1d vector fields.
+                values[i] = np.asarray(val(point)).reshape(nvdim)
+            array[tuple(index.T)] = values
         return array
 
     @_as_array.register(dict)
-    def _(self, val, mesh, nvdim, dtype):
+    def _(self, val, mesh, nvdim, dtype, **kwargs):
         # will only be called on user input
         # dtype must be specified by the user for complex values
         dtype = dtype or np.float64
-        fill_value = (
-            val["default"]
-            if "default" in val and not callable(val["default"])
-            else np.nan
-        )
-        array = np.full((*mesh.n, nvdim), fill_value, dtype=dtype)
-
-        for subregion in reversed(mesh.subregions.keys()):
-            # subregions can overlap, first subregion takes precedence
-            try:
-                submesh = mesh[subregion]
-                subval = val[subregion]
-            except KeyError:
-                continue  # subregion not in val when implicitly set via "default"
+        # subregions can overlap, first subregion takes precedence
+        names = list(mesh.subregions)
+        labels = mesh.subregion_labels
+        if not mesh._defined_by_labels and not all(name in val for name in names):
+            # subregions not in val (implicitly set via "default") do not take
+            # precedence
+            names = [name for name in names if name in val]
+            labels = mesh._box_labels([mesh.subregions[name] for name in names])
+
+        # constant values are assigned with a lookup table of the labels, other
+        # values are computed on the subregion mesh and assigned using a mask
+        table = np.zeros((len(names) + 1, nvdim), dtype=dtype)
+        in_val = np.zeros(len(names) + 1, dtype=bool)
+        others = []
+        for label, name in enumerate(names, start=1):
+            if name not in val:
+                continue
+            in_val[label] = True
+            subval = val[name]
+            if _is_constant(subval, nvdim):
+                table[label] = subval
             else:
-                slices = mesh.region2slices(submesh.region)
-                array[slices] = self._as_array(subval, submesh, nvdim, dtype)
-
-        if np.any(np.isnan(array)):
-            # not all subregion keys specified and 'default' is missing or callable
-            if "default" not in val:
-                raise KeyError(
-                    "Key 'default' required if not all subregion keys are specified."
-                )
-            subval = val["default"]
-            for idx in np.argwhere(np.isnan(array[..., 0])):
-                # only spatial indices required -> array[..., 0]
-                # conversion to array and reshaping similar to "callable" implementation
+                others.append((label, name, subval))
+
+        array = table[labels]
+        for label, name, subval in others:
+            submesh = mesh[name]
+            slices = mesh.region2slices(submesh.region)
+            mask = labels[slices] == label
+            values = self._as_array(subval, submesh, nvdim, dtype, **kwargs)
+            array[slices][mask] = values[mask]
+
+        # cells that are covered by a subregion with a value in val
+        covered = in_val[labels]
+        if covered.all():
+            return array
+        # not all subregion keys specified or subregions do not cover the region
+        if "default" not in val:
+            raise KeyError(
+                "Key 'default' required if not all subregion keys are specified."
+            )
+        subval = val["default"]
+        if _is_constant(subval, nvdim):
+            array[~covered] = subval
+            return array
+        missing = np.nonzero(~covered)
+        if not callable(subval):
+            array[missing] = self._as_array(subval, mesh, nvdim, dtype)[missing]
+            return array
+
+        vectorized = kwargs.get("vectorized")
+        if vectorized is None:
+            vectorized = _accepts_arrays(subval, mesh, nvdim, dtype, gathered=True)
+        if vectorized:
+            _evaluate_at_indices(subval, mesh, nvdim, array, missing)
+        else:
+            for idx in zip(*missing):
+                # conversion to array and reshaping similar to "callable"
+                # implementation
                 array[idx] = np.asarray(subval(mesh.index2point(idx))).reshape(nvdim)
 
         return array
@@ -4355,22 +5735,549 @@ class Field(_FieldIO):
 
 # We cannot register to self (or df.Field) inside the class
 @Field._as_array.register(Field)
-def _(self, val, mesh, nvdim, dtype):
+def _(self, val, mesh, nvdim, dtype, **kwargs):
     if mesh.region not in val.mesh.region:
         raise ValueError(
             f"{val.mesh.region} of the provided field does not "
             f"contain {mesh.region} of the field that is being "
             "created."
         )
-    value = (
-        val.to_xarray()
-        .sel(
-            **{dim: getattr(mesh.cells, dim) for dim in mesh.region.dims},
-            method="nearest",
+    # nearest neighbour, the remapping indices are cached for repeated use
+    return df.Remapper(val.mesh, mesh, method="nearest")._remap(val._array)
+
+
+def _copy_valid(valid):
+    """Copy of a valid array (``None`` means that all values are valid).
+
+    The results of operations must not share the valid array with the operands,
+    otherwise modifying ``result.valid`` in place would change the operands.
+    """
+    return None if valid is None else valid.copy()
+
+
+def _and_valid(valid1, valid2):
+    """Combine two valid arrays, where ``None`` means that all values are valid.
+
+    The result never shares memory with the arguments.
+    """
+    if valid1 is None:
+        return _copy_valid(valid2)
+    if valid2 is None:
+        return _copy_valid(valid1)
+    return np.logical_and(valid1, valid2)
+
+
+def _cross(a, b, out):
+    """Cross product of the arrays ``a`` and ``b`` (last axis) written into ``out``.
+
+    The components are computed one after the other, so that only a temporary array
+    of the size of one component is required (instead of the whole result of
+    ``np.cross``).
+    """
+    dtype = np.result_type(a, b)
+    if (
+        np.may_share_memory(out, a)
+        or np.may_share_memory(out, b)
+        or (out.dtype != dtype)
+    ):
+        # the operands would be overwritten or the result must be cast
+        out[...] = np.cross(a, b)
+        return
+    tmp = np.empty(out.shape[:-1], dtype=dtype)
+    for i in range(3):
+        j, k = (i + 1) % 3, (i + 2) % 3
+        np.multiply(a[..., j], b[..., k], out=out[..., i])
+        np.multiply(a[..., k], b[..., j], out=tmp)
+        np.subtract(out[..., i], tmp, out=out[..., i])
+
+
+def _masked_reduce(reduction, array, axis, mask):
+    """Reduce ``array`` over the spatial ``axis`` using the cells where ``mask`` is
+    ``True`` (all cells if ``mask`` is ``None``).
+
+    Returns the result and the number of cells that have been reduced (``None`` if
+    ``mask`` is ``None``). The mask is passed to the numpy reductions as ``where``,
+    i.e. no masked copy of the array is created.
+    """
+    if mask is None:
+        return getattr(np, reduction)(array, axis=axis), None
+
+    where = mask[..., np.newaxis]
+    count = np.count_nonzero(mask, axis=axis)[..., np.newaxis]
+    if reduction in ("min", "max"):
+        res = getattr(np, reduction)(
+            array, axis=axis, where=where, initial=_initial(array.dtype, reduction)
+        )
+        return res, count[..., 0]
+
+    res = np.sum(array, axis=axis, where=where)
+    if reduction == "mean":
+        # the mean of zero cells is nan
+        with np.errstate(invalid="ignore", divide="ignore"):
+            res = res / count
+    return res, count[..., 0]
+
+
+def _initial(dtype, reduction):
+    """Identity of ``np.min`` or ``np.max`` required for reductions with ``where``."""
+    if np.issubdtype(dtype, np.integer):
+        info = np.iinfo(dtype)
+        return info.max if reduction == "min" else info.min
+    return np.inf if reduction == "min" else -np.inf
+
+
+def _accumulated_stats(array, valid, mask, axis, moments_only=False):
+    """Statistics of ``array`` over the spatial ``axis`` computed in chunks.
+
+    The chunks consist of whole (contiguous) layers along the first direction. If the
+    first direction is reduced, the statistics of the chunks are combined, otherwise
+    every chunk gives the statistics of a part of the result. Hence, no temporary
+    arrays larger than a chunk are created. Returns the dictionary of
+    ``_StatsAccumulator.result`` and the number of included cells.
+    """
+    layer_size = array.size // array.shape[-1] // array.shape[0]
+    step = max(1, _REDUCTION_CHUNK_SIZE // max(layer_size, 1))
+    accumulators = []
+    for start in range(0, array.shape[0], step):
+        if 0 not in axis or not accumulators:
+            accumulators.append(_StatsAccumulator(axis, moments_only))
+        index = slice(start, start + step)
+        accumulators[-1].update(
+            array[index],
+            None if valid is None else valid[index],
+            None if mask is None else mask[index],
+        )
+
+    if 0 in axis:
+        (accumulator,) = accumulators
+        return accumulator.result(), accumulator.count
+    results = [accumulator.result() for accumulator in accumulators]
+    stats = {key: np.concatenate([res[key] for res in results]) for key in results[0]}
+    return stats, np.concatenate([accumulator.count for accumulator in accumulators])
+
+
+class _StatsAccumulator:
+    """Streaming accumulator of the statistics computed in ``Field.stats``.
+
+    The chunks passed to ``update`` are reduced over the spatial ``axis`` and combined
+    with the statistics of the previous chunks. Mean and variance are combined using
+    the parallel variant of Welford's algorithm (Chan et al.), which is numerically
+    stable, i.e. the chunks can come from arbitrary (e.g. out-of-core) sources. If
+    ``moments_only`` is ``True``, only mean and standard deviation are computed.
+    """
+
+    def __init__(self, axis, moments_only=False):
+        self.axis = tuple(axis)
+        self.moments_only = moments_only
+        self.count = None
+
+    def update(self, array, valid, mask):
+        """Add a chunk with shape ``(..., nvdim)`` and (optional) valid and mask
+        arrays."""
+        if len(self.axis) == array.ndim - 1:
+            # Reductions along the contiguous last axis of a transposed copy are much
+            # faster than along the first axis of an array with shape (n, nvdim).
+            array = np.ascontiguousarray(array.reshape(-1, array.shape[-1]).T)
+            valid = None if valid is None else valid.ravel()
+            if mask is not None:
+                mask = mask.ravel()
+                array = array[:, mask]
+                valid = None if valid is None else valid[mask]
+                mask = None
+            axis, spatial_axis, vdim_axis = (1,), (0,), 0
+        else:
+            axis = spatial_axis = self.axis
+            vdim_axis = -1
+
+        if mask is None:
+            spatial_shape = np.delete(array.shape, vdim_axis)
+            count = np.full(
+                np.delete(spatial_shape, spatial_axis),
+                np.prod(spatial_shape[list(spatial_axis)]),
+            )
+            where = True
+        else:
+            count = np.count_nonzero(mask, axis=spatial_axis)
+            where = np.expand_dims(mask, vdim_axis)
+        if valid is None:
+            valid_count = count
+        else:
+            valid_count = np.count_nonzero(
+                valid if mask is None else valid & mask, axis=spatial_axis
+            )
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.sum(array, axis=axis, where=where) / count[..., np.newaxis]
+        # zero instead of nan for no cells, so that the chunk can be combined
+        mean = np.where(count[..., np.newaxis] > 0, mean, 0)
+        m2 = np.sum(_abs2(array - np.expand_dims(mean, axis)), axis=axis, where=where)
+        if self.moments_only:
+            min_ = max_ = norm_sum = None
+        else:
+            min_, max_, norm_sum = self._extrema_norm(
+                array, axis, where, mask, spatial_axis, vdim_axis
+            )
+
+        if self.count is None:
+            self.count, self.valid_count = count, valid_count
+            self.mean, self.m2, self.min, self.max = mean, m2, min_, max_
+            self.norm_sum = norm_sum
+            return
+
+        # combine with the previous chunks
+        total = self.count + count
+        with np.errstate(invalid="ignore", divide="ignore"):
+            weight = np.where(total > 0, count / total, 0)
+        delta = mean - self.mean
+        self.m2 = self.m2 + m2 + _abs2(delta) * (self.count * weight)[..., np.newaxis]
+        self.mean = self.mean + delta * weight[..., np.newaxis]
+        self.count = total
+        self.valid_count = self.valid_count + valid_count
+        if not self.moments_only:
+            self.min = np.minimum(self.min, min_)
+            self.max = np.maximum(self.max, max_)
+            self.norm_sum = self.norm_sum + norm_sum
+
+    @staticmethod
+    def _extrema_norm(array, axis, where, mask, spatial_axis, vdim_axis):
+        """Minimum, maximum, and sum of the norm of a chunk."""
+        min_ = np.min(
+            array, axis=axis, where=where, initial=_initial(array.dtype, "min")
+        )
+        max_ = np.max(
+            array, axis=axis, where=where, initial=_initial(array.dtype, "max")
+        )
+        norm = np.sqrt(np.sum(_abs2(array), axis=vdim_axis))
+        norm_sum = np.sum(norm, axis=spatial_axis, where=True if mask is None else mask)
+        return min_, max_, norm_sum
+
+    def result(self):
+        """Dictionary of the statistics of all chunks (``nan`` if there are no
+        cells)."""
+        count = self.count
+        with np.errstate(invalid="ignore", divide="ignore"):
+            res = {
+                "mean": np.where(count[..., np.newaxis] > 0, self.mean, np.nan),
+                "std": np.sqrt(self.m2 / count[..., np.newaxis]),
+            }
+            if not self.moments_only:
+                res["min"] = self.min
+                res["max"] = self.max
+                res["mean_norm"] = self.norm_sum / count
+                res["valid_fraction"] = self.valid_count / count
+        return res
+
+
+def _abs2(array):
+    """Squared absolute value."""
+    if np.iscomplexobj(array):
+        return array.real**2 + array.imag**2
+    return np.square(array)
+
+
+class _Interpolator:
+    """Interpolator of all components of a field array, used by ``Field.interp``.
+
+    Invalid cells are filled with the value of the nearest valid cell. For
+    ``method='nearest'`` the value of the cell containing the point is used, otherwise
+    the values are interpolated between the cell midpoints of all directions with more
+    than one cell, using ``RegularGridInterpolator`` (``'linear'``) or a cubic
+    not-a-knot tensor-product spline (``'cubic'``).
+    """
+
+    def __init__(self, mesh, array, valid, method):
+        if valid is not None and not valid.all():
+            if not valid.any():
+                raise ValueError("Cannot interpolate a field without valid cells.")
+            indices = ndimage.distance_transform_edt(
+                ~valid, sampling=mesh.cell, return_distances=False, return_indices=True
+            )
+            array = array[tuple(indices)]
+        self.mesh = mesh
+        self.method = method
+        nvdim = array.shape[-1]
+
+        if method == "nearest":
+            self.values = np.ascontiguousarray(array).reshape(-1, nvdim)
+            self.interpolator = None
+            return
+
+        self.axes = [i for i, n in enumerate(mesh.n) if n > 1]
+        if method == "cubic" and any(mesh.n[i] < 4 for i in self.axes):
+            raise ValueError(
+                f"Cubic interpolation requires at least 4 cells in all directions"
+                f" with more than one cell, not {mesh.n=}."
+            )
+        values = array[
+            tuple(slice(None) if i in self.axes else 0 for i in range(len(mesh.n)))
+        ]
+        if not np.issubdtype(values.dtype, np.inexact):
+            values = values.astype(np.float64)
+        self.values = values
+        self.lower = (mesh.region.pmin + mesh.cell / 2)[self.axes]
+        self.upper = (mesh.region.pmax - mesh.cell / 2)[self.axes]
+        grid = [mesh.cells[i] for i in self.axes]
+        if not self.axes:
+            self.interpolator = None
+        elif method == "linear":
+            self.interpolator = RegularGridInterpolator(grid, values)
+        else:
+            # NdBSpline is only available in scipy>=1.12, i.e. it is only imported if
+            # cubic interpolation is used.
+            try:
+                from scipy.interpolate import NdBSpline
+            except ImportError as e:
+                raise ImportError(
+                    "Interpolation with method='cubic' requires scipy>=1.12."
+                ) from e
+            # The tensor-product spline is computed one direction at a time with a
+            # banded solver, which is exact and much faster than the iterative solver
+            # used by RegularGridInterpolator(method='cubic').
+            coefficients = values
+            knots = []
+            for axis, coordinates in enumerate(grid):
+                spline = make_interp_spline(coordinates, coefficients, k=3, axis=axis)
+                coefficients = np.moveaxis(spline.c, 0, axis)
+                knots.append(spline.t)
+            self.interpolator = NdBSpline(tuple(knots), coefficients, 3)
+
+    @property
+    def nbytes(self):
+        if self.method == "cubic" and self.interpolator is not None:
+            return self.values.nbytes + self.interpolator.c.nbytes
+        return self.values.nbytes
+
+    def __call__(self, points, workers=None):
+        if workers is None or workers <= 1 or len(points) <= 1:
+            return self._evaluate(points)
+        chunks = np.array_split(points, min(len(points), 4 * workers))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            return np.concatenate(list(executor.map(self._evaluate, chunks)))
+
+    def _evaluate(self, points):
+        if self.method == "nearest":
+            index = self.mesh.point2index(points)
+            flat = np.ravel_multi_index(tuple(index.T), self.mesh.n)
+            return np.take(self.values, flat, axis=0)
+        if self.interpolator is None:  # a single cell
+            return np.repeat(self.values.reshape(1, -1), len(points), axis=0)
+        return self.interpolator(np.clip(points[:, self.axes], self.lower, self.upper))
+
+
+def _is_constant(value, nvdim):
+    """Whether ``value`` is a number or a vector with ``nvdim`` elements, i.e. the
+    same value for all cells (numbers are only allowed for ``nvdim=1`` or zero)."""
+    if isinstance(value, numbers.Complex):
+        return nvdim == 1 or value == 0
+    return isinstance(value, (tuple, list, np.ndarray)) and np.shape(value) == (nvdim,)
+
+
+def _array_without_copy(value, shape, nvdim, dtype):
+    """Return ``value`` or a view of it if it can be used as field array, else None."""
+    if not isinstance(value, np.ndarray):
+        return None
+    # same dtype as in _as_array for array_like values
+    if value.dtype != (dtype or max(value.dtype, np.float64)):
+        return None
+    if value.shape == (*shape, nvdim):
+        return value
+    if nvdim == 1 and value.shape == tuple(shape):
+        return value[..., np.newaxis]
+    return None
+
+
+def _broadcast_values(values, shape, nvdim):
+    """Broadcast the result of a vectorized callable to ``(*shape, nvdim)``.
+
+    ``values`` can either be a sequence of ``nvdim`` components, each of which can be
+    broadcast to ``shape``, or a single array that can be broadcast to ``(*shape,
+    nvdim)``. For scalar fields an array that can be broadcast to ``shape`` is
+    accepted as well.
+    """
+    shape = tuple(shape)
+    if isinstance(values, (tuple, list)):
+        if len(values) != nvdim:
+            raise ValueError(
+                f"Wrong number of components {len(values)}; expected {nvdim=}."
+            )
+        return np.stack([np.broadcast_to(v, shape) for v in values], axis=-1)
+
+    values = np.asarray(values)
+    if nvdim == 1 and values.ndim <= len(shape):
+        return np.broadcast_to(values, shape)[..., np.newaxis]
+    if values.ndim == len(shape) + 1 and values.shape[0] == nvdim != values.shape[-1]:
+        # components along the first axis, e.g. ``np.array([x, y, z])``
+        values = np.moveaxis(values, 0, -1)
+    return np.broadcast_to(values, (*shape, nvdim))
+
+
+def _cell_coordinates(mesh):
+    """Cell midpoints along every spatial direction as one-dimensional arrays.
+
+    ``Mesh.coordinate_arrays`` uses the same arithmetic as ``Mesh.index2point`` so
+    that vectorized and per-cell evaluation of callables see identical coordinates.
+    """
+    return [c.ravel() for c in mesh.coordinate_arrays()]
+
+
+def _accepts_arrays(func, mesh, nvdim, dtype, gathered=False):
+    """Test whether ``func`` can be evaluated for many points at once.
+
+    ``func`` is called with the coordinates of a few cells spread over the whole mesh
+    and the result is compared to calling ``func`` for every one of these cells
+    individually. The coordinates are passed in the same layout that is later used
+    for the evaluation: a small grid in ``numpy.ogrid`` layout or, if ``gathered`` is
+    ``True``, one-dimensional arrays of coordinates. Any exception or warning raised
+    during the vectorized call, or any difference in the results, means that the
+    callable has to be evaluated cell by cell.
+    """
+    coordinates = _cell_coordinates(mesh)
+    if gathered:
+        size = mesh.n.prod()
+        n_probe = min(size, _CALLABLE_PROBE_SIZE)
+        if n_probe == nvdim and n_probe < size:
+            # avoid ambiguous (nvdim, n_probe) results
+            n_probe += 1
+        flat = np.linspace(0, size - 1, n_probe).round().astype(int)
+        indices = np.unravel_index(flat, mesh.n)
+        points = tuple(c[i] for c, i in zip(coordinates, indices))
+        shape = (n_probe,)
+        cells = zip(*indices)
+    else:
+        # two cells per direction; three for nvdim=2 to avoid ambiguous results
+        per_direction = 3 if nvdim == 2 else 2
+        indices = [
+            np.unique(np.linspace(0, n - 1, per_direction).round().astype(int))
+            for n in mesh.n
+        ]
+        points = np.ix_(*(c[i] for c, i in zip(coordinates, indices)))
+        shape = tuple(len(i) for i in indices)
+        cells = itertools.product(*indices)
+
+    expected = np.empty((*shape, nvdim), dtype=dtype).reshape(-1, nvdim)
+    for i, index in enumerate(cells):
+        expected[i] = np.asarray(func(mesh.index2point(index))).reshape(nvdim)
+    expected = expected.reshape(*shape, nvdim)
+
+    result = np.empty_like(expected)
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            result[...] = _broadcast_values(func(points), shape, nvdim)
+    except Exception as e:
+        log.debug("Evaluating %r cell by cell: %r", func, e)
+        return False
+
+    if np.issubdtype(dtype, np.inexact):
+        accepted = np.allclose(result, expected, rtol=1e-12, atol=0, equal_nan=True)
+    else:
+        accepted = np.array_equal(result, expected)
+    if not accepted:
+        log.debug("Evaluating %r cell by cell: vectorized results differ.", func)
+    return accepted
+
+
+def _evaluate_in_slabs(func, mesh, nvdim, array):
+    """Evaluate a vectorized callable for all cells and write the result to ``array``.
+
+    The mesh is split into slabs along the first spatial direction, each containing
+    at most ``_CALLABLE_CHUNK_SIZE`` cells (but at least one layer of cells).
+    """
+    coordinates = mesh.coordinate_arrays()
+    layer_size = mesh.n[1:].prod()
+    step = max(1, _CALLABLE_CHUNK_SIZE // layer_size)
+    for start in range(0, mesh.n[0], step):
+        stop = min(start + step, mesh.n[0])
+        tic = time.perf_counter()
+        points = (coordinates[0][start:stop], *coordinates[1:])
+        array[start:stop] = _broadcast_values(
+            func(points), (stop - start, *mesh.n[1:]), nvdim
+        )
+        log.debug(
+            "Evaluated %r for cells %d:%d along %s in %.3g s.",
+            func,
+            start,
+            stop,
+            mesh.region.dims[0],
+            time.perf_counter() - tic,
         )
-        .data
+
+
+def _evaluate_at_indices(func, mesh, nvdim, array, indices):
+    """Evaluate a vectorized callable for the cells with the given (flat) indices.
+
+    ``indices`` is a tuple of integer arrays as returned by ``numpy.nonzero``. The
+    callable receives one-dimensional arrays of gathered coordinates, at most
+    ``_CALLABLE_CHUNK_SIZE`` cells at a time.
+    """
+    coordinates = _cell_coordinates(mesh)
+    size = len(indices[0])
+    for start in range(0, size, _CALLABLE_CHUNK_SIZE):
+        stop = min(start + _CALLABLE_CHUNK_SIZE, size)
+        tic = time.perf_counter()
+        chunk = tuple(i[start:stop] for i in indices)
+        points = tuple(c[i] for c, i in zip(coordinates, chunk))
+        array[chunk] = _broadcast_values(func(points), (stop - start,), nvdim)
+        log.debug(
+            "Evaluated %r for %d cells in %.3g s.",
+            func,
+            stop - start,
+            time.perf_counter() - tic,
+        )
+
+
+def _evaluate_in_processes(func, mesh, nvdim, array, workers):
+    """Evaluate ``func`` cell by cell in a process pool and write it to ``array``.
+
+    The mesh is split into contiguous slabs along the last spatial direction. The
+    worker processes write their results directly into a shared memory buffer.
+    """
+    n_slabs = min(mesh.n[-1], 4 * workers)
+    bounds = np.linspace(0, mesh.n[-1], n_slabs + 1).round().astype(int)
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    try:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    _evaluate_slab,
+                    func,
+                    mesh,
+                    nvdim,
+                    array.dtype,
+                    shm.name,
+                    start,
+                    stop,
+                )
+                for start, stop in zip(bounds[:-1], bounds[1:])
+            ]
+            for future in concurrent.futures.as_completed(futures):
+                future.result()  # re-raises exceptions from the worker processes
+        array[...] = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _evaluate_slab(func, mesh, nvdim, dtype, shm_name, start, stop):
+    """Evaluate ``func`` for the cells ``start:stop`` along the last direction.
+
+    This function runs in a worker process of ``_evaluate_in_processes``.
+    """
+    tic = time.perf_counter()
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        array = np.ndarray((*mesh.n, nvdim), dtype=dtype, buffer=shm.buf)
+        ranges = [range(n) for n in mesh.n[:-1]]
+        for index in itertools.product(*ranges, range(start, stop)):
+            array[index] = np.asarray(func(mesh.index2point(index))).reshape(nvdim)
+        del array  # release the buffer before closing the shared memory
+    finally:
+        shm.close()
+    log.debug(
+        "Evaluated %r for cells %d:%d along %s in %.3g s.",
+        func,
+        start,
+        stop,
+        mesh.region.dims[-1],
+        time.perf_counter() - tic,
     )
-    if nvdim == 1:
-        # xarray dataarrays for scalar data are three dimensional
-        return value.reshape(*mesh.n, -1)
-    return value
@@ -8,6 +8,7 @@ and :py:func:`discretisedfield.Field.fromfile` instead.
 
 import json
 import pathlib
+import warnings
 
 import numpy as np
 
@@ -39,6 +40,12 @@ class _MeshIO(_MeshIO_HDF5):
 
     def save_subregions(self, field_filename):
         """Save subregions to json file."""
+        if self._defined_by_labels:
+            warnings.warn(
+                "Subregions defined with set_subregion_labels are saved as bounding"
+                " boxes; the labels are lost. Use HDF5 files to keep the labels.",
+                stacklevel=2,
+            )
         with pathlib.Path(self._subregion_filename(field_filename)).open(
             mode="wt", encoding="utf-8"
         ) as f:
@@ -88,7 +95,10 @@ class _FieldIO(_FieldIO_HDF5, _FieldIO_OVF, _FieldIO_VTK):
         If the extension of `filename` is ``.hdf5`` or ``.h5`` an HDF5 file will be
         written. The parameters `representation`, `extend_scalar` and `save_subregions`
         have no effect for HDF5 files and are silently ignored. Subregions are stored
-        inside the HDF5 file, if any are defined for the field.
+        inside the HDF5 file, if any are defined for the field. Only HDF5 files keep
+        subregions defined cell by cell with
+        :py:func:`~discretisedfield.Mesh.set_subregion_labels`; the json files of OVF
+        and VTK files only contain their bounding boxes (a warning is issued).
 
         Parameters
         ----------
@@ -31,6 +31,8 @@ class _MeshIO_HDF5:
         these are saved into two datasets ``subregion_names`` and ``subregions``. The
         latter contains pmin and pmax as 2*ndim vectors. The two datasets are related
         via position. If no subregions are defined, the datasets will not be created.
+        If the subregions are defined cell by cell (``set_subregion_labels``), the
+        labels are saved in an additional dataset ``subregion_labels``.
         """
         h5_region = h5_mesh.create_group("region")
         self.region._h5_save(h5_region)
@@ -47,6 +49,8 @@ class _MeshIO_HDF5:
             )
             for i, subregion in enumerate(self.subregions.values()):
                 h5_mesh_subregions[i] = [*subregion.pmin, *subregion.pmax]
+            if self._defined_by_labels:
+                h5_mesh.create_dataset("subregion_labels", data=self.subregion_labels)
 
     @classmethod
     def _h5_load(cls, h5_mesh: h5py.Group):
@@ -60,12 +64,15 @@ class _MeshIO_HDF5:
             }
         else:
             subregions = {}
-        return cls(
+        mesh = cls(
             region=region,
             n=h5_mesh.attrs["n"],
             bc=h5_mesh.attrs["bc"],
             subregions=subregions,
         )
+        if "subregion_labels" in h5_mesh:
+            mesh._set_subregions(mesh.subregions, h5_mesh["subregion_labels"][...])
+        return mesh
 
 
 class _FieldIO_HDF5:
@@ -109,7 +116,7 @@ class _FieldIO_HDF5:
 
         # empty dataset that can later contain field.array
         h5_field_data = h5_field.create_dataset(
-            "array", data_shape, dtype=self.array.dtype
+            "array", data_shape, dtype=self._array.dtype
         )
 
         h5_field.create_dataset("valid", data=self.valid, dtype=np.bool_)
@@ -124,7 +131,7 @@ class _FieldIO_HDF5:
         save a single field into a bigger dataset, e.g. a dataset meant to contain a
         time series.
         """
-        h5_field_data[location] = self.array
+        h5_field_data[location] = self._array
 
     @classmethod
     def _from_hdf5(cls, filename):
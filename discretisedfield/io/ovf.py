@@ -93,7 +93,7 @@ class _FieldIO_OVF:
             """
         ).encode("utf-8")
 
-        reordered = self.array.transpose((2, 1, 0, 3))  # ovf ordering
+        reordered = self._array.transpose((2, 1, 0, 3))  # ovf ordering
 
         bin_rep = {"bin4": ("<f", 1234567.0), "bin8": ("<d", 123456789012345.0)}
 
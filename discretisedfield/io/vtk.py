@@ -1,4 +1,5 @@
 import contextlib
+import itertools
 import pathlib
 
 import numpy as np
@@ -149,9 +150,16 @@ class _FieldIO_VTK:
                 start_index = i
                 break
 
-        # Extract data.
-        for i, line in zip(mesh.indices, lines[start_index + skip + 1 :]):
-            if not line[0].isalpha():
-                field.array[i] = list(map(float, line.split()))
+        # Extract data (first index changing fastest, same as in Mesh.indices).
+        rows = lines[start_index + skip + 1 :][: len(mesh)]
+        is_data = np.array([not line[0].isalpha() for line in rows], dtype=bool)
+        index = tuple(
+            i.ravel(order="F")[: len(rows)][is_data]
+            for i in mesh.index_arrays(sparse=False)
+        )
+        values = [
+            list(map(float, line.split())) for line in itertools.compress(rows, is_data)
+        ]
+        field.array[index] = np.reshape(values, (-1, dim))
 
         return field
@@ -0,0 +1,531 @@
+import numbers
+
+import numpy as np
+
+import discretisedfield as df
+from discretisedfield.operators import (
+    _check_accuracy,
+    _check_diff_method,
+    _diff,
+    _spectral_diff,
+)
+
+# Approximate number of cells evaluated at once by LazyField.compute. With three
+# vector components in double precision each intermediate result of a block is
+# ~1.5 MB.
+_BLOCK_SIZE = 2**16
+
+
+class LazyField:
+    r"""Lazily evaluated field expression.
+
+    A lazy field records arithmetic operations (``+``, ``-``, ``*``, ``/``), ``dot``,
+    ``cross``, ``norm``, ``orientation``, and ``diff`` instead of computing them. The
+    resulting expression is only evaluated when :py:func:`compute` is called. The
+    expression is evaluated in blocks of neighbouring cells (with additional layers
+    of cells around each block, if derivatives are required), i.e. all intermediate
+    results are only as large as a single block. Sub-expressions that are used
+    multiple times are only evaluated once per block. The result is the same as
+    computing the expression with ``discretisedfield.Field`` objects.
+
+    Lazy fields are created using :py:func:`~discretisedfield.Field.lazy`. Their
+    operands can be lazy fields, fields, or constants, and all fields must be defined
+    on the same mesh.
+
+    Parameters
+    ----------
+    field : discretisedfield.Field
+
+        Field used in the expression.
+
+    Examples
+    --------
+    1. Compute the topological charge density lazily.
+
+    >>> import discretisedfield as df
+    >>> import numpy as np
+    ...
+    >>> mesh = df.Mesh(p1=(0, 0), p2=(10, 10), cell=(1, 1))
+    >>> field = df.Field(mesh, nvdim=3, value=lambda p: (p[0], p[1], 5))
+    >>> of = field.lazy().orientation
+    >>> of.diff('x')
+    LazyField(diff(orientation(Field(...)), 'x'))
+    >>> q = of.dot(of.diff('x').cross(of.diff('y'))) / (4 * np.pi)
+    >>> res = q.compute()
+    >>> res
+    Field(...)
+    >>> of = field.orientation
+    >>> res.allclose(of.dot(of.diff('x').cross(of.diff('y'))) / (4 * np.pi))
+    True
+
+    """
+
+    def __init__(self, field):
+        if not isinstance(field, df.Field):
+            raise TypeError(f"Invalid {type(field)=}; must be of type Field.")
+        self._init(
+            field.mesh,
+            field.nvdim,
+            field.vdims,
+            field.vdim_mapping,
+            field.unit,
+            type(field),
+            operation=None,
+            args=(field,),
+        )
+
+    @classmethod
+    def _node(
+        cls, parent, nvdim, operation, args, vdims=None, vdim_mapping=None, unit=None
+    ):
+        """Create a node of the expression graph."""
+        node = object.__new__(cls)
+        node._init(
+            parent.mesh, nvdim, vdims, vdim_mapping, unit, parent._cls, operation, args
+        )
+        return node
+
+    def _init(self, mesh, nvdim, vdims, vdim_mapping, unit, cls, operation, args):
+        self._mesh = mesh
+        self._nvdim = nvdim
+        self._vdims = vdims
+        self._vdim_mapping = vdim_mapping
+        self._unit = unit
+        self._cls = cls
+        # operation is None for leaves, a string for derivatives, and a function
+        # (array, valid, *args) -> (array, valid) otherwise
+        self._operation = operation
+        self._args = args
+
+    @property
+    def mesh(self):
+        """Mesh of the resulting field."""
+        return self._mesh
+
+    @property
+    def nvdim(self):
+        """Number of value dimensions of the resulting field."""
+        return self._nvdim
+
+    def __repr__(self):
+        """Representation string.
+
+        Returns
+        -------
+        str
+
+            Representation string of the expression.
+
+        """
+        return f"LazyField({self._expression()})"
+
+    def _expression(self):
+        if self._operation is None:
+            return "Field(...)"
+        if self._operation == "diff":
+            node, direction, _, order, _, accuracy, method, bc = self._args
+            args = [node._expression(), repr(direction)]
+            if order != 1:
+                args.append(f"{order=}")
+            if method == "spectral":
+                args.append(f"{method=}")
+            elif accuracy != 2:
+                args.append(f"{accuracy=}")
+            if bc not in (None, "periodic"):
+                args.append(f"{bc=}")
+            return f"diff({', '.join(args)})"
+        args = [
+            arg._expression() if isinstance(arg, LazyField) else repr(arg)
+            for arg in self._args
+        ]
+        return f"{self._operation.__name__.strip('_')}({', '.join(args)})"
+
+    # Arithmetic operators
+    def _operand(self, other, operator):
+        """Check the second operand of a binary operator."""
+        if isinstance(other, df.Field):
+            other = other.lazy()
+        if isinstance(other, LazyField):
+            if not self.mesh.allclose(other.mesh):
+                raise ValueError(
+                    "To perform this operation both fields must have the same mesh."
+                )
+            nvdim = other.nvdim
+        elif isinstance(other, numbers.Complex):
+            return other, self.nvdim
+        elif isinstance(other, (tuple, list, np.ndarray)):
+            other = np.asarray(other)
+            shape = (*self.mesh.n, self.nvdim)
+            if not (
+                other.shape == shape or other.shape == (self.nvdim,) or self.nvdim == 1
+            ) or (other.ndim > 1 and other.shape != shape):
+                raise TypeError(
+                    f"Unsupported operand type(s) for {operator}: {type(self)} with"
+                    f" {self.nvdim} vdims and {type(other)} with shape"
+                    f" {np.shape(other)}."
+                )
+            nvdim = other.shape[-1] if other.ndim > 0 else 1
+        else:
+            raise TypeError(
+                f"Unsupported operand type(s) for {operator}: {type(self)=} and"
+                f" {type(other)=}."
+            )
+        if not (self.nvdim == nvdim or self.nvdim == 1 or nvdim == 1):
+            raise ValueError(
+                "To perform this operation both fields must have the same"
+                " number of vector components."
+            )
+        return other, max(self.nvdim, nvdim)
+
+    def _binary(self, other, function, operator):
+        other, nvdim = self._operand(other, operator)
+        return self._node(
+            self,
+            nvdim,
+            _binary_operation(function),
+            (self, other),
+            vdims=self._vdims if self.nvdim == nvdim else None,
+            vdim_mapping=self._vdim_mapping,
+        )
+
+    def __add__(self, other):
+        return self._binary(other, np.add, "+")
+
+    def __radd__(self, other):
+        return self + other
+
+    def __sub__(self, other):
+        return self._binary(other, np.subtract, "-")
+
+    def __rsub__(self, other):
+        return -self + other
+
+    def __mul__(self, other):
+        return self._binary(other, np.multiply, "*")
+
+    def __rmul__(self, other):
+        return self * other
+
+    def __truediv__(self, other):
+        return self._binary(other, np.divide, "/")
+
+    def __rtruediv__(self, other):
+        return self._binary(other, _rdivide, "/")
+
+    def __neg__(self):
+        return self._node(
+            self,
+            self.nvdim,
+            _negative,
+            (self,),
+            vdims=self._vdims,
+            vdim_mapping=self._vdim_mapping,
+        )
+
+    def __pos__(self):
+        return self
+
+    # LazyField takes precedence over numpy arrays and scalars, e.g. np.float64(2) *
+    # lazy_field calls LazyField.__rmul__.
+    __array_ufunc__ = None
+
+    # Vector operations
+    def dot(self, other):
+        """Dot product.
+
+        .. seealso:: :py:func:`~discretisedfield.Field.dot`
+
+        """
+        if not isinstance(other, (df.Field, LazyField, tuple, list, np.ndarray)):
+            raise TypeError(
+                f"Unsupported operand type(s) for dot product: {type(self)=} and"
+                f" {type(other)=}."
+            )
+        other, _ = self._operand(other, "dot product")
+        if (other.nvdim if isinstance(other, LazyField) else np.shape(other)[-1]) != (
+            self.nvdim
+        ):
+            raise ValueError(
+                "To perform this operation both fields must have the same"
+                " number of vector components."
+            )
+        return self._node(self, 1, _dot, (self, other))
+
+    def cross(self, other):
+        """Cross product.
+
+        .. seealso:: :py:func:`~discretisedfield.Field.cross`
+
+        """
+        if not isinstance(other, (df.Field, LazyField, tuple, list, np.ndarray)):
+            raise TypeError(
+                f"Unsupported operand type(s) for cross product: {type(self)=} and"
+                f" {type(other)=}."
+            )
+        other, _ = self._operand(other, "cross product")
+        other_nvdim = other.nvdim if isinstance(other, LazyField) else other.shape[-1]
+        if self.nvdim != 3 or other_nvdim != 3:
+            raise ValueError(
+                f"Cannot apply cross product on {self.nvdim=} and {other_nvdim=}"
+                " fields."
+            )
+        return self._node(self, 3, _cross, (self, other), vdims=self._vdims)
+
+    @property
+    def norm(self):
+        """Norm of the field.
+
+        .. seealso:: :py:func:`~discretisedfield.Field.norm`
+
+        """
+        return self._node(self, 1, _norm, (self,), unit=self._unit)
+
+    @property
+    def orientation(self):
+        """Orientation field.
+
+        .. seealso:: :py:func:`~discretisedfield.Field.orientation`
+
+        """
+        return self._node(
+            self,
+            self.nvdim,
+            _orientation,
+            (self,),
+            vdims=self._vdims,
+            vdim_mapping=self._vdim_mapping,
+        )
+
+    def diff(
+        self,
+        direction,
+        order=1,
+        restrict2valid=True,
+        accuracy=None,
+        method=None,
+        bc=None,
+    ):
+        """Directional derivative.
+
+        .. seealso:: :py:func:`~discretisedfield.Field.diff`
+
+        """
+        if order not in (1, 2):
+            raise NotImplementedError(f"Derivative of {order=} is not implemented.")
+        if accuracy is None:
+            # same default as for a field: its own setting, or 2 for the results of
+            # operations
+            accuracy = self._args[0].diff_accuracy if self._operation is None else 2
+        else:
+            _check_accuracy(accuracy)
+        if bc is None and self._operation is None:
+            bc = self._args[0].diff_bc
+        bc = self.mesh._bc_type(direction, bc)
+        if method is None:
+            method = (
+                self._args[0].diff_method
+                if self._operation is None
+                else "finite-difference"
+            )
+            if bc != "periodic":
+                # the default only applies to periodic directions
+                method = "finite-difference"
+        else:
+            _check_diff_method(method)
+        axis = self.mesh.region._dim2index(direction)
+        if method == "spectral" and bc != "periodic":
+            raise ValueError(
+                "Spectral derivatives require periodic boundary conditions in"
+                f" {direction=}, not {self.mesh.bc=}."
+            )
+        return self._node(
+            self,
+            self.nvdim,
+            "diff",
+            (self, direction, axis, order, restrict2valid, accuracy, method, bc),
+            vdims=self._vdims,
+            vdim_mapping=self._vdim_mapping,
+            unit=self._unit,
+        )
+
+    # Evaluation
+    def _nodes(self):
+        """All nodes of the expression graph (each node only once)."""
+        nodes = {}
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if id(node) not in nodes:
+                nodes[id(node)] = node
+                stack.extend(arg for arg in node._args if isinstance(arg, LazyField))
+        return nodes.values()
+
+    def _halo(self, axis):
+        """Number of additional cells required on each side of a block along axis.
+
+        The finite-difference stencils at the boundaries of a (contiguous valid part
+        of a) line use up to ``order + accuracy`` cells, i.e. the derivative of a
+        cell is not influenced by the block boundaries if the block contains
+        ``order + accuracy - 1`` additional cells on each side.
+        """
+        halo = max(
+            (arg._halo(axis) for arg in self._args if isinstance(arg, LazyField)),
+            default=0,
+        )
+        if self._operation == "diff" and self._args[2] == axis:
+            halo += self._args[3] + self._args[5] - 1
+        return halo
+
+    def _evaluate(self, index, cache):
+        """Evaluate the expression for the cells ``index``.
+
+        Returns a tuple ``(array, valid)``, where ``valid=None`` means that all
+        values are valid.
+        """
+        if id(self) in cache:
+            return cache[id(self)]
+
+        if self._operation is None:
+            (field,) = self._args
+            result = (
+                field._array[index],
+                None if field._valid is None else field._valid[index],
+            )
+        elif self._operation == "diff":
+            node, _, axis, order, restrict2valid, accuracy, method, bc = self._args
+            array, valid = node._evaluate(index, cache)
+            if method == "spectral":
+                if restrict2valid and valid is not None and not valid.all():
+                    raise ValueError(
+                        "Spectral derivatives cannot be computed for fields with"
+                        " invalid cells."
+                    )
+                derivative = _spectral_diff(array, axis, order, self.mesh.cell[axis])
+            else:
+                derivative = _diff(
+                    array,
+                    valid if restrict2valid else None,
+                    axis,
+                    order,
+                    self.mesh.cell[axis],
+                    bc=bc,
+                    accuracy=accuracy,
+                )
+            result = (derivative, valid)
+        else:
+            args = []
+            for arg in self._args:
+                if isinstance(arg, LazyField):
+                    args.extend(arg._evaluate(index, cache))
+                elif isinstance(arg, np.ndarray) and arg.ndim == len(self.mesh.n) + 1:
+                    args.extend((arg[index], None))
+                else:
+                    args.extend((arg, None))
+            result = self._operation(*args)
+
+        cache[id(self)] = result
+        return result
+
+    def compute(self, block_size=None):
+        """Evaluate the expression.
+
+        The expression is evaluated in blocks of approximately ``block_size`` cells
+        along the first spatial direction in which no derivatives with boundary
+        conditions are computed. If there is no such direction, the expression is
+        evaluated at once.
+
+        Parameters
+        ----------
+        block_size : int, optional
+
+            Approximate number of cells per block. Defaults to ``2**16``.
+
+        Returns
+        -------
+        discretisedfield.Field
+
+            Resulting field.
+
+        """
+        n = self.mesh.n
+        # boundary conditions cannot be applied at the edges of a block
+        bc_axes = {
+            node._args[2]
+            for node in self._nodes()
+            if node._operation == "diff" and node._args[7] is not None
+        }
+        axes = [axis for axis in range(len(n)) if axis not in bc_axes]
+        if axes:
+            axis = axes[0]
+            layer_size = int(np.prod(n)) // n[axis]
+            step = max(1, (block_size or _BLOCK_SIZE) // layer_size)
+            halo = self._halo(axis)
+        else:
+            axis, step, halo = 0, n[0], 0
+
+        array = valid = None
+        for start in range(0, n[axis], step):
+            stop = min(start + step, n[axis])
+            lower = max(start - halo, 0)
+            upper = min(stop + halo, n[axis])
+            index = [slice(None)] * len(n)
+            index[axis] = slice(lower, upper)
+            block_array, block_valid = self._evaluate(tuple(index), cache={})
+
+            core = [slice(None)] * len(n)
+            core[axis] = slice(start - lower, stop - lower)
+            core = tuple(core)
+            if array is None:
+                array = np.empty((*n, self.nvdim), dtype=block_array.dtype)
+                if block_valid is not None:
+                    valid = np.empty(n, dtype=bool)
+            index[axis] = slice(start, stop)
+            array[tuple(index)] = block_array[core]
+            if valid is not None:
+                valid[tuple(index)] = block_valid[core]
+
+        return self._cls._from_array(
+            self.mesh,
+            array,
+            valid=valid,
+            vdims=self._vdims,
+            vdim_mapping=self._vdim_mapping,
+            unit=self._unit,
+        )
+
+
+def _binary_operation(function):
+    def operation(array1, valid1, array2, valid2):
+        return function(array1, array2), df.field._and_valid(valid1, valid2)
+
+    operation.__name__ = function.__name__
+    return operation
+
+
+def _rdivide(array1, array2):
+    return np.divide(array2, array1)
+
+
+def _negative(array, valid):
+    return -array, valid
+
+
+def _dot(array1, valid1, array2, valid2):
+    res = np.einsum("...l,...l->...", array1, array2)
+    return res[..., np.newaxis], df.field._and_valid(valid1, valid2)
+
+
+def _cross(array1, valid1, array2, valid2):
+    return np.cross(array1, array2), df.field._and_valid(valid1, valid2)
+
+
+def _norm(array, valid):
+    return np.linalg.norm(array, axis=-1, keepdims=True), valid
+
+
+def _orientation(array, valid):
+    norm = np.linalg.norm(array, axis=-1, keepdims=True)
+    res = np.divide(
+        array, norm, where=np.invert(np.isclose(norm, 0)), out=np.zeros_like(array)
+    )
+    return res, valid
@@ -1,6 +1,6 @@
 import collections
 import contextlib
-import itertools
+import functools
 import numbers
 import warnings
 from numbers import Integral, Number
@@ -9,12 +9,18 @@ import ipywidgets
 import numpy as np
 import scipy.fft as spfft
 import ubermagutil.units as uu
+from scipy import ndimage
 
 import discretisedfield as df
 import discretisedfield.plotting as dfp
 import discretisedfield.util as dfu
 from . import html
 from .io import _MeshIO
+from .operators import _check_accuracy, _check_bc, _diff_matrix, _laplace_matrix
+from .region import _identical, _readonly
+
+# Maximum number of cells per block when iterating over the cells of a mesh.
+_BLOCK_SIZE = 2**16
 
 
 class Mesh(_MeshIO):
@@ -45,6 +51,10 @@ class Mesh(_MeshIO):
     In order to properly define a mesh, mesh region must be an aggregate of
     discretisation cells. Otherwise, ``ValueError`` is raised.
 
+    Meshes are hashable (consistent with ``==``). The array ``n`` is read-only and
+    derived geometry (``cell``, ``cells``, ``vertices``, and ``dV``) is cached until
+    the region or ``n`` change; the returned arrays are read-only as well.
+
     Parameters
     ----------
     region : discretisedfield.Region, optional
@@ -76,7 +86,10 @@ class Mesh(_MeshIO):
         consisting of one or more characters representing the name of the direction(s)
         as present in ``self.region.dims``, denoting the direction(s) along which the
         mesh is periodic. In the case of Neumann or Dirichlet boundary condition, string
-        ``'neumann'`` or ``'dirichlet'`` is passed. Defaults to an empty string.
+        ``'neumann'`` or ``'dirichlet'`` is passed. Defaults to an empty string. Only
+        the periodic boundary conditions are used for derivatives (e.g.
+        ``Field.diff``); Neumann and Dirichlet boundary conditions of derivatives are
+        selected with their ``bc`` argument.
 
     subregions : dict, optional
 
@@ -164,7 +177,7 @@ class Mesh(_MeshIO):
 
     """
 
-    __slots__ = ["_region", "_n", "_bc", "_subregions"]
+    __slots__ = ["_region", "_n", "_bc", "_subregions", "_labels", "_cache"]
 
     # removed attribute: new method/property
     # implemented in __getattr__
@@ -183,6 +196,8 @@ class Mesh(_MeshIO):
         subregions=None,
     ):
         # TODO NO MUTABLE DEFAULT
+        self._cache = (None, None, None, {})
+        self._labels = (None, False, None)
         if region is not None and p1 is None and p2 is None:
             if not isinstance(region, df.Region):
                 raise TypeError("region must be of class discretisedfield.Region.")
@@ -228,7 +243,7 @@ class Mesh(_MeshIO):
                     "Region cannot be divided into "
                     f"discretisation cells of size {cell=}."
                 )
-            self._n = np.divide(self.region.edges, cell).round().astype(int)
+            self._n = _readonly(np.divide(self.region.edges, cell).round().astype(int))
 
         elif n is not None and cell is None:
             # scalar data types for 1d regions
@@ -242,7 +257,7 @@ class Mesh(_MeshIO):
                 raise TypeError("The values of n must be integers.")
             elif not all(i > 0 for i in n):
                 raise ValueError("The values of n must be positive integers.")
-            self._n = np.array(n, dtype=int)
+            self._n = _readonly(np.array(n, dtype=int))
 
         else:
             raise ValueError(
@@ -288,6 +303,48 @@ class Mesh(_MeshIO):
 
         self._bc = bc
 
+    def _bc_type(self, direction, bc=None):
+        """Boundary condition of derivatives in ``direction``.
+
+        Returns ``'periodic'`` if the mesh is periodic in ``direction`` and ``bc``
+        (``None``, ``'neumann'``, or ``'dirichlet'``) otherwise.
+        """
+        _check_bc(bc)
+        if self.bc not in ("neumann", "dirichlet") and direction in self.bc:
+            return "periodic"
+        return bc
+
+    def __setstate__(self, state):
+        # pickle and copy.deepcopy do not preserve the read-only flag of the arrays
+        for name, value in state[1].items():
+            setattr(self, name, value)
+        self._n = _readonly(self._n)
+        key, by_labels, labels = self._labels
+        if labels is not None:
+            self._labels = (key, by_labels, _readonly(labels))
+        self._cache = (None, None, None, {})
+
+    def _cached(self, key, function):
+        """Derived geometry ``function()``, cached until the region or ``n`` change.
+
+        The arrays ``region.pmin``, ``region.pmax``, and ``n`` are read-only and only
+        replaced (e.g. by ``translate(..., inplace=True)``), i.e. comparing their
+        identity is sufficient. The returned values are shared between calls, arrays
+        must therefore be read-only.
+
+        """
+        pmin, pmax, n, cache = self._cache
+        if (
+            pmin is not self.region._pmin
+            or pmax is not self.region._pmax
+            or n is not self._n
+        ):
+            cache = {}
+            self._cache = (self.region._pmin, self.region._pmax, self._n, cache)
+        if key not in cache:
+            cache[key] = function()
+        return cache[key]
+
     @property
     def cell(self):
         """The cell size of the mesh.
@@ -298,7 +355,10 @@ class Mesh(_MeshIO):
 
             A numpy array representing discretisation size along respective axes.
         """
-        return np.divide(self.region.edges, self.n).astype(float)
+        return self._cached(
+            "cell",
+            lambda: _readonly(np.divide(self.region.edges, self.n).astype(float)),
+        )
 
     @property
     def n(self):
@@ -358,41 +418,319 @@ class Mesh(_MeshIO):
         if not all(isinstance(key, str) for key in subregions):
             raise TypeError("The keys of subregion dictionary must be strings.")
 
-        # Check if subregions are aligned with the mesh
         for key, value in subregions.items():
-            # Is the subregion in the mesh region?
-            if value not in self.region:
+            if not isinstance(value, df.Region):
+                raise TypeError(f"Subregion {key} must be a discretisedfield.Region.")
+            if value.ndim != self.region.ndim:
                 raise ValueError(f"Subregion {key} is not in the mesh region.")
 
-            # Is the subregion an aggregate of discretisation cell?
-            try:
-                self.__class__(region=value, cell=self.cell)
-            except ValueError:
-                msg = (
+        # Check if subregions are aligned with the mesh (for all subregions at once,
+        # same conditions as in __init__ and is_aligned for the individual subregions)
+        names = list(subregions)
+        regions = list(subregions.values())
+        pmin, pmax = np.asarray(self.region._bounds(regions), float)
+        tolerance_factor = np.array(
+            [sr.tolerance_factor for sr in regions], float
+        ).reshape(-1, 1)
+        cell = self.cell
+        edges = pmax - pmin
+
+        # Is the subregion in the mesh region?
+        inside = self.region.contains_regions(regions)
+
+        # Is the subregion an aggregate of discretisation cell?
+        fits = (pmin + cell <= pmax) | np.isclose(
+            pmax,
+            pmin + cell,
+            rtol=tolerance_factor,
+            atol=edges.min(axis=1, keepdims=True, initial=0) * tolerance_factor,
+        )
+        tol = np.min(cell) * 1e-3
+        rem = np.remainder(edges, cell)
+        divisible = fits.all(axis=1) & ~(
+            np.greater(rem, tol) & np.less(rem, cell - tol)
+        ).any(axis=1)
+
+        # Is the subregion aligned with the mesh?
+        tol = 1e-12
+        with np.errstate(divide="ignore", invalid="ignore"):
+            subcell = edges / np.round(edges / cell)
+        aligned = np.isclose(cell, subcell, atol=tol).all(axis=1)
+        for mesh_p, p in [(self.region.pmin, pmin), (self.region.pmax, pmax)]:
+            rem = np.remainder(abs(mesh_p - p), cell)
+            aligned &= ~(np.greater(rem, tol) & np.less(rem, cell - tol)).any(axis=1)
+
+        if not (inside & divisible & aligned).all():
+            i = np.argmin(inside & divisible & aligned)
+            key = names[i]
+            if not inside[i]:
+                raise ValueError(f"Subregion {key} is not in the mesh region.")
+            elif not divisible[i]:
+                raise ValueError(
                     f"Subregion {key} cannot be divided into "
                     f"discretisation cells of size {self.cell=}."
                 )
-                raise ValueError(msg) from None
+            raise ValueError(f"Subregion {key} is not aligned with the mesh.")
 
-            # Is the subregion aligned with the mesh?
-            if not self.is_aligned(self.__class__(region=value, cell=self.cell)):
-                raise ValueError(f"Subregion {key} is not aligned with the mesh.")
         if "default" in subregions:
             warnings.warn(
                 "Subregion name ``default`` has a special meaning when "
                 "initialising field values",
                 stacklevel=2,
             )
-        self._subregions = {
-            name: df.Region(
-                p1=sr.pmin,
-                p2=sr.pmax,
-                dims=self.region.dims,
-                units=self.region.units,
-                tolerance_factor=self.region.tolerance_factor,
+        self._set_subregions(
+            {
+                name: df.Region(
+                    p1=sr.pmin,
+                    p2=sr.pmax,
+                    dims=self.region.dims,
+                    units=self.region.units,
+                    tolerance_factor=self.region.tolerance_factor,
+                )
+                for name, sr in subregions.items()
+            }
+        )
+
+    def _set_subregions(self, subregions, labels=None):
+        """Set the (validated) ``subregions`` and optionally the ``labels`` defining
+        the subregions cell by cell."""
+        self._subregions = subregions
+        if labels is None:
+            self._labels = (None, False, None)
+        else:
+            self._labels = (self._subregions_key(), True, _readonly(labels))
+
+    @property
+    def subregion_labels(self):
+        """Subregion of each discretisation cell as integer label array.
+
+        The array has shape ``n``. Label ``0`` denotes cells outside all subregions
+        and label ``i`` cells of the ``i``-th subregion in ``subregions``. If
+        subregions overlap, the first subregion takes precedence (as when
+        initialising field values with a dictionary). The label of a cell and masks
+        of all cells in a subregion are therefore obtained with simple array
+        operations. The labels are computed from the boxes in ``subregions`` unless
+        the subregions are defined cell by cell with ``set_subregion_labels``. The
+        smallest unsigned integer type sufficient for all labels is used.
+
+        The returned array is read-only and shared between calls.
+
+        Returns
+        -------
+        numpy.ndarray
+
+            Subregion labels of all discretisation cells.
+
+        Examples
+        --------
+        1. Subregion labels of the cells.
+
+        >>> import discretisedfield as df
+        ...
+        >>> subregions = {'r1': df.Region(p1=(0, 0), p2=(2, 3)),
+        ...               'r2': df.Region(p1=(1, 0), p2=(4, 1))}
+        >>> mesh = df.Mesh(p1=(0, 0), p2=(4, 3), cell=(1, 1), subregions=subregions)
+        >>> mesh.subregion_labels
+        array([[1, 1, 1],
+               [1, 1, 1],
+               [2, 0, 0],
+               [2, 0, 0]], dtype=uint8)
+
+        2. Name of the subregion at a point.
+
+        >>> names = ['outside', *mesh.subregions]
+        >>> names[mesh.subregion_labels[mesh.point2index((3.5, 0.5))]]
+        'r2'
+
+        3. Mask of the cells in subregion ``r2``.
+
+        >>> mask = mesh.subregion_labels == 2
+
+        """
+        key, _, labels = self._labels
+        if not self._same_subregions(key):
+            labels = _readonly(self._box_labels(list(self._subregions.values())))
+            self._labels = (self._subregions_key(), False, labels)
+        return labels
+
+    @property
+    def _defined_by_labels(self):
+        """Whether the subregions are defined cell by cell with
+        ``set_subregion_labels`` (and have not been changed since)."""
+        key, by_labels, _ = self._labels
+        return by_labels and self._same_subregions(key)
+
+    def _subregion_mask(self, item, slices):
+        """Mask of the cells of subregion ``item`` within ``slices`` if the subregions
+        are defined cell by cell (``None`` otherwise, i.e. all cells of the box)."""
+        if not isinstance(item, str) or not self._defined_by_labels:
+            return None
+        label = list(self._subregions).index(item) + 1
+        return self.subregion_labels[slices] == label
+
+    def _subregions_key(self):
+        """Names of the subregions and the arrays defining the subregions and the
+        mesh geometry."""
+        # subregions can be changed in place, see _cached
+        return (
+            tuple(self._subregions),
+            (
+                self.region._pmin,
+                self.region._pmax,
+                self._n,
+                *(p for sr in self._subregions.values() for p in (sr._pmin, sr._pmax)),
+            ),
+        )
+
+    def _same_subregions(self, key):
+        """Whether the subregions and the mesh geometry are unchanged since
+        ``_subregions_key`` returned ``key``."""
+        if key is None:
+            return False
+        names, arrays = self._subregions_key()
+        return (
+            key[0] == names
+            and len(key[1]) == len(arrays)
+            and all(a is b for a, b in zip(key[1], arrays))
+        )
+
+    def _box_labels(self, regions):
+        """Labels of the cells in ``regions`` (aligned with the mesh), the first
+        region takes precedence."""
+        labels = np.zeros(self.n, dtype=np.min_scalar_type(len(regions)))
+        if regions:
+            pmin = np.array([sr.pmin for sr in regions])
+            pmax = np.array([sr.pmax for sr in regions])
+            start = np.round((pmin - self.region.pmin) / self.cell).astype(int)
+            stop = np.round((pmax - self.region.pmin) / self.cell).astype(int)
+            start = np.clip(start, 0, self.n)
+            stop = np.clip(stop, 0, self.n)
+            for i in range(len(regions), 0, -1):
+                labels[tuple(map(slice, start[i - 1], stop[i - 1]))] = i
+        return labels
+
+    def set_subregion_labels(self, labels, names=None):
+        """Define subregions cell by cell with an integer label array.
+
+        Each label different from ``0`` defines one subregion consisting of all
+        cells with this label; label ``0`` denotes cells outside all subregions.
+        Subregions defined this way can have arbitrary shapes (e.g. grains of a
+        polycrystal) and do not overlap. Validation and lookup are vectorised, which
+        makes it possible to use thousands of subregions.
+
+        ``subregion_labels`` returns the labels renumbered from ``1`` in ascending
+        order of ``labels``. ``subregions`` contains the bounding boxes of the
+        subregions, which are used for ``mesh[name]`` and ``field[name]``; the cells
+        of the bounding box outside the subregion are invalid in ``field[name]``.
+        Field values initialised with a dictionary are only assigned to the cells of
+        the subregions and reductions with ``subregion=name`` (e.g. ``Field.mean``)
+        only include the cells of the subregion. The labels are kept by
+        ``translate``, ``scale``, and ``rotate90``. Setting or modifying
+        ``subregions`` (also in place) replaces the labels by the labels of the
+        boxes in ``subregions``.
+
+        Parameters
+        ----------
+        labels : array_like
+
+            Non-negative integer labels with shape ``n``.
+
+        names : sequence of str, optional
+
+            Names of the subregions, one for each distinct label different from
+            ``0`` in ascending order. Defaults to ``'subregion<label>'``.
+
+        Raises
+        ------
+        TypeError
+
+            If ``labels`` are not integers or ``names`` are not strings.
+
+        ValueError
+
+            If the shape of ``labels`` does not match the mesh, ``labels`` are
+            negative, or the number of ``names`` does not match the number of
+            labels.
+
+        Examples
+        --------
+        1. Subregions from a label array.
+
+        >>> import discretisedfield as df
+        >>> import numpy as np
+        ...
+        >>> mesh = df.Mesh(p1=(0, 0), p2=(4, 2), cell=(1, 1))
+        >>> mesh.set_subregion_labels(np.array([[0, 5], [5, 5], [7, 7], [7, 0]]))
+        >>> list(mesh.subregions)
+        ['subregion5', 'subregion7']
+        >>> mesh.subregions['subregion7']
+        Region(pmin=[2.0, 0.0], pmax=[4.0, 2.0], ...)
+        >>> mesh.subregion_labels
+        array([[0, 1],
+               [1, 1],
+               [2, 2],
+               [2, 0]], dtype=uint8)
+
+        2. Field values in the subregions.
+
+        >>> field = df.Field(mesh, nvdim=1, value={'subregion5': 1, 'default': 0})
+        >>> field.array[..., 0]
+        array([[0., 1.],
+               [1., 1.],
+               [0., 0.],
+               [0., 0.]])
+
+        """
+        labels = np.asarray(labels)
+        if not np.issubdtype(labels.dtype, np.integer):
+            raise TypeError(f"Labels must be integers, not {labels.dtype}.")
+        if labels.shape != tuple(self.n):
+            raise ValueError(
+                f"The shape of labels {labels.shape} does not match the number of"
+                f" cells {tuple(self.n.tolist())}."
+            )
+
+        values, labels = np.unique(labels, return_inverse=True)
+        labels = labels.reshape(self.n)
+        if len(values) > 0 and values[0] < 0:
+            raise ValueError("Labels must be non-negative integers.")
+        if len(values) > 0 and values[0] == 0:
+            values = values[1:]
+        else:
+            labels += 1
+        labels = labels.astype(np.min_scalar_type(len(values)))
+
+        if names is None:
+            names = [f"subregion{value}" for value in values]
+        names = list(names)
+        if not all(isinstance(name, str) for name in names):
+            raise TypeError("The names of the subregions must be strings.")
+        if len(names) != len(values) or len(set(names)) != len(names):
+            raise ValueError(
+                f"Expected {len(values)} distinct names, one for each label, but got"
+                f" {names}."
             )
-            for name, sr in subregions.items()
-        }
+
+        if "default" in names:
+            warnings.warn(
+                "Subregion name ``default`` has a special meaning when "
+                "initialising field values",
+                stacklevel=2,
+            )
+        vertices = self.vertices
+        self._set_subregions(
+            {
+                name: df.Region(
+                    p1=[v[s.start] for v, s in zip(vertices, box)],
+                    p2=[v[s.stop] for v, s in zip(vertices, box)],
+                    dims=self.region.dims,
+                    units=self.region.units,
+                    tolerance_factor=self.region.tolerance_factor,
+                )
+                for name, box in zip(names, ndimage.find_objects(labels))
+            },
+            labels,
+        )
 
     def __len__(self):
         """Number of discretisation cells in the mesh.
@@ -450,11 +788,12 @@ class Mesh(_MeshIO):
         >>> list(mesh.indices)
         [(0, 0, 0), (1, 0, 0), (2, 0, 0), (0, 1, 0), (1, 1, 0), (2, 1, 0)]
 
-        .. seealso:: :py:func:`~discretisedfield.Mesh.__iter__`
+        .. seealso:: :py:func:`~discretisedfield.Mesh.__iter__`,
+            :py:func:`~discretisedfield.Mesh.index_arrays`
 
         """
-        for index in itertools.product(*map(range, reversed(self.n))):
-            yield tuple(reversed(index))
+        for index in self._index_blocks(_BLOCK_SIZE):
+            yield from zip(*index.T.tolist())
 
     def __iter__(self):
         """Generator yielding coordinates of discretisation cells.
@@ -481,10 +820,126 @@ class Mesh(_MeshIO):
         >>> list(mesh)
         [array([0.5, 0.5, 0.5]), array([1.5, 0.5, 0.5]), array([0.5, 1.5, 0.5]),...]
 
-        .. seealso:: :py:func:`~discretisedfield.Mesh.indices`
+        .. seealso:: :py:func:`~discretisedfield.Mesh.indices`,
+            :py:func:`~discretisedfield.Mesh.coordinate_arrays`
+
+        """
+        for index in self._index_blocks(_BLOCK_SIZE):
+            yield from self.index2point(index)
+
+    def _index_blocks(self, max_cells):
+        """Generator yielding the indices of all cells in blocks.
+
+        Each block is an integer array with shape ``(M, ndim)``. The cells are in the
+        same order as in ``indices`` (first index changing fastest), i.e. the blocks
+        are slabs along the last spatial direction with at most ``max_cells`` cells
+        (but at least one layer of cells).
 
         """
-        yield from map(self.index2point, self.indices)
+        layer_size = int(np.prod(self.n[:-1]))
+        step = max(1, max_cells // layer_size)
+        for start in range(0, self.n[-1], step):
+            stop = min(start + step, self.n[-1])
+            shape = (*self.n[:-1], stop - start)
+            index = np.indices(shape).reshape(len(shape), -1, order="F").T
+            index[:, -1] += start
+            yield index
+
+    def coordinate_arrays(self, sparse=True):
+        """Coordinates of all cell midpoints as arrays.
+
+        For ``sparse=True`` the array of direction ``i`` contains the ``n[i]``
+        coordinates along axis ``i`` and has length one along all other axes (the
+        same as ``numpy.ogrid``), i.e. the arrays only require memory proportional to
+        the number of cells along one direction and broadcast against each other to
+        the shape ``n`` of the mesh. For ``sparse=False`` the full arrays with shape
+        ``n`` are returned. The coordinates are identical to the ones returned by
+        ``index2point``.
+
+        Parameters
+        ----------
+        sparse : bool, optional
+
+            If ``True``, return open-mesh arrays that can be broadcast to the shape of
+            the mesh. Defaults to ``True``.
+
+        Returns
+        -------
+        tuple
+
+            Tuple with one array of coordinates per spatial direction.
+
+        Examples
+        --------
+        1. Evaluating a function at all cell midpoints.
+
+        >>> import discretisedfield as df
+        ...
+        >>> mesh = df.Mesh(p1=(0, 0), p2=(3, 2), cell=(1, 1))
+        >>> x, y = mesh.coordinate_arrays()
+        >>> x.shape, y.shape
+        ((3, 1), (1, 2))
+        >>> x + 10 * y
+        array([[ 5.5, 15.5],
+               [ 6.5, 16.5],
+               [ 7.5, 17.5]])
+
+        .. seealso:: :py:func:`~discretisedfield.Mesh.index_arrays`,
+            :py:func:`~discretisedfield.Mesh.cells`
+
+        """
+        coordinates = (
+            pmin + (np.arange(n) + 0.5) * cell
+            for pmin, n, cell in zip(self.region.pmin, self.n, self.cell)
+        )
+        return tuple(np.meshgrid(*coordinates, indexing="ij", sparse=sparse))
+
+    def index_arrays(self, sparse=True):
+        """Indices of all cells as arrays.
+
+        The arrays have the same layout as the arrays returned by
+        ``coordinate_arrays``, i.e. for ``sparse=True`` they can be broadcast to the
+        shape ``n`` of the mesh (the same as ``numpy.ogrid``) and for ``sparse=False``
+        they have shape ``n``. They can be used to index arrays with shape ``(*n,
+        ...)``, e.g. ``field.array``.
+
+        Parameters
+        ----------
+        sparse : bool, optional
+
+            If ``True``, return open-mesh arrays that can be broadcast to the shape of
+            the mesh. Defaults to ``True``.
+
+        Returns
+        -------
+        tuple
+
+            Tuple with one integer array of indices per spatial direction.
+
+        Examples
+        --------
+        1. Getting the indices of all cells.
+
+        >>> import discretisedfield as df
+        ...
+        >>> mesh = df.Mesh(p1=(0, 0), p2=(3, 2), cell=(1, 1))
+        >>> i, j = mesh.index_arrays()
+        >>> i
+        array([[0],
+               [1],
+               [2]])
+        >>> j
+        array([[0, 1]])
+        >>> mesh.index_arrays(sparse=False)[1]
+        array([[0, 1],
+               [0, 1],
+               [0, 1]])
+
+        .. seealso:: :py:func:`~discretisedfield.Mesh.coordinate_arrays`,
+            :py:func:`~discretisedfield.Mesh.indices`
+
+        """
+        return tuple(np.indices(self.n, sparse=sparse))
 
     @property
     def cells(self):
@@ -516,16 +971,16 @@ class Mesh(_MeshIO):
         array([1., 3., 5., 7., 9.])
 
         """
-        cells = collections.namedtuple("cells", self.region.dims)
-
-        return cells(
-            *(
-                np.linspace(pmin + cell / 2, pmax - cell / 2, n)
+        cells = self._cached(
+            "cells",
+            lambda: tuple(
+                _readonly(np.linspace(pmin + cell / 2, pmax - cell / 2, n))
                 for pmin, pmax, cell, n in zip(
                     self.region.pmin, self.region.pmax, self.cell, self.n
                 )
-            )
+            ),
         )
+        return _namedtuple("cells", self.region.dims)(*cells)
 
     @property
     def vertices(self):
@@ -557,14 +1012,14 @@ class Mesh(_MeshIO):
         array([ 0.,  2.,  4.,  6.,  8., 10.])
 
         """
-        vertices = collections.namedtuple("vertices", self.region.dims)
-
-        return vertices(
-            *(
-                np.linspace(pmin, pmax, n + 1)
+        vertices = self._cached(
+            "vertices",
+            lambda: tuple(
+                _readonly(np.linspace(pmin, pmax, n + 1))
                 for pmin, pmax, n in zip(self.region.pmin, self.region.pmax, self.n)
-            )
+            ),
         )
+        return _namedtuple("vertices", self.region.dims)(*vertices)
 
     def __eq__(self, other):
         """Relational operator ``==``.
@@ -609,10 +1064,40 @@ class Mesh(_MeshIO):
         True
 
         """
+        if other is self:
+            return True
         if not isinstance(other, self.__class__):
             return False
         return self.region == other.region and all(self.n == other.n)
 
+    def __hash__(self):
+        """Hash consistent with ``==``.
+
+        Meshes can be used as dictionary keys or in sets. The hash is based on the
+        region and the number of cells ``n`` (boundary conditions and subregions are
+        ignored, as in ``==``); a mesh must not be modified (e.g. with
+        ``inplace=True``) while it is used as a key.
+
+        Returns
+        -------
+        int
+
+            Hash value.
+
+        Examples
+        --------
+        1. Using meshes as dictionary keys.
+
+        >>> import discretisedfield as df
+        ...
+        >>> mesh1 = df.Mesh(p1=(0, 0, 0), p2=(5, 5, 5), cell=(1, 1, 1))
+        >>> mesh2 = df.Mesh(p1=(0, 0, 0), p2=(5, 5, 5), n=(5, 5, 5), bc='x')
+        >>> {mesh1: 'a'}[mesh2]
+        'a'
+
+        """
+        return hash((self.region, tuple(self.n.tolist())))
+
     def allclose(self, other, rtol=None, atol=None):
         """Check if the mesh is close enough to the other based on a tolerance.
 
@@ -682,6 +1167,14 @@ class Mesh(_MeshIO):
         if self.region.dims != other.region.dims:
             raise ValueError("The mesh dimensions do not match.")
 
+        # identical geometry, e.g. fields sharing a mesh
+        if other is self or (
+            _identical(self.n, other.n)
+            and _identical(self.region.pmin, other.region.pmin)
+            and _identical(self.region.pmax, other.region.pmax)
+        ):
+            return True
+
         return self.region.allclose(
             other.region, rtol=rtol, atol=atol
         ) and np.array_equal(self.n, other.n)
@@ -722,18 +1215,23 @@ class Mesh(_MeshIO):
     def index2point(self, index, /):
         """Convert cell's index to its coordinate.
 
+        Multiple indices can be converted at once by passing an array of shape ``(N,
+        ndim)``.
+
         Parameters
         ----------
         index : array_like
 
-            For three dimensions, the cell's index :math:`(i_{x}, i_{y}, i_{z})`.
+            For three dimensions, the cell's index :math:`(i_{x}, i_{y}, i_{z})`, or
+            an array of indices with shape ``(N, ndim)``.
 
         Returns
         -------
         numpy.ndarray
 
             For three dimensions, the cell's coordinate
-            :math:`\\mathbf{p} = (p_{x}, p_{y}, p_{z})`.
+            :math:`\\mathbf{p} = (p_{x}, p_{y}, p_{z})`, or an array of coordinates
+            with shape ``(N, ndim)``.
 
         Raises
         ------
@@ -756,9 +1254,26 @@ class Mesh(_MeshIO):
         >>> mesh.index2point((0, 1, 0))
         array([0.5, 1.5, 0.5])
 
+        2. Converting multiple indices at once.
+
+        >>> mesh.index2point(np.array([[0, 0, 0], [1, 1, 0]]))
+        array([[0.5, 0.5, 0.5],
+               [1.5, 1.5, 0.5]])
+
         .. seealso:: :py:func:`~discretisedfield.Mesh.point2index`
 
         """
+        if isinstance(index, np.ndarray) and index.ndim == 2:
+            if not np.issubdtype(index.dtype, np.integer):
+                raise TypeError(f"The elements of {index.dtype=} must be integer.")
+            if index.shape[1] != self.region.ndim:
+                raise IndexError(
+                    f"Wrong dimensional indices {index.shape=} but {self.region.ndim=}."
+                )
+            if np.any((index < 0) | (index >= self.n)):
+                raise IndexError("Indices out of range.")
+            return self.region.pmin + (index + 0.5) * self.cell
+
         if isinstance(index, numbers.Integral):
             index = [index]
         elif isinstance(index, (np.ndarray, list, tuple)):
@@ -791,17 +1306,23 @@ class Mesh(_MeshIO):
         which has a closed interval i.e. [] and is inclusive of both the
         lower and upper bounds of the cell.
 
+        Multiple points can be converted at once by passing an array of shape ``(N,
+        ndim)``. The points are checked and converted without a loop over the points,
+        which makes sampling a large number of points fast.
+
         Parameters
         ----------
         point : array_like
 
-            For three dimensions, point :math:`\\mathbf{p} = (p_{x}, p_{y}, p_{z})`.
+            For three dimensions, point :math:`\\mathbf{p} = (p_{x}, p_{y}, p_{z})`, or
+            an array of points with shape ``(N, ndim)``.
 
         Returns
         -------
-        tuple
+        tuple or numpy.ndarray
 
-            For three dimensions, the cell's index :math:`(i_{x}, i_{y}, i_{z})`.
+            For three dimensions, the cell's index :math:`(i_{x}, i_{y}, i_{z})`. For
+            multiple points, an integer array of indices with shape ``(N, ndim)``.
 
         Raises
         ------
@@ -822,9 +1343,36 @@ class Mesh(_MeshIO):
         >>> mesh.point2index((0.2, 1.7, 0.3))
         (0, 1, 0)
 
+        2. Converting multiple points at once.
+
+        >>> mesh.point2index(np.array([[0.2, 1.7, 0.3], [2, 2, 1]]))
+        array([[0, 1, 0],
+               [1, 1, 0]])
+
         .. seealso:: :py:func:`~discretisedfield.Mesh.index2point`
 
         """
+        if isinstance(point, np.ndarray) and point.ndim == 2:
+            if not np.issubdtype(point.dtype, np.integer) and not np.issubdtype(
+                point.dtype, np.floating
+            ):
+                raise TypeError(f"The elements of {point.dtype=} must be real numbers.")
+            if point.shape[1] != self.region.ndim:
+                raise ValueError(
+                    f"Wrong dimensional points {point.shape=} but {self.region.ndim=}."
+                )
+            outside = ~self.region.contains(point)
+            if np.any(outside):
+                raise ValueError(
+                    f"{np.count_nonzero(outside)} points (e.g."
+                    f" {point[np.argmax(outside)]}) are outside the region"
+                    f" {self.region=}."
+                )
+            # truncation instead of floor is sufficient because of the clipping
+            index = ((point - self.region.pmin) / self.cell).astype(int)
+            # If index is rounded to the out-of-range values.
+            return np.clip(index, 0, self.n - 1)
+
         if isinstance(point, (tuple, list, np.ndarray)):
             if any(not isinstance(i, numbers.Real) for i in point):
                 raise TypeError(
@@ -1545,7 +2093,7 @@ class Mesh(_MeshIO):
         8.0
 
         """
-        return np.prod(self.cell).item()
+        return self._cached("dV", lambda: np.prod(self.cell).item())
 
     def scale(self, factor, reference_point=None, inplace=False):
         """Scale the underlying region and all subregions.
@@ -1666,9 +2214,12 @@ class Mesh(_MeshIO):
                 key: sr.scale(factor, reference_point=sr_ref)
                 for key, sr in self.subregions.items()
             }
-            return self.__class__(
+            mesh = self.__class__(
                 region=region, n=self.n, bc=self.bc, subregions=subregions
             )
+            if self._defined_by_labels:
+                mesh._set_subregions(mesh.subregions, self.subregion_labels)
+            return mesh
 
     def translate(self, vector, inplace=False):
         """Translate the underlying region and all subregions.
@@ -1763,9 +2314,12 @@ class Mesh(_MeshIO):
             subregions = {
                 key: sr.translate(vector) for key, sr in self.subregions.items()
             }
-            return self.__class__(
+            mesh = self.__class__(
                 region=region, n=self.n, bc=self.bc, subregions=subregions
             )
+            if self._defined_by_labels:
+                mesh._set_subregions(mesh.subregions, self.subregion_labels)
+            return mesh
 
     def rotate90(self, ax1, ax2, k=1, reference_point=None, inplace=False):
         """Rotate mesh by 90°.
@@ -1853,11 +2407,19 @@ class Mesh(_MeshIO):
             for name, subregion in self.subregions.items()
         }
 
+        labels = None
+        if self._defined_by_labels:
+            axes = (self.region._dim2index(ax1), self.region._dim2index(ax2))
+            labels = np.rot90(self.subregion_labels, k=k, axes=axes).copy()
+
         if inplace:
-            self._n = np.array(n, dtype=int)
-            return self
+            self._n = _readonly(np.array(n, dtype=int))
+            mesh = self
         else:
-            return self.__class__(region=region, n=n, bc=self.bc, subregions=subregions)
+            mesh = self.__class__(region=region, n=n, bc=self.bc, subregions=subregions)
+        if labels is not None:
+            mesh._set_subregions(mesh.subregions, labels)
+        return mesh
 
     @property
     def mpl(self):
@@ -2167,12 +2729,179 @@ class Mesh(_MeshIO):
         )
         for i, dim in enumerate(self.region.dims):
             cells = self.cells  # avoid re-computing cells
-            field.array[..., i] = getattr(cells, dim).reshape(
+            field._array[..., i] = getattr(cells, dim).reshape(
                 tuple(self.n[i] if i == j else 1 for j in range(self.region.ndim))
             )
 
         return field
 
+    def diff_operator(self, direction, order=1, valid=None, accuracy=2, bc=None):
+        """Sparse finite-difference matrix of the directional derivative.
+
+        The matrix computes the same derivative as
+        :py:func:`~discretisedfield.Field.diff` (with ``method='finite-difference'``),
+        including the periodic boundary conditions defined in ``mesh.bc``, the
+        boundary condition ``bc``, and the treatment of invalid cells. It acts on the
+        values of a field flattened in C order, i.e.
+        ``field.array.reshape(-1, nvdim)``, so that the derivative of many fields
+        defined on the mesh can be computed with a single sparse matrix product each.
+        The matrix can also be used to solve linear systems.
+
+        The matrices are cached and must not be modified in place.
+
+        Parameters
+        ----------
+        direction : str
+
+            The spatial direction of the derivative.
+
+        order : int, optional
+
+            The order of the derivative (1 or 2). Defaults to 1.
+
+        valid : array_like, optional
+
+            Boolean array of shape ``mesh.n``, e.g. ``field.valid``. Invalid cells are
+            excluded from the derivative (as in ``Field.diff`` with
+            ``restrict2valid=True``) and the corresponding rows and columns are zero.
+            If not specified, all cells are valid.
+
+        accuracy : int, optional
+
+            Order of accuracy of the finite-difference stencils (2, 4, or 6). Defaults
+            to 2.
+
+        bc : str, optional
+
+            Boundary condition if ``direction`` is not periodic: ``'neumann'``,
+            ``'dirichlet'`` (homogeneous), or ``None`` (one-sided stencils, default).
+            See :py:func:`~discretisedfield.Field.diff`.
+
+        Returns
+        -------
+        scipy.sparse.csr_array
+
+            Matrix of shape ``(n_cells, n_cells)``, where ``n_cells`` is the number
+            of cells in the mesh.
+
+        Raises
+        ------
+        ValueError
+
+            If ``direction``, ``accuracy``, ``bc``, or the shape of ``valid`` is not
+            valid.
+
+        NotImplementedError
+
+            If the order of the derivative is not 1 or 2.
+
+        Examples
+        --------
+        1. Compute the derivative of a field.
+
+        >>> import discretisedfield as df
+        >>> import numpy as np
+        ...
+        >>> mesh = df.Mesh(p1=(0, 0), p2=(10, 5), cell=(1, 1), bc='x')
+        >>> f = df.Field(mesh, nvdim=2, value=lambda p: (p[0] ** 2, p[1]))
+        >>> operator = mesh.diff_operator('x')
+        >>> operator.shape
+        (50, 50)
+        >>> d = operator @ f.array.reshape(-1, f.nvdim)
+        >>> np.allclose(d.reshape(f.array.shape), f.diff('x').array)
+        True
+
+        .. seealso:: :py:func:`~discretisedfield.Mesh.laplace_operator`
+
+        """
+        if order not in (1, 2):
+            raise NotImplementedError(f"Derivative of {order=} is not implemented.")
+        _check_accuracy(accuracy)
+        axis = self.region._dim2index(direction)
+        return _diff_matrix(
+            tuple(map(int, self.n)),
+            axis,
+            order,
+            float(self.cell[axis]),
+            self._bc_type(direction, bc),
+            accuracy,
+            self._valid_key(valid),
+        )
+
+    def laplace_operator(self, valid=None, accuracy=2, bc=None):
+        """Sparse finite-difference matrix of the Laplace operator.
+
+        The matrix computes the same result as
+        :py:func:`~discretisedfield.Field.laplace` (with finite differences) and is
+        the sum of the second-order ``diff_operator`` matrices in all directions. See
+        :py:func:`~discretisedfield.Mesh.diff_operator` for details.
+
+        Parameters
+        ----------
+        valid : array_like, optional
+
+            Boolean array of shape ``mesh.n``, e.g. ``field.valid``. If not specified,
+            all cells are valid.
+
+        accuracy : int, optional
+
+            Order of accuracy of the finite-difference stencils (2, 4, or 6). Defaults
+            to 2.
+
+        bc : str, optional
+
+            Boundary condition in the directions that are not periodic:
+            ``'neumann'``, ``'dirichlet'`` (homogeneous), or ``None`` (one-sided
+            stencils, default).
+
+        Returns
+        -------
+        scipy.sparse.csr_array
+
+            Matrix of shape ``(n_cells, n_cells)``.
+
+        Examples
+        --------
+        1. Solve the Poisson equation ``-laplace(u) = 2 pi^2 sin(pi x) sin(pi y)`` with
+        ``u = 0`` at the boundaries. The analytic solution is ``u = sin(pi x) sin(pi
+        y)``.
+
+        >>> import discretisedfield as df
+        >>> import numpy as np
+        >>> import scipy.sparse.linalg
+        ...
+        >>> mesh = df.Mesh(p1=(0, 0), p2=(1, 1), n=(20, 20))
+        >>> exact = df.Field(mesh, nvdim=1, value=lambda p: np.prod(np.sin(np.pi * p)))
+        >>> rhs = 2 * np.pi**2 * exact
+        >>> solution = scipy.sparse.linalg.spsolve(
+        ...     -mesh.laplace_operator(bc='dirichlet').tocsc(), rhs.array.ravel()
+        ... )
+        >>> u = df.Field(mesh, nvdim=1, value=solution.reshape(rhs.array.shape))
+        >>> np.allclose(u.array, exact.array, atol=5e-3)
+        True
+
+        .. seealso:: :py:func:`~discretisedfield.Mesh.diff_operator`
+
+        """
+        _check_accuracy(accuracy)
+        return _laplace_matrix(
+            tuple(map(int, self.n)),
+            tuple(map(float, self.cell)),
+            tuple(self._bc_type(dim, bc) for dim in self.region.dims),
+            accuracy,
+            self._valid_key(valid),
+        )
+
+    def _valid_key(self, valid):
+        """Hashable representation of a boolean array of shape ``n`` (``None`` if all
+        cells are valid)."""
+        if valid is None:
+            return None
+        valid = np.asarray(valid, dtype=bool)
+        if valid.shape != tuple(self.n):
+            raise ValueError(f"The shape of {valid.shape=} must be equal to {self.n=}.")
+        return None if valid.all() else valid.tobytes()
+
     def fftn(self, rfft=False):
         """Performs an N-dimensional discrete Fast Fourier Transform (FFT) on the mesh.
 
@@ -2422,3 +3151,9 @@ class Mesh(_MeshIO):
         mesh.translate(-mesh.region.center, inplace=True)
 
         return mesh
+
+
+@functools.lru_cache
+def _namedtuple(name, dims):
+    """Named tuple class with the dimension names as fields (shared between meshes)."""
+    return collections.namedtuple(name, dims)
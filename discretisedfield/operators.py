@@ -1,4 +1,9 @@
+import fractions
+import functools
+
 import numpy as np
+import scipy.fft as spfft
+import scipy.sparse as sp
 
 
 def integrate(field, direction=None, cumulative=False):
@@ -86,3 +91,490 @@ def _split_diff_combine(array, valid, order, dx):
     else:
         out[valid] = np.concatenate(diff)
         return out
+
+
+def _check_accuracy(accuracy):
+    """Check the accuracy of finite-difference stencils."""
+    if accuracy not in (2, 4, 6):
+        raise ValueError(f"Finite differences of {accuracy=} are not supported.")
+
+
+def _check_diff_method(method):
+    """Check the method used to compute derivatives."""
+    if method not in ("finite-difference", "spectral"):
+        raise ValueError(
+            f"Unknown {method=}; must be 'finite-difference' or 'spectral'."
+        )
+
+
+def _check_bc(bc):
+    """Check the boundary condition of derivatives in non-periodic directions."""
+    if bc not in (None, "neumann", "dirichlet"):
+        raise ValueError(
+            f"Unknown boundary condition {bc=}; must be None, 'neumann', or"
+            " 'dirichlet'."
+        )
+
+
+def _diff(array, valid, axis, order, dx, bc=None, out=None, accuracy=2):
+    """Derivative of ``array`` with shape ``(*n, nvdim)`` along ``axis``.
+
+    The derivative is computed separately for each contiguous part of the lines along
+    ``axis`` where ``valid`` (shape ``n``) is ``True``; ``valid=None`` means that all
+    values are valid. ``bc`` is the boundary condition along ``axis`` (see
+    ``_diff_bc``); without boundary condition one-sided stencils are used at the
+    boundaries. The result is written into ``out`` if given (which can be ``array``
+    itself).
+
+    The stencils are applied to the whole array at once. For ``accuracy=2`` the
+    result is identical to applying ``_split_diff_combine`` to every line, higher
+    accuracies are computed with ``_accurate_diff``.
+    """
+    if bc is not None:
+        return _diff_bc(array, valid, axis, order, dx, bc, out, accuracy)
+
+    # Move the axis of the derivative to the second to last position, i.e. the last
+    # spatial dimension (views, no copies).
+    f = np.moveaxis(array, axis, -2)
+    if not np.issubdtype(f.dtype, np.inexact):
+        f = f.astype(np.float64)  # same as np.gradient
+    n = f.shape[-2]
+
+    if accuracy != 2:
+        res = np.empty_like(array) if out is None else out
+        _accurate_diff(
+            f,
+            None if valid is None else np.moveaxis(valid, axis, -1),
+            order,
+            dx,
+            accuracy,
+            np.moveaxis(res, axis, -2),
+        )
+        return res
+
+    # The stencils at the first and last cell of each contiguous valid part are
+    # evaluated before anything is written, because out can be array.
+    edges = []  # (index, values)
+    if valid is None:
+        # a single contiguous part per line
+        if n >= order + 1:
+            for side, cell in [(1, 0), (-1, n - 1)]:
+                edges.append(
+                    (
+                        (..., cell, slice(None)),
+                        _edge_stencil(
+                            lambda shift, cell=cell: f[..., cell + shift, :],
+                            side,
+                            order,
+                            n == order + 1,
+                            dx,
+                        ),
+                    )
+                )
+    else:
+        v = np.moveaxis(valid, axis, -1)
+        start = v.copy()
+        start[..., 1:] &= ~v[..., :-1]
+        end = v.copy()
+        end[..., :-1] &= ~v[..., 1:]
+        interior = v & ~start & ~end
+        # The n-th start and the n-th end (in C order) belong to the same part.
+        start = np.nonzero(start)
+        end = np.nonzero(end)
+        length = end[-1] - start[-1] + 1
+        for side, cells in [(1, start), (-1, end)]:
+            for short, select in [
+                (True, length == order + 1),
+                (False, length >= order + 2),
+            ]:
+                *other, cell = (i[select] for i in cells)
+                edges.append(
+                    (
+                        (*other, cell),
+                        _edge_stencil(
+                            lambda shift, other=other, cell=cell: f[
+                                (*other, cell + shift)
+                            ],
+                            side,
+                            order,
+                            short,
+                            dx,
+                        ),
+                    )
+                )
+
+    res = np.zeros_like(array) if out is None else out
+    r = np.moveaxis(res, axis, -2)
+
+    if n < order + 1:
+        r[...] = 0
+    else:
+        # The stencil is applied to all cells and the cells that are not in the
+        # interior of a contiguous valid part are overwritten. Invalid cells can
+        # contain arbitrary values (e.g. nan or inf), which must not raise warnings.
+        with np.errstate(invalid="ignore", over="ignore"):
+            if order == 1:
+                r[..., 1:-1, :] = (f[..., 2:, :] - f[..., :-2, :]) / (2.0 * dx)
+            else:
+                r[..., 1:-1, :] = (
+                    f[..., :-2, :] - 2 * f[..., 1:-1, :] + f[..., 2:, :]
+                ) / dx**2
+        if valid is not None:
+            r[~interior] = 0
+        for index, values in edges:
+            r[index] = values
+
+    return res
+
+
+def _diff_bc(array, valid, axis, order, dx, bc, out, accuracy):
+    """Derivative with boundary condition ``bc`` along ``axis``.
+
+    ``bc`` can be ``'periodic'``, ``'neumann'`` (ghost cells mirror the cells at the
+    boundary, i.e. zero gradient), or ``'dirichlet'`` (ghost cells mirror the cells at
+    the boundary with opposite sign, i.e. zero value at the boundary faces; only
+    homogeneous Dirichlet boundary conditions are supported).
+    The whole array is differentiated without boundary condition; only the cells
+    close to the boundaries (which are influenced by the boundary condition) are
+    recomputed from thin strips extended with ghost cells. Hence, the array is not
+    copied (apart from short directions, where the whole array is extended).
+    """
+    n = array.shape[axis]
+    # Cells further away from the boundary are not influenced by it (the one-sided
+    # stencils use up to order + accuracy cells).
+    reach = order + accuracy - 1
+    # In periodic directions a contiguous valid part can continue on the opposite
+    # side, i.e. the ghost cells must cover the reach of the stencils.
+    ghosts = reach if bc == "periodic" else accuracy // 2
+
+    def strip(start, stop, keep):
+        index = [slice(None)] * array.ndim
+        index[axis] = slice(keep - start, keep - start + reach)
+        return _diff(
+            *_extend(array, valid, axis, start, stop, bc),
+            axis,
+            order,
+            dx,
+            accuracy=accuracy,
+        )[tuple(index)]
+
+    if n <= 2 * reach:
+        index = [slice(None)] * array.ndim
+        index[axis] = slice(ghosts, ghosts + n)
+        res = _diff(
+            *_extend(array, valid, axis, -ghosts, n + ghosts, bc),
+            axis,
+            order,
+            dx,
+            accuracy=accuracy,
+        )[tuple(index)]
+        if out is None:
+            return res.copy()
+        out[...] = res
+        return out
+
+    # evaluated before anything is written, because out can be array
+    first = strip(-ghosts, 2 * reach, 0)
+    last = strip(n - 2 * reach, n + ghosts, n - reach)
+    res = _diff(array, valid, axis, order, dx, out=out, accuracy=accuracy)
+    index = [slice(None)] * array.ndim
+    index[axis] = slice(0, reach)
+    res[tuple(index)] = first
+    index[axis] = slice(n - reach, n)
+    res[tuple(index)] = last
+    return res
+
+
+def _extend(array, valid, axis, start, stop, bc):
+    """Cells ``start`` to ``stop`` along ``axis`` including ghost cells (indices
+    outside ``0`` to ``n - 1``) defined by the boundary condition ``bc``."""
+    n = array.shape[axis]
+    index = np.arange(start, stop)
+    if bc == "periodic":
+        source = index % n
+    elif bc in ("neumann", "dirichlet"):
+        # repeated mirroring, same as np.pad(..., mode="symmetric")
+        source = index % (2 * n)
+        mirrored = source >= n
+        source = np.where(mirrored, 2 * n - 1 - source, source)
+    else:
+        raise ValueError(f"Unknown boundary condition {bc=}.")
+    array = np.take(array, source, axis=axis)
+    if valid is not None:
+        valid = np.take(valid, source, axis=axis)
+    if bc == "dirichlet":
+        # antisymmetric ghost cells: the linear interpolation between a cell at the
+        # boundary and its ghost cell is zero at the boundary face
+        ghost = [slice(None)] * array.ndim
+        ghost[axis] = mirrored
+        array[tuple(ghost)] *= -1
+    return array, valid
+
+
+def _edge_stencil(values, side, order, short, dx):
+    """One-sided stencils of ``_1d_diff`` at the first (``side=1``) or last
+    (``side=-1``) cell of contiguous parts with ``order + 1`` (``short=True``) or more
+    cells. ``values(shift)`` returns the values of the cells shifted by ``shift``."""
+    if order == 1:
+        # same expressions as in np.gradient
+        if short:
+            if side == 1:
+                return (values(1) - values(0)) / dx
+            return (values(0) - values(-1)) / dx
+        if side == 1:
+            return -1.5 / dx * values(0) + 2.0 / dx * values(1) + -0.5 / dx * values(2)
+        return 0.5 / dx * values(-2) + -2.0 / dx * values(-1) + 1.5 / dx * values(0)
+    if short:
+        return (values(0) - 2 * values(side) + values(2 * side)) / dx**2
+    return (
+        2 * values(0) - 5 * values(side) + 4 * values(2 * side) - values(3 * side)
+    ) / dx**2
+
+
+def _accurate_diff(f, v, order, dx, accuracy, out):
+    """Derivative along the second to last axis of ``f`` with central stencils of
+    the given (even) ``accuracy`` > 2 written into ``out``; ``v`` is the valid mask
+    along the last axis.
+
+    Close to the first and last cell of each contiguous valid part, off-centre
+    stencils of the same accuracy using the ``order + accuracy`` cells at the
+    boundary of the part are used. Parts that are too short for these stencils fall
+    back to the next lower accuracy.
+    """
+    n = f.shape[-2]
+    size = order + accuracy  # number of cells of the off-centre stencils
+    radius = accuracy // 2
+    if v is None and n < size:
+        _diff(f, None, f.ndim - 2, order, dx, out=out, accuracy=accuracy - 2)
+        return
+    if np.may_share_memory(f, out):
+        f = f.copy()
+
+    # The central stencils are symmetric (order 2) or antisymmetric (order 1), i.e.
+    # the values of the cells on both sides can be combined before the
+    # multiplication with the weight. Invalid cells can contain arbitrary values
+    # (e.g. nan or inf), which must not raise warnings.
+    weights = _fd_weights(order, 2 * radius + 1, radius) / dx**order
+    combine = np.subtract if order == 1 else np.add
+    core = out[..., radius : max(n - radius, radius), :]
+    m = core.shape[-2]
+    with np.errstate(invalid="ignore", over="ignore"):
+        if order == 1:
+            core[...] = 0
+        else:
+            np.multiply(f[..., radius : radius + m, :], weights[radius], out=core)
+        tmp = np.empty_like(core)
+        for k in range(1, radius + 1):
+            combine(
+                f[..., radius + k : radius + k + m, :],
+                f[..., radius - k : radius - k + m, :],
+                out=tmp,
+            )
+            tmp *= weights[radius + k]
+            core += tmp
+
+    if v is None:
+        for j in range(radius):
+            # j cells away from the first and last cell
+            left = _fd_weights(order, size, j) / dx**order
+            right = _fd_weights(order, size, size - 1 - j) / dx**order
+            out[..., j, :] = sum(w * f[..., i, :] for i, w in enumerate(left))
+            out[..., n - 1 - j, :] = sum(
+                w * f[..., n - size + i, :] for i, w in enumerate(right)
+            )
+        return
+
+    # position of each cell in its contiguous valid part counted from the first
+    # (pos) and the last (rem) cell of the part
+    pos = _position_in_part(v)
+    rem = _position_in_part(v[..., ::-1])[..., ::-1]
+    long = v & (pos + rem + 1 >= size)
+    out[~(long & (pos >= radius) & (rem >= radius))] = 0
+    for j in range(radius):
+        for select, x0, first in [
+            (long & (pos == j), j, -j),
+            (long & (rem == j), size - 1 - j, j + 1 - size),
+        ]:
+            *other, cell = np.nonzero(select)
+            w = _fd_weights(order, size, x0) / dx**order
+            out[(*other, cell)] = sum(
+                w[i] * f[(*other, cell + first + i)] for i in range(size)
+            )
+
+    short = v & ~long
+    if short.any():
+        lower = _diff(f, short, f.ndim - 2, order, dx, accuracy=accuracy - 2)
+        out[short] = lower[short]
+
+
+def _position_in_part(v):
+    """Index of each cell along the last axis counted from the first cell of its
+    contiguous ``True`` part (arbitrary for ``False`` cells)."""
+    index = np.arange(v.shape[-1])
+    start = v.copy()
+    start[..., 1:] &= ~v[..., :-1]
+    return index - np.maximum.accumulate(np.where(start, index, 0), axis=-1)
+
+
+@functools.cache
+def _fd_weights(order, size, x0):
+    """Finite-difference weights of the derivative of ``order`` at ``x0`` based on
+    the values at ``0, 1, ..., size - 1`` (unit spacing).
+
+    The weights are computed exactly with Fornberg's algorithm (B. Fornberg,
+    Generation of finite difference formulas on arbitrarily spaced grids, Math.
+    Comp. 51, 699-706 (1988)).
+    """
+    c = [[fractions.Fraction(0)] * (order + 1) for _ in range(size)]
+    c[0][0] = fractions.Fraction(1)
+    c1 = fractions.Fraction(1)
+    c4 = -x0
+    for i in range(1, size):
+        c2 = fractions.Fraction(1)
+        c5 = c4
+        c4 = i - x0
+        for j in range(i):
+            c3 = i - j
+            c2 *= c3
+            if j == i - 1:
+                for k in range(min(i, order), 0, -1):
+                    c[i][k] = c1 * (k * c[i - 1][k - 1] - c5 * c[i - 1][k]) / c2
+                c[i][0] = -c1 * c5 * c[i - 1][0] / c2
+            for k in range(min(i, order), 0, -1):
+                c[j][k] = (c4 * c[j][k] - k * c[j][k - 1]) / c3
+            c[j][0] = c4 * c[j][0] / c3
+        c1 = c2
+    return np.array([float(row[order]) for row in c])
+
+
+@functools.lru_cache(maxsize=16)
+def _diff_matrix(n, axis, order, dx, bc, accuracy, valid):
+    """Sparse matrix of the derivative computed with ``_diff``.
+
+    ``valid`` is ``None`` or the bytes of a boolean array of shape ``n`` (to make it
+    hashable). The matrix acts on arrays of shape ``(*n, nvdim)`` reshaped to
+    ``(-1, nvdim)``.
+
+    The weights are obtained by differentiating probe arrays: the cells along
+    ``axis`` are coloured such that all cells that can contribute to the derivative
+    in one cell (at most ``order + accuracy - 1`` cells away) have different
+    colours. Differentiating one probe per colour (all at once as separate value
+    dimensions) then gives every weight exactly once, including the effects of
+    invalid cells and boundary conditions.
+
+    Without invalid cells the weights are the same on all lines along ``axis``. The
+    matrix is then the one-dimensional matrix combined with identity matrices of the
+    other axes (Kronecker products), so that no probe of the size of the mesh is
+    required.
+    """
+    if valid is None and len(n) > 1:
+        matrix = _diff_matrix((n[axis],), 0, order, dx, bc, accuracy, None)
+        before = int(np.prod(n[:axis]))
+        after = int(np.prod(n[axis + 1 :]))
+        if before > 1:
+            matrix = sp.kron(sp.identity(before), matrix, format="csr")
+        if after > 1:
+            matrix = sp.kron(matrix, sp.identity(after), format="csr")
+        return sp.csr_array(matrix)
+    if valid is not None:
+        valid = np.frombuffer(valid, dtype=bool).reshape(n)
+    size = n[axis]
+    reach = order + accuracy - 1
+    width = 2 * reach + 1
+    index = np.arange(size)
+    periodic = bc == "periodic"
+    if size <= width:
+        colour = index
+    elif periodic:
+        # the last size % width cells get their own colours, so that colours are
+        # unique across the periodic boundary
+        regular = size - size % width
+        colour = np.where(index < regular, index % width, width + index - regular)
+    else:
+        colour = index % width
+    shifts = index if periodic and size <= width else range(-reach, reach + 1)
+
+    probe = np.zeros((size, colour.max() + 1))
+    probe[index, colour] = 1
+    shape = [1] * len(n)
+    shape[axis] = size
+    probe = np.broadcast_to(probe.reshape(*shape, -1), (*n, probe.shape[-1]))
+    weights = np.moveaxis(
+        _diff(
+            np.ascontiguousarray(probe),
+            valid,
+            axis,
+            order,
+            dx,
+            bc=bc,
+            accuracy=accuracy,
+        ),
+        axis,
+        -2,
+    )
+    cells = np.moveaxis(np.arange(np.prod(n)).reshape(n), axis, -1)
+
+    rows, cols, values = [], [], []
+    for shift in shifts:
+        neighbour = index + shift
+        if periodic:
+            neighbour %= size
+            keep = index
+        else:
+            keep = index[(neighbour >= 0) & (neighbour < size)]
+            neighbour = neighbour[keep]
+        rows.append(cells[..., keep].ravel())
+        cols.append(cells[..., neighbour].ravel())
+        values.append(weights[..., keep, colour[neighbour]].ravel())
+
+    size = int(np.prod(n))
+    matrix = sp.csr_array(
+        (np.concatenate(values), (np.concatenate(rows), np.concatenate(cols))),
+        shape=(size, size),
+    )
+    matrix.eliminate_zeros()
+    return matrix
+
+
+@functools.lru_cache(maxsize=16)
+def _laplace_matrix(n, cell, bc, accuracy, valid):
+    """Sparse matrix of the Laplace operator (sum of ``_diff_matrix`` with
+    ``order=2`` along all axes). ``bc`` contains the boundary condition per axis."""
+    return sum(
+        _diff_matrix(n, axis, 2, dx, axis_bc, accuracy, valid)
+        for axis, (dx, axis_bc) in enumerate(zip(cell, bc))
+    )
+
+
+def _spectral_diff(array, axis, order, dx):
+    """Spectral derivative of ``array`` with shape ``(*n, nvdim)``, which is periodic
+    along ``axis``.
+
+    The array is transformed along ``axis`` only, multiplied with ``(i k)**order``,
+    and transformed back.
+    """
+    n = array.shape[axis]
+    shape = [-1 if i == axis else 1 for i in range(array.ndim)]
+    if np.iscomplexobj(array):
+        coefficients = spfft.fft(array, axis=axis)
+        coefficients *= _spectral_factor(n, float(dx), order, False).reshape(shape)
+        return spfft.ifft(coefficients, axis=axis, overwrite_x=True)
+    coefficients = spfft.rfft(array, axis=axis)
+    coefficients *= _spectral_factor(n, float(dx), order, True).reshape(shape)
+    return spfft.irfft(coefficients, n, axis=axis, overwrite_x=True)
+
+
+@functools.lru_cache(maxsize=32)
+def _spectral_factor(n, dx, order, real):
+    """Factor ``(i k)**order`` of the spectral derivative for the wavenumbers ``k``
+    of ``n`` cells with spacing ``dx`` (of ``rfft`` if ``real``, else of ``fft``).
+
+    The arrays only depend on the mesh and are cached (read-only)."""
+    k = 2 * np.pi * (spfft.rfftfreq(n, dx) if real else spfft.fftfreq(n, dx))
+    factor = (1j * k) ** order
+    if order % 2 == 1 and n % 2 == 0:
+        # The sign of the Nyquist mode is ambiguous; its odd derivatives are set to
+        # zero (otherwise the derivative of real data would not be real).
+        factor[n // 2] = 0
+    factor.flags.writeable = False
+    return factor
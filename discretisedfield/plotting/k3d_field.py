@@ -5,6 +5,7 @@ import matplotlib
 import numpy as np
 import ubermagutil.units as uu
 
+import discretisedfield as df
 import discretisedfield.plotting.util as plot_util
 
 
@@ -201,10 +202,13 @@ class K3dField:
             created internally. This is not true in the case of an interactive
             plot, when ``plot`` must be created externally.
 
-        filter_field : discretisedfield.Field, optional
+        filter_field : discretisedfield.Field, callable, optional
 
             Scalar field. Only discretisation cells where ``filter_field != 0``
-            are shown. Defaults to ``None``.
+            are shown. The filter field is evaluated at the cell midpoints, i.e.
+            it can be defined on a different mesh (containing the region of the
+            plotted field). Other callables are called with one cell midpoint at a
+            time. Defaults to ``None``.
 
         cmap : str, optional
 
@@ -252,7 +256,7 @@ class K3dField:
             plot = k3d.plot()
             plot.display()
 
-        if filter_field is not None and filter_field.nvdim != 1:
+        if isinstance(filter_field, df.Field) and filter_field.nvdim != 1:
             msg = f"Cannot use nvdim={self.data.nvdim} filter_field."
             raise ValueError(msg)
 
@@ -274,7 +278,7 @@ class K3dField:
                     plot=plot, multiplier=multiplier, name="total_region", opacity=0.025
                 )
 
-        plot_array = np.copy(self.data.array)  # make a deep copy
+        plot_array = np.copy(self.data._array)  # make a deep copy
         plot_array = plot_array[..., 0]  # remove an empty dimension
 
         # All values must be in (1, 255) -> (1, n-1), for n=256 range, with
@@ -282,7 +286,14 @@ class K3dField:
         # values are zero, are invisible.
         plot_array = plot_util.normalise_to_range(plot_array, (1, 255))
         # Remove voxels where filter_field = 0.
-        if filter_field is not None:
+        if isinstance(filter_field, df.Field):
+            # evaluate the filter field at all cell midpoints at once, the filter
+            # field can be defined on a different mesh
+            mesh = self.data.mesh
+            points = np.stack(mesh.coordinate_arrays(sparse=False), axis=-1)
+            filter_values = filter_field(points.reshape(-1, mesh.region.ndim))
+            plot_array[(filter_values[:, 0] == 0).reshape(mesh.n)] = 0
+        elif filter_field is not None:
             for i in self.data.mesh.indices:
                 if filter_field(self.data.mesh.index2point(i)) == 0:
                     plot_array[i] = 0
@@ -165,15 +165,11 @@ class K3dMesh:
         if multiplier is None:
             multiplier = uu.si_max_multiplier(self.mesh.region.edges)
 
-        plot_array = np.zeros(self.mesh.n)
-        for index in self.mesh.indices:
-            # colour all voxels in the same subregion with the same colour
-            # to make it easier to identify subregions
-            for i, subregion in enumerate(self.mesh.subregions.values()):
-                if self.mesh.index2point(index) in subregion:
-                    # +1 to avoid 0 value - invisible voxel
-                    plot_array[index] = (i % len(color)) + 1
-                    break
+        # colour all voxels in the same subregion with the same colour
+        # to make it easier to identify subregions
+        labels = self.mesh.subregion_labels.astype(int)
+        # +1 to avoid 0 value - invisible voxel
+        plot_array = np.where(labels > 0, (labels - 1) % len(color) + 1, 0)
         # swap axes for k3d.voxels and astypr to avoid k3d warning
         plot_array = np.swapaxes(plot_array, 0, 2).astype(np.uint8)
 
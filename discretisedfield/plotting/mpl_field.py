@@ -293,7 +293,7 @@ class MplField(Mpl):
         multiplier = self._setup_multiplier(multiplier)
         extent = self._extent(multiplier)
 
-        values = self.field.array.copy().reshape(self.field.mesh.n)
+        values = self.field._array.copy().reshape(self.field.mesh.n)
 
         if filter_field is None:
             filter_field = self.field._valid_as_field
@@ -459,7 +459,7 @@ class MplField(Mpl):
                 f" {lightness_field.mesh.region.ndim=}."
             )
 
-        values = self.field.array.copy().reshape(self.field.mesh.n)
+        values = self.field._array.copy().reshape(self.field.mesh.n)
 
         if not np.array_equal(lightness_field.mesh.n, self.field.mesh.n):
             lightness_field = lightness_field.resample(self.field.mesh.n)
@@ -634,7 +634,7 @@ class MplField(Mpl):
         points1 = self.field.mesh.cells[0] / multiplier
         points2 = self.field.mesh.cells[1] / multiplier
 
-        values = self.field.array.copy()
+        values = self.field._array.copy()
         self._filter_values(self.field._valid_as_field, values)
 
         if vdims is None:
@@ -820,7 +820,7 @@ class MplField(Mpl):
         points1 = self.field.mesh.cells[0] / multiplier
         points2 = self.field.mesh.cells[1] / multiplier
 
-        values = self.field.array.copy().reshape(self.field.mesh.n)
+        values = self.field._array.copy().reshape(self.field.mesh.n)
 
         if filter_field is None:
             filter_field = self.field._valid_as_field
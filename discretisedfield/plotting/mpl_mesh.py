@@ -201,7 +201,8 @@ class MplMesh(Mpl):
         multiplier = self._setup_multiplier(multiplier)
 
         if box_aspect == "auto":
-            ax.set_box_aspect(self.mesh.region.edges)
+            # matplotlib modifies the array in place; edges is read-only
+            ax.set_box_aspect(self.mesh.region.edges.copy())
         elif box_aspect is not None:
             ax.set_box_aspect(box_aspect)
 
@@ -98,7 +98,8 @@ class MplRegion(Mpl):
         rescaled_region = self.region.scale(1 / multiplier, reference_point=(0, 0, 0))
 
         if box_aspect == "auto":
-            ax.set_box_aspect(rescaled_region.edges)
+            # matplotlib modifies the array in place; edges is read-only
+            ax.set_box_aspect(rescaled_region.edges.copy())
         elif box_aspect is not None:
             ax.set_box_aspect(box_aspect)
 
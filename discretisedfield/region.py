@@ -18,6 +18,11 @@ class Region(_RegionIO):
     diagonally-opposite points. If any of the edge lengths of the cuboid region
     is zero, ``ValueError`` is raised.
 
+    Regions are hashable (consistent with ``==``). The arrays ``pmin`` and ``pmax``
+    are read-only; the region can only be changed with the methods supporting
+    ``inplace=True``. Derived geometry (``edges``, ``center``, and ``volume``) is
+    cached until the coordinates change; the returned arrays are read-only as well.
+
     Parameters
     ----------
     p1 / p2 : array_like
@@ -76,7 +81,7 @@ class Region(_RegionIO):
 
     """
 
-    __slots__ = ["_pmin", "_pmax", "_dims", "_units", "_tolerance_factor"]
+    __slots__ = ["_pmin", "_pmax", "_dims", "_units", "_tolerance_factor", "_cache"]
 
     def __init__(
         self, p1=None, p2=None, dims=None, units=None, tolerance_factor=1e-12, **kwargs
@@ -122,8 +127,9 @@ class Region(_RegionIO):
         if not all(isinstance(i, numbers.Real) for i in p2):
             raise TypeError("p2 can only contain elements of type numbers.Real.")
 
-        self._pmin = np.minimum(p1, p2)
-        self._pmax = np.maximum(p1, p2)
+        self._pmin = _readonly(np.minimum(p1, p2))
+        self._pmax = _readonly(np.maximum(p1, p2))
+        self._cache = (None, None, {})
         self.dims = dims
         self.units = units
         self.tolerance_factor = tolerance_factor
@@ -358,6 +364,31 @@ class Region(_RegionIO):
             )
         self._tolerance_factor = tolerance_factor
 
+    def __setstate__(self, state):
+        # pickle and copy.deepcopy do not preserve the read-only flag of the arrays
+        for name, value in state[1].items():
+            setattr(self, name, value)
+        self._pmin = _readonly(self._pmin)
+        self._pmax = _readonly(self._pmax)
+        self._cache = (None, None, {})
+
+    def _cached(self, key, function):
+        """Derived geometry ``function()``, cached until ``pmin`` or ``pmax`` change.
+
+        ``pmin`` and ``pmax`` are read-only and only replaced (e.g. by
+        ``translate(..., inplace=True)``), i.e. comparing their identity is
+        sufficient. The returned values are shared between calls, arrays must
+        therefore be read-only.
+
+        """
+        pmin, pmax, cache = self._cache
+        if pmin is not self._pmin or pmax is not self._pmax:
+            cache = {}
+            self._cache = (self._pmin, self._pmax, cache)
+        if key not in cache:
+            cache[key] = function()
+        return cache[key]
+
     @property
     def edges(self):
         r"""Region's edge lengths.
@@ -389,7 +420,7 @@ class Region(_RegionIO):
         array([ 5, 15, 20])
 
         """
-        return self.pmax - self.pmin
+        return self._cached("edges", lambda: _readonly(self.pmax - self.pmin))
 
     @property
     def center(self):
@@ -423,7 +454,9 @@ class Region(_RegionIO):
         array([ 2.5,  7.5, 10. ])
 
         """
-        return 0.5 * np.add(self.pmin, self.pmax)
+        return self._cached(
+            "center", lambda: _readonly(0.5 * np.add(self.pmin, self.pmax))
+        )
 
     @property
     def centre(self):
@@ -460,7 +493,7 @@ class Region(_RegionIO):
         100
 
         """
-        return np.prod(self.edges).item()
+        return self._cached("volume", lambda: np.prod(self.edges).item())
 
     def __repr__(self):
         r"""Representation string.
@@ -532,6 +565,8 @@ class Region(_RegionIO):
         True
 
         """
+        if other is self:
+            return True
         if isinstance(other, self.__class__):
             return (
                 np.array_equal(self.pmin, other.pmin)
@@ -542,6 +577,40 @@ class Region(_RegionIO):
 
         return False
 
+    def __hash__(self):
+        """Hash consistent with ``==``.
+
+        Regions can be used as dictionary keys or in sets. The hash is based on the
+        current coordinates, dimension names and units; a region must not be modified
+        (e.g. with ``inplace=True``) while it is used as a key.
+
+        Returns
+        -------
+        int
+
+            Hash value.
+
+        Examples
+        --------
+        1. Using regions as dictionary keys.
+
+        >>> import discretisedfield as df
+        ...
+        >>> region1 = df.Region(p1=(0, 0, 0), p2=(5, 5, 5))
+        >>> region2 = df.Region(p1=(0.0, 0, 0), p2=(5.0, 5, 5))
+        >>> {region1: 'a'}[region2]
+        'a'
+
+        """
+        return hash(
+            (
+                tuple(self.pmin.tolist()),
+                tuple(self.pmax.tolist()),
+                self.dims,
+                self.units,
+            )
+        )
+
     def allclose(
         self,
         other,
@@ -597,15 +666,22 @@ class Region(_RegionIO):
 
         """
         if isinstance(other, self.__class__):
-            if atol is None:
-                atol = np.min(self.edges) * self.tolerance_factor
-            elif not isinstance(atol, numbers.Number):
+            if atol is not None and not isinstance(atol, numbers.Number):
                 raise TypeError(f"{type(atol)=} is not a number.")
+            if rtol is not None and not isinstance(rtol, numbers.Number):
+                raise TypeError(f"{type(rtol)=} is not a number.")
+
+            # identical coordinates, e.g. fields sharing a mesh
+            if other is self or (
+                _identical(self._pmin, other._pmin)
+                and _identical(self._pmax, other._pmax)
+            ):
+                return True
 
+            if atol is None:
+                atol = np.min(self.edges) * self.tolerance_factor
             if rtol is None:
                 rtol = self.tolerance_factor
-            elif not isinstance(rtol, numbers.Number):
-                raise TypeError(f"{type(rtol)=} is not a number.")
 
             return np.allclose(
                 self.pmin, other.pmin, atol=atol, rtol=rtol
@@ -674,6 +750,9 @@ class Region(_RegionIO):
 
         """
         if isinstance(other, (numbers.Real, collections.abc.Iterable)):
+            # the tolerance is only required for points close to the boundary
+            if np.all((self.pmin <= other) & (other <= self.pmax)):
+                return True
             atol = np.min(self.edges) * self.tolerance_factor
             rtol = self.tolerance_factor
             return np.all(
@@ -689,6 +768,199 @@ class Region(_RegionIO):
 
         return False
 
+    def contains(self, points):
+        """Determine for many points at once if they belong to the region.
+
+        Vectorised version of ``point in region`` (with the same tolerance) for an
+        array of points.
+
+        Parameters
+        ----------
+        points : array_like
+
+            Points with shape ``(..., ndim)``, e.g. ``(N, ndim)`` for ``N`` points.
+
+        Returns
+        -------
+        numpy.ndarray
+
+            Boolean array with shape ``(...)``, ``True`` for points inside the
+            region.
+
+        Raises
+        ------
+        TypeError
+
+            If the points are not real numbers.
+
+        ValueError
+
+            If the points do not have ``ndim`` coordinates.
+
+        Example
+        -------
+        1. Check which points are inside the region.
+
+        >>> import discretisedfield as df
+        ...
+        >>> region = df.Region(p1=(0, 0), p2=(2, 1))
+        >>> region.contains([(1, 1), (1, 2), (2, 0)])
+        array([ True, False,  True])
+
+        .. seealso:: :py:func:`~discretisedfield.Region.contains_regions`
+
+        """
+        points = np.asarray(points)
+        if not (
+            np.issubdtype(points.dtype, np.integer)
+            or np.issubdtype(points.dtype, np.floating)
+        ):
+            raise TypeError(f"The elements of {points.dtype=} must be real numbers.")
+        if points.shape[-1:] != (self.ndim,):
+            raise ValueError(
+                f"Wrong dimensional points {points.shape=} but {self.ndim=}."
+            )
+        shape = points.shape[:-1]
+        points = points.reshape(-1, self.ndim)
+        inside = np.all((self.pmin <= points) & (points <= self.pmax), axis=-1)
+        if not inside.all():
+            # only the points outside need to be checked with the tolerance
+            atol = np.min(self.edges) * self.tolerance_factor
+            rtol = self.tolerance_factor
+            outside = points[~inside]
+            inside[~inside] = np.all(
+                (
+                    (self.pmin <= outside)
+                    | np.isclose(self.pmin, outside, rtol=rtol, atol=atol)
+                )
+                & (
+                    (self.pmax >= outside)
+                    | np.isclose(self.pmax, outside, rtol=rtol, atol=atol)
+                ),
+                axis=-1,
+            )
+        return inside.reshape(shape)
+
+    def contains_regions(self, regions):
+        """Determine for many regions at once if they belong to the region.
+
+        Vectorised version of ``other in region`` for a sequence of regions, e.g.
+        to check thousands of subregions in one call. A region is inside if both its
+        ``pmin`` and ``pmax`` are inside.
+
+        Parameters
+        ----------
+        regions : discretisedfield.Region or sequence of discretisedfield.Region
+
+            Regions with the same number of dimensions.
+
+        Returns
+        -------
+        bool or numpy.ndarray
+
+            ``True`` for regions inside the region. A boolean array with one element
+            per region is returned for a sequence of regions.
+
+        Raises
+        ------
+        TypeError
+
+            If ``regions`` are not ``discretisedfield.Region`` objects.
+
+        ValueError
+
+            If the regions have a different number of dimensions.
+
+        Example
+        -------
+        1. Check which regions are inside the region.
+
+        >>> import discretisedfield as df
+        ...
+        >>> region = df.Region(p1=(0, 0), p2=(2, 1))
+        >>> regions = [df.Region(p1=(0, 0), p2=(1, 1)),
+        ...            df.Region(p1=(1, 0), p2=(3, 1))]
+        >>> region.contains_regions(regions)
+        array([ True, False])
+
+        .. seealso:: :py:func:`~discretisedfield.Region.intersects`
+
+        """
+        pmin, pmax = self._bounds(regions)
+        inside = self.contains(np.stack([pmin, pmax])).all(axis=0)
+        return inside.item() if isinstance(regions, self.__class__) else inside
+
+    def intersects(self, regions):
+        """Determine for many regions at once if they intersect the region.
+
+        Regions intersect if they share a volume. Regions that only touch (within
+        the tolerance of ``tolerance_factor``) do not intersect.
+
+        Parameters
+        ----------
+        regions : discretisedfield.Region or sequence of discretisedfield.Region
+
+            Regions with the same number of dimensions.
+
+        Returns
+        -------
+        bool or numpy.ndarray
+
+            ``True`` for regions intersecting the region. A boolean array with one
+            element per region is returned for a sequence of regions.
+
+        Raises
+        ------
+        TypeError
+
+            If ``regions`` are not ``discretisedfield.Region`` objects.
+
+        ValueError
+
+            If the regions have a different number of dimensions.
+
+        Example
+        -------
+        1. Check which regions intersect the region.
+
+        >>> import discretisedfield as df
+        ...
+        >>> region = df.Region(p1=(0, 0), p2=(2, 1))
+        >>> regions = [df.Region(p1=(1, 0), p2=(3, 1)),
+        ...            df.Region(p1=(2, 0), p2=(3, 1))]
+        >>> region.intersects(regions)
+        array([ True, False])
+
+        .. seealso:: :py:func:`~discretisedfield.Region.contains_regions`
+
+        """
+        pmin, pmax = self._bounds(regions)
+        tol = (
+            np.min(self.edges) * self.tolerance_factor
+            + np.maximum(abs(self.pmin), abs(self.pmax)) * self.tolerance_factor
+        )
+        overlap = np.minimum(self.pmax, pmax) - np.maximum(self.pmin, pmin)
+        intersects = np.all(overlap > tol, axis=-1)
+        return intersects.item() if isinstance(regions, self.__class__) else intersects
+
+    def _bounds(self, regions):
+        """``pmin`` and ``pmax`` of a region or a sequence of regions as arrays with
+        shape ``(N, ndim)``."""
+        if isinstance(regions, self.__class__):
+            regions = [regions]
+        regions = list(regions)
+        for region in regions:
+            if not isinstance(region, self.__class__):
+                raise TypeError(f"Expected Region objects but got {type(region)}.")
+            if region.ndim != self.ndim:
+                raise ValueError(
+                    f"Wrong dimensional region {region.ndim=} but {self.ndim=}."
+                )
+        shape = (len(regions), self.ndim)
+        pmin = np.array([region.pmin for region in regions]).reshape(shape)
+        pmax = np.array([region.pmax for region in regions]).reshape(shape)
+        return pmin, pmax
+
     def __or__(self, other):
         """Old implementation to find facing surfaces.
 
@@ -872,8 +1144,8 @@ class Region(_RegionIO):
         pmax = pmin + self.edges * factor
 
         if inplace:
-            self._pmin = pmin
-            self._pmax = pmax
+            self._pmin = _readonly(pmin)
+            self._pmax = _readonly(pmax)
             return self
         else:
             return self.__class__(
@@ -957,8 +1229,8 @@ class Region(_RegionIO):
                     f"Unsupported element {elem} of type {type(elem)} for translate."
                 )
         if inplace:
-            self._pmin = np.add(self.pmin, vector)
-            self._pmax = np.add(self.pmax, vector)
+            self._pmin = _readonly(np.add(self.pmin, vector))
+            self._pmax = _readonly(np.add(self.pmax, vector))
             return self
         else:
             return self.__class__(
@@ -1070,8 +1342,8 @@ class Region(_RegionIO):
             units[idx1], units[idx2] = units[idx2], units[idx1]
 
         if inplace:
-            self._pmin = np.minimum(p1, p2)
-            self._pmax = np.maximum(p1, p2)
+            self._pmin = _readonly(np.minimum(p1, p2))
+            self._pmax = _readonly(np.maximum(p1, p2))
             return self
         else:
             return self.__class__(
@@ -1224,3 +1496,18 @@ class Region(_RegionIO):
             stacklevel=2,
         )
         return tuple(np.random.random(self.ndim) * self.edges + self.pmin)
+
+
+def _readonly(array):
+    """Mark an array as read-only and return it."""
+    array.flags.writeable = False
+    return array
+
+
+def _identical(array1, array2):
+    """Exact comparison of two small arrays (faster than ``np.array_equal``)."""
+    return array1 is array2 or (
+        array1.dtype == array2.dtype
+        and array1.shape == array2.shape
+        and array1.tobytes() == array2.tobytes()
+    )
@@ -0,0 +1,311 @@
+import functools
+
+import numpy as np
+import scipy.sparse as sp
+
+import discretisedfield as df
+
+
+class Remapper:
+    r"""Remap fields from one mesh onto another mesh.
+
+    This class precomputes the (sparse) weights required to compute the values of a
+    field defined on ``src_mesh`` at the cells of ``dst_mesh``. The remapper can then
+    be applied to any number of fields defined on ``src_mesh`` at the cost of a single
+    sparse matrix product per field. The region of ``dst_mesh`` must be contained in
+    the region of ``src_mesh`` and both meshes must have the same number of spatial
+    dimensions.
+
+    Three methods are supported:
+
+    - ``'nearest'``: The value of the nearest source cell (based on the cell
+      midpoints) is used. The values are copied and the ``dtype`` is preserved.
+
+    - ``'linear'``: Linear interpolation (bi-/trilinear in two/three dimensions)
+      between the midpoints of the source cells. Between the outermost cell midpoints
+      and the region boundary the value of the outermost cell is used.
+
+    - ``'conservative'``: The value of a destination cell is the volume-weighted
+      average of all source cells overlapping with it. The integral of the field over
+      the destination region is preserved.
+
+    The weights only depend on the geometry of the two meshes and are cached, i.e.
+    creating a new remapper for the same pair of meshes is cheap.
+
+    Parameters
+    ----------
+    src_mesh : discretisedfield.Mesh
+
+        Mesh of the fields that are remapped.
+
+    dst_mesh : discretisedfield.Mesh
+
+        Mesh of the remapped fields.
+
+    method : str, optional
+
+        One of ``'nearest'``, ``'linear'``, or ``'conservative'``. Defaults to
+        ``'nearest'``.
+
+    Raises
+    ------
+    ValueError
+
+        If the method is unknown, the number of dimensions does not match, or the
+        region of ``dst_mesh`` is not contained in the region of ``src_mesh``.
+
+    Examples
+    --------
+    1. Remap a field onto a coarser mesh.
+
+    >>> import discretisedfield as df
+    >>> import numpy as np
+    ...
+    >>> src_mesh = df.Mesh(p1=(0, 0, 0), p2=(10, 10, 10), cell=(1, 1, 1))
+    >>> dst_mesh = df.Mesh(p1=(0, 0, 0), p2=(10, 10, 10), cell=(2, 5, 10))
+    >>> remapper = df.Remapper(src_mesh, dst_mesh, method='conservative')
+    >>> field = df.Field(src_mesh, nvdim=1, value=lambda p: p[0])
+    >>> remapped = remapper(field)
+    >>> remapped.mesh.n
+    array([5, 2, 1])
+    >>> remapped.array[:, 0, 0, 0]
+    array([1., 3., 5., 7., 9.])
+    >>> np.allclose(remapped.integrate(), field.integrate())
+    True
+
+    """
+
+    _methods = ("nearest", "linear", "conservative")
+
+    def __init__(self, src_mesh, dst_mesh, method="nearest"):
+        if not isinstance(src_mesh, df.Mesh) or not isinstance(dst_mesh, df.Mesh):
+            raise TypeError(
+                "'src_mesh' and 'dst_mesh' must be of class discretisedfield.Mesh."
+            )
+        if method not in self._methods:
+            raise ValueError(f"Unknown {method=}; must be one of {self._methods}.")
+        if src_mesh.region.ndim != dst_mesh.region.ndim:
+            raise ValueError(
+                f"The number of dimensions of {src_mesh.region.ndim=} and"
+                f" {dst_mesh.region.ndim=} must be equal."
+            )
+        if dst_mesh.region not in src_mesh.region:
+            raise ValueError(
+                f"{src_mesh.region} of the source mesh does not contain"
+                f" {dst_mesh.region} of the destination mesh."
+            )
+
+        self._src_mesh = src_mesh
+        self._dst_mesh = dst_mesh
+        self._method = method
+        self._geometries = (_geometry(src_mesh), _geometry(dst_mesh))
+        if method == "nearest":
+            # the weight matrix is only built if it is explicitly requested
+            self._indices = _nearest_indices(*self._geometries)
+            self._matrix = None
+        else:
+            self._indices = None
+            self._matrix = _remapping_matrix(method, *self._geometries)
+
+    @property
+    def src_mesh(self):
+        """Mesh of the fields that are remapped."""
+        return self._src_mesh
+
+    @property
+    def dst_mesh(self):
+        """Mesh of the remapped fields."""
+        return self._dst_mesh
+
+    @property
+    def method(self):
+        """Remapping method."""
+        return self._method
+
+    @property
+    def matrix(self):
+        """Sparse weight matrix.
+
+        The matrix has shape ``(dst_mesh.n.prod(), src_mesh.n.prod())`` and acts on the
+        values of a field flattened in C order, i.e. ``field.array.reshape(-1,
+        nvdim)``.
+
+        """
+        if self._matrix is None:
+            self._matrix = _remapping_matrix(self.method, *self._geometries)
+        return self._matrix
+
+    def __call__(self, field):
+        """Remap a field.
+
+        Parameters
+        ----------
+        field : discretisedfield.Field
+
+            Field defined on ``src_mesh``.
+
+        Returns
+        -------
+        discretisedfield.Field
+
+            Field defined on ``dst_mesh``. The ``valid`` property is remapped as well:
+            for ``method='nearest'`` the valid state of the nearest cell is used, for
+            the other methods a cell is only valid if all source cells that
+            contribute to it are valid.
+
+        Raises
+        ------
+        ValueError
+
+            If the field is not defined on ``src_mesh``.
+
+        """
+        if not isinstance(field, df.Field):
+            raise TypeError(f"Cannot remap object of {type(field)=}.")
+        if not field.mesh.allclose(self.src_mesh):
+            raise ValueError("The field must be defined on the source mesh.")
+
+        array = self._remap(field._array)
+        if field._valid is None:
+            valid = True
+        elif self.method == "nearest":
+            valid = self._remap(field._valid)
+        else:
+            invalid = self._matrix @ np.logical_not(field._valid).reshape(-1)
+            valid = (invalid == 0).reshape(self.dst_mesh.n)
+
+        return field.__class__(
+            self.dst_mesh,
+            nvdim=field.nvdim,
+            value=array,
+            vdims=field.vdims,
+            unit=field.unit,
+            dtype=field.dtype if self.method == "nearest" else array.dtype,
+            valid=valid,
+            vdim_mapping=field.vdim_mapping,
+        )
+
+    def __repr__(self):
+        """Representation string.
+
+        Returns
+        -------
+        str
+
+            Representation string.
+
+        Example
+        -------
+        1. Getting representation string.
+
+        >>> import discretisedfield as df
+        ...
+        >>> mesh = df.Mesh(p1=(0, 0, 0), p2=(2, 2, 1), cell=(1, 1, 1))
+        >>> df.Remapper(mesh, mesh)
+        Remapper(Mesh(...), Mesh(...), method='nearest')
+
+        """
+        return f"Remapper({self.src_mesh!r}, {self.dst_mesh!r}, method={self.method!r})"
+
+    def _remap(self, array):
+        """Remap an array of shape ``(*src_mesh.n, ...)``."""
+        if self.method == "nearest":
+            return array[np.ix_(*self._indices)]
+        value_shape = array.shape[len(self.src_mesh.n) :]
+        values = array.reshape(self._matrix.shape[1], -1)
+        return (self._matrix @ values).reshape(*self.dst_mesh.n, *value_shape)
+
+
+def _geometry(mesh):
+    """Hashable description of the geometry of a mesh."""
+    return (
+        tuple(map(float, mesh.region.pmin)),
+        tuple(map(float, mesh.region.pmax)),
+        tuple(map(int, mesh.n)),
+    )
+
+
+@functools.lru_cache(maxsize=16)
+def _nearest_indices(src_geometry, dst_geometry):
+    """Indices of the nearest source cells along each axis."""
+    # exactly one entry per row, i.e. the column indices of the one-dimensional
+    # weight matrices are the indices of the nearest source cells
+    return tuple(
+        _axis_weights("nearest", src, dst).indices
+        for src, dst in zip(zip(*src_geometry), zip(*dst_geometry))
+    )
+
+
+@functools.lru_cache(maxsize=16)
+def _remapping_matrix(method, src_geometry, dst_geometry):
+    """Sparse weight matrix for remapping."""
+    matrix = None
+    for src, dst in zip(zip(*src_geometry), zip(*dst_geometry)):
+        axis_weights = _axis_weights(method, src, dst)
+        matrix = (
+            axis_weights
+            if matrix is None
+            else sp.kron(matrix, axis_weights, format="csr")
+        )
+    return sp.csr_array(matrix)
+
+
+def _axis_weights(method, src, dst):
+    """One-dimensional weight matrix of shape ``(dst_n, src_n)`` along one axis.
+
+    ``src`` and ``dst`` are tuples ``(pmin, pmax, n)``.
+    """
+    src_pmin, src_pmax, src_n = src
+    dst_pmin, dst_pmax, dst_n = dst
+    # same coordinates as in Mesh.cells and Mesh.vertices
+    src_cells = np.linspace(
+        src_pmin + (src_pmax - src_pmin) / src_n / 2,
+        src_pmax - (src_pmax - src_pmin) / src_n / 2,
+        src_n,
+    )
+    dst_cells = np.linspace(
+        dst_pmin + (dst_pmax - dst_pmin) / dst_n / 2,
+        dst_pmax - (dst_pmax - dst_pmin) / dst_n / 2,
+        dst_n,
+    )
+    rows = np.arange(dst_n)
+
+    if method == "nearest":
+        # same tie-breaking as pandas/xarray: if both neighbours have the same
+        # distance the one with the larger coordinate is used
+        left = np.searchsorted(src_cells, dst_cells, side="right") - 1
+        right = np.searchsorted(src_cells, dst_cells, side="left")
+        left_distance = np.abs(src_cells[np.maximum(left, 0)] - dst_cells)
+        right_distance = np.abs(src_cells[np.minimum(right, src_n - 1)] - dst_cells)
+        use_left = ((left_distance < right_distance) | (right == src_n)) & (left >= 0)
+        cols = np.where(use_left, left, right)
+        values = np.ones(dst_n)
+    elif method == "linear":
+        if src_n == 1:
+            cols = np.zeros(dst_n, dtype=int)
+            values = np.ones(dst_n)
+        else:
+            left = np.clip(
+                np.searchsorted(src_cells, dst_cells, side="right") - 1, 0, src_n - 2
+            )
+            t = (dst_cells - src_cells[left]) / (src_cells[left + 1] - src_cells[left])
+            t = np.clip(t, 0, 1)
+            rows = np.concatenate([rows, rows])
+            cols = np.concatenate([left, left + 1])
+            values = np.concatenate([1 - t, t])
+    else:  # conservative
+        src_edges = np.linspace(src_pmin, src_pmax, src_n + 1)
+        dst_edges = np.linspace(dst_pmin, dst_pmax, dst_n + 1)
+        # split the destination cells into segments that overlap with exactly one
+        # source cell
+        breaks = np.union1d(src_edges, dst_edges)
+        breaks = breaks[(breaks >= dst_edges[0]) & (breaks <= dst_edges[-1])]
+        midpoints = (breaks[:-1] + breaks[1:]) / 2
+        rows = np.clip(np.searchsorted(dst_edges, midpoints) - 1, 0, dst_n - 1)
+        cols = np.clip(np.searchsorted(src_edges, midpoints) - 1, 0, src_n - 1)
+        values = np.diff(breaks) / np.diff(dst_edges)[rows]
+
+    matrix = sp.csr_array((values, (rows, cols)), shape=(dst_n, src_n))
+    matrix.sum_duplicates()
+    matrix.eliminate_zeros()
+    return matrix
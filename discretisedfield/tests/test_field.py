@@ -4,6 +4,7 @@ import random
 import re
 import sys
 import tempfile
+import tracemalloc
 import types
 
 import holoviews as hv
@@ -13,6 +14,7 @@ import numpy as np
 import pytest
 import pyvista as pv
 import scipy.fft as spfft
+import scipy.interpolate
 import vtk
 import xarray as xr
 
@@ -265,6 +267,58 @@ def test_set_with_ndarray(valid_mesh):
         f.update_field_values(np.ones((2, 2)))
 
 
+def test_set_with_ndarray_no_copy(valid_mesh):
+    array = np.random.random((*valid_mesh.n, 3))
+    f = df.Field(valid_mesh, nvdim=3, value=array, copy=False)
+    assert f.array is array
+    f = df.Field(valid_mesh, nvdim=3, value=array)
+    assert not np.shares_memory(f.array, array)
+
+    # scalar field from array without the last dimension
+    array = np.random.random(valid_mesh.n)
+    f = df.Field(valid_mesh, nvdim=1, value=array, copy=False)
+    assert np.shares_memory(f.array, array)
+
+    # copies are still required for a different dtype or shape
+    array = np.ones((*valid_mesh.n, 3), dtype=np.int64)
+    f = df.Field(valid_mesh, nvdim=3, value=array, copy=False)
+    assert f.array.dtype == np.float64
+    assert not np.shares_memory(f.array, array)
+    f = df.Field(valid_mesh, nvdim=3, value=array, dtype=np.int64, copy=False)
+    assert f.array is array
+
+
+def test_views(valid_mesh):
+    f = df.Field(valid_mesh, nvdim=3, value=np.random.random((*valid_mesh.n, 3)))
+
+    # components
+    x = f.x
+    assert np.shares_memory(x.array, f.array)
+    x.array[...] = 5
+    assert np.all(f.array[..., 0] == 5)
+    x.update_field_values(1)  # replaces the array of x only
+    assert np.all(f.array[..., 0] == 5)
+
+    # subregions
+    region = df.Region(
+        p1=valid_mesh.region.pmin, p2=valid_mesh.region.pmin + valid_mesh.cell
+    )
+    sub = f[region]
+    assert np.shares_memory(sub.array, f.array)
+    sub.array[...] = -1
+    assert np.array_equal(f.array[(0,) * valid_mesh.region.ndim], (-1, -1, -1))
+
+    # sel
+    if valid_mesh.region.ndim > 1:
+        dim = valid_mesh.region.dims[0]
+        selected = f.sel(dim)
+        assert np.shares_memory(selected.array, f.array)
+
+    # derived fields do not share memory with the original field
+    for derived in [f.norm, f + 1, -f, abs(f), f.orientation, f.dot(f), f << f.x]:
+        assert not np.shares_memory(derived.array, f.array)
+
+
 @pytest.mark.parametrize("func, dtype", sfuncs)
 def test_set_with_callable_scalar(valid_mesh, func, dtype):
     f = df.Field(valid_mesh, nvdim=1, value=func, dtype=dtype)
@@ -298,6 +352,133 @@ def test_set_with_callable_vector(valid_mesh, func, dtype):
     assert np.all(f(rp) == func(rp))
 
 
+def test_set_with_callable_vectorized(valid_mesh):
+    def scalar_func(point):
+        return sum(point) + 1
+
+    def vector_func(point):
+        return (point[0], 2 * point[-1], -1)
+
+    f_loop = df.Field(valid_mesh, nvdim=1, value=scalar_func)
+    f_vec = df.Field(valid_mesh, nvdim=1, value=scalar_func, vectorized=True)
+    assert f_vec.array.shape == (*valid_mesh.n, 1)
+    assert np.array_equal(f_vec.array, f_loop.array)
+
+    f_loop = df.Field(valid_mesh, nvdim=3, value=vector_func)
+    f_vec = df.Field(valid_mesh, nvdim=3, value=vector_func, vectorized=True)
+    assert f_vec.array.shape == (*valid_mesh.n, 3)
+    assert np.array_equal(f_vec.array, f_loop.array)
+
+    # array with components along the last axis
+    f_vec.update_field_values(
+        lambda p: np.stack(np.broadcast_arrays(p[0], p[-1], 1.0), axis=-1),
+        vectorized=True,
+    )
+    assert np.array_equal(f_vec.array[..., -1], np.ones(valid_mesh.n))
+
+    # norm and valid
+    f_vec = df.Field(
+        valid_mesh,
+        nvdim=3,
+        value=vector_func,
+        norm=lambda p: 2,
+        valid=lambda p: p[0] < valid_mesh.region.center[0],
+        vectorized=True,
+    )
+    f_loop = df.Field(
+        valid_mesh,
+        nvdim=3,
+        value=vector_func,
+        norm=lambda p: 2,
+        valid=lambda p: p[0] < valid_mesh.region.center[0],
+    )
+    assert np.allclose(f_vec.array, f_loop.array)
+    assert np.array_equal(f_vec.valid, f_loop.valid)
+
+    with pytest.raises(ValueError):
+        df.Field(valid_mesh, nvdim=3, value=lambda p: (1, 2), vectorized=True)
+
+
+def test_set_with_callable_auto_vectorized(monkeypatch, caplog):
+    mesh = df.Mesh(p1=(0, 0, 0), p2=(10, 8, 6), cell=(1, 1, 1))
+    monkeypatch.setattr(df.field, "_CALLABLE_CHUNK_SIZE", 100)
+
+    calls = []
+
+    def elementwise(point):
+        calls.append(point)
+        x, y, z = point
+        return (x * y, np.sin(z), 1)
+
+    def branching(point):
+        x, y, z = point
+        return (0, 0, 1) if x < 5 else (0, 0, -1)
+
+    def reducing(point):
+        # not element-wise, must not be vectorized
+        return np.mean(point[0]) + point[1]
+
+    f_loop = df.Field(mesh, nvdim=3, value=elementwise, vectorized=False)
+    calls.clear()
+    with caplog.at_level("DEBUG", logger="discretisedfield.field"):
+        f_auto = df.Field(mesh, nvdim=3, value=elementwise)
+    assert np.array_equal(f_auto.array, f_loop.array)
+    # probe: 8 cells individually + 1 vectorized call, then 5 slabs of 2 layers
+    assert len(calls) == 8 + 1 + 5
+    assert sum("Evaluated" in r.message for r in caplog.records) == 5
+
+    f_loop = df.Field(mesh, nvdim=3, value=branching, vectorized=False)
+    f_auto = df.Field(mesh, nvdim=3, value=branching)
+    assert np.array_equal(f_auto.array, f_loop.array)
+
+    f_loop = df.Field(mesh, nvdim=1, value=reducing, vectorized=False)
+    f_auto = df.Field(mesh, nvdim=1, value=reducing)
+    assert np.array_equal(f_auto.array, f_loop.array)
+
+    # callable "default" in a dict
+    mesh.subregions = {"r1": df.Region(p1=(0, 0, 0), p2=(4, 8, 6))}
+    for func in [elementwise, branching]:
+        f_loop = df.Field(
+            mesh, nvdim=3, value={"r1": (1, 2, 3), "default": func}, vectorized=False
+        )
+        f_auto = df.Field(mesh, nvdim=3, value={"r1": (1, 2, 3), "default": func})
+        assert np.array_equal(f_auto.array, f_loop.array)
+        assert np.array_equal(
+            f_auto.array[:4], np.broadcast_to((1, 2, 3), (4, 8, 6, 3))
+        )
+        assert np.array_equal(
+            f_auto.array[4:], df.Field(mesh, nvdim=3, value=func).array[4:]
+        )
+
+
+def _branching_value(point):
+    # module-level to be picklable for process pools
+    return (point[0], -1j * point[-1], 1) if point[0] > 0 else (0, 0, 2)
+
+
+def _raising_value(point):
+    raise RuntimeError("value cannot be computed")
+
+
+@pytest.mark.parametrize(
+    "nvdim, dtype, value",
+    [(1, None, np.linalg.norm), (3, np.complex128, _branching_value)],
+)
+def test_set_with_callable_workers(valid_mesh, nvdim, dtype, value):
+    kwargs = {"nvdim": nvdim, "dtype": dtype, "vectorized": False}
+    f_serial = df.Field(valid_mesh, value=value, **kwargs)
+    f_parallel = df.Field(valid_mesh, value=value, workers=2, **kwargs)
+    assert f_parallel.array.dtype == f_serial.array.dtype
+    assert np.array_equal(f_parallel.array, f_serial.array)
+
+    field = df.Field(valid_mesh, nvdim=1, dtype=np.int32)
+    field.update_field_values(lambda p: 5, workers=1)
+    assert np.array_equal(field.array, np.full((*valid_mesh.n, 1), 5))
+
+    with pytest.raises(RuntimeError):
+        df.Field(valid_mesh, nvdim=1, value=_raising_value, vectorized=False, workers=2)
+
+
 def test_set_with_dict():
     # 3d space with two subregions; one constant and one callable value
     p1 = (0, 0, 0)
@@ -347,6 +528,100 @@ def test_set_with_dict():
     assert np.allclose(field(8e-9), (9e-9, 0, 0), atol=0)
 
 
+@pytest.mark.parametrize("vectorized", [None, False])
+def test_set_with_dict_mask(vectorized):
+    # 3d space with overlapping subregions; uncovered cells use callable default
+    mesh = df.Mesh(
+        p1=(0, 0, 0),
+        p2=(10, 8, 6),
+        cell=(1, 1, 1),
+        subregions={
+            "r1": df.Region(p1=(0, 0, 0), p2=(4, 8, 6)),
+            "r2": df.Region(p1=(2, 0, 0), p2=(6, 4, 6)),
+            "r3": df.Region(p1=(8, 0, 0), p2=(10, 8, 6)),
+        },
+    )
+    x_index = np.arange(10)[:, None, None, None]
+
+    # integer and boolean dtypes are supported
+    field = df.Field(
+        mesh,
+        nvdim=1,
+        value={"r1": 1, "r2": 2, "default": lambda p: 3 * p[0]},
+        dtype=np.int64,
+        vectorized=vectorized,
+    )
+    assert field.array.dtype == np.int64
+    assert np.all(field.array[:4] == 1)
+    assert np.all(field.array[4:6, :4] == 2)
+    assert np.array_equal(
+        field.array[4:6, 4:], np.broadcast_to(3 * x_index[4:6] + 1, (2, 4, 6, 1))
+    )
+    assert np.array_equal(
+        field.array[6:], np.broadcast_to(3 * x_index[6:] + 1, (4, 8, 6, 1))
+    )
+
+    field = df.Field(
+        mesh,
+        nvdim=1,
+        value={"r3": False, "default": lambda p: p[1] < 4},
+        dtype=bool,
+        vectorized=vectorized,
+    )
+    assert not field.array[8:].any()
+    assert field.array[:8, :4].all()
+    assert not field.array[:8, 4:].any()
+
+    # nan values inside a subregion do not require a default
+    mesh.subregions = {
+        "r1": mesh.subregions["r1"],
+        "r4": df.Region(p1=(4, 0, 0), p2=(10, 8, 6)),
+    }
+    field = df.Field(mesh, nvdim=1, value={"r1": np.nan, "r4": 1})
+    assert np.isnan(field.array[:4]).all()
+    assert np.all(field.array[4:] == 1)
+
+
+def test_set_with_dict_labels():
+    mesh = df.Mesh(p1=(0, 0, 0), p2=(10, 8, 6), cell=(1, 1, 1))
+    labels = np.random.default_rng(0).integers(0, 4, size=mesh.n)
+    mesh.set_subregion_labels(labels, names=["a", "b", "c"])
+
+    # constant, callable, and array values only in the cells of the subregions
+    array = np.random.default_rng(1).random((*mesh["c"].n, 2))
+    field = df.Field(
+        mesh,
+        nvdim=2,
+        value={"a": (1, 2), "b": lambda p: (p[0], 0), "c": array, "default": (5, 5)},
+    )
+    x = np.broadcast_to(mesh.cells.x[:, None, None], mesh.n)
+    assert np.all(field.array[labels == 0] == (5, 5))
+    assert np.all(field.array[labels == 1] == (1, 2))
+    assert np.array_equal(field.array[labels == 2, 0], x[labels == 2])
+    slices = mesh.region2slices(mesh.subregions["c"])
+    assert np.array_equal(
+        field.array[slices][labels[slices] == 3], array[labels[slices] == 3]
+    )
+
+    with pytest.raises(KeyError):
+        df.Field(mesh, nvdim=1, value={"a": 1, "b": 2})
+
+    # overlapping boxes: a subregion without value does not take precedence
+    mesh = df.Mesh(
+        p1=(0, 0),
+        p2=(4, 2),
+        cell=(1, 1),
+        subregions={
+            "r1": df.Region(p1=(0, 0), p2=(2, 2)),
+            "r2": df.Region(p1=(1, 0), p2=(4, 2)),
+        },
+    )
+    field = df.Field(mesh, nvdim=1, value={"r2": 2, "default": 0})
+    assert np.array_equal(field.array[:, 0, 0], [0, 2, 2, 2])
+    field = df.Field(mesh, nvdim=1, value={"r1": 1, "r2": 2})
+    assert np.array_equal(field.array[:, 0, 0], [1, 1, 2, 2])
+
+
 def test_set_exception(valid_mesh):
     with pytest.raises(TypeError):
         df.Field(valid_mesh, nvdim=3, value="meaningless_string")
@@ -463,6 +738,191 @@ def test_valid_single_value(valid_mesh, nvdim):
     assert np.array_equal(f.valid, f._valid_as_field.array.squeeze(axis=-1))
 
 
+def test_valid_all_valid_sentinel(valid_mesh):
+    f = df.Field(valid_mesh, nvdim=3, value=(1, 2, 3))
+    # no mask is stored if all values are valid
+    assert f._valid is None
+    for derived in [
+        f + f,
+        2 * f,
+        f.x,
+        f.norm,
+        f.dot(f),
+        f << f.x,
+        -f,
+        f.sel(valid_mesh.region.dims[0]),
+    ]:
+        if isinstance(derived, df.Field):
+            assert derived._valid is None
+
+    g = df.Field(valid_mesh, nvdim=3, value=(1, 2, 3))
+    g.valid[(0,) * valid_mesh.region.ndim] = False  # the array is created on access
+    assert g._valid is not None
+    assert not g.valid.all()
+    for res in [f + g, g + f, f.dot(g), f << g.x]:
+        assert np.array_equal(res.valid, g.valid)
+        assert not np.shares_memory(res.valid, g.valid)
+    res = f + g
+    res.valid[...] = False
+    assert g.valid.sum() == valid_mesh.n.prod() - 1
+    assert (f + g).valid.sum() == valid_mesh.n.prod() - 1
+
+    # results of operations on a single field do not share its valid array
+    for res in [
+        g + 1,
+        1 - g,
+        g * (1, 2, 3),
+        -g,
+        abs(g),
+        g.norm,
+        g.orientation,
+        g.dot((1, 0, 0)),
+        g.cross((1, 0, 0)),
+        g.angle((1, 0, 0)),
+        g.real,
+        g.conjugate,
+        g.diff(valid_mesh.region.dims[0]),
+        g.x.grad,
+    ]:
+        assert np.array_equal(res.valid, g.valid)
+        assert not np.shares_memory(res.valid, g.valid)
+        res.valid[...] = False
+        assert g.valid.sum() == valid_mesh.n.prod() - 1
+    # views share the valid array
+    assert np.shares_memory(g.x.valid, g.valid)
+
+    g.valid = None
+    assert g._valid is None
+    assert g.valid.all()
+
+
+def test_from_array():
+    mesh = df.Mesh(p1=(0, 0, 0), p2=(10, 5, 2), n=(5, 5, 2))
+    array = np.ones((*mesh.n, 3))
+
+    f = df.Field._from_array(mesh, array)
+    assert isinstance(f, df.Field)
+    assert f.array is array  # no copy
+    assert f.nvdim == 3
+    assert f.vdims == ["x", "y", "z"]
+    assert f.vdim_mapping == dict(zip(f.vdims, mesh.region.dims))
+    assert f.unit is None
+    # None is the all-valid sentinel
+    assert f._valid is None
+    assert f.valid.dtype == bool
+    assert f.valid.shape == tuple(mesh.n)
+    assert f.valid.all()
+    assert f.allclose(df.Field(mesh, nvdim=3, value=(1, 1, 1)))
+
+    valid = np.zeros(mesh.n, dtype=bool)
+    valid[0] = True
+    f = df.Field._from_array(mesh, array, valid=valid, vdims=["a", "b", "c"])
+    assert f._valid is valid
+    assert f.vdims == ["a", "b", "c"]
+    assert f.vdim_mapping == dict(zip(f.vdims, mesh.region.dims))
+
+    # dtype: same as in __init__, i.e. at least float64 unless specified explicitly
+    for dtype, expected in [
+        (np.int32, np.float64),
+        (np.float32, np.float64),
+        (np.float64, np.float64),
+        (np.complex64, np.complex64),
+        (np.complex128, np.complex128),
+    ]:
+        array = np.ones((*mesh.n, 1), dtype=dtype)
+        f = df.Field._from_array(mesh, array)
+        assert f.array.dtype == expected
+        assert f.array.dtype == df.Field(mesh, nvdim=1, value=array).array.dtype
+        assert f.vdims is None
+        assert f.vdim_mapping == {}
+    f = df.Field._from_array(mesh, np.ones((*mesh.n, 1)), dtype=np.float32)
+    assert f.array.dtype == np.float32
+    assert f.dtype == np.float32
+
+    # subclasses with their own __init__ are created via __init__
+    class MyField(df.Field):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.initialised = True
+
+    f = MyField._from_array(mesh, array, valid=valid)
+    assert isinstance(f, MyField)
+    assert f.initialised
+    assert np.array_equal(f.valid, valid)
+    assert isinstance(MyField._from_array(mesh, np.ones((*mesh.n, 3))), MyField)
+
+
+def test_derived_cache(monkeypatch):
+    mesh = df.Mesh(p1=(0, 0, 0), p2=(10, 10, 10), n=(5, 5, 5))
+    field = df.Field(mesh, nvdim=3, value=(3, 0, 4))
+
+    # cached values are reused until the field changes
+    assert field.norm._array is field.norm._array
+    assert field.orientation._array is field.orientation._array
+    assert not field.norm._array.flags.writeable
+    assert np.allclose(field.orientation.mean(), (0.6, 0, 0.8))
+
+    field += 1
+    assert np.allclose(field.norm.mean(), np.sqrt(16 + 1 + 25))
+    field.array = (0, 0, 2)
+    assert np.allclose(field.norm.mean(), 2)
+    field.norm = 5
+    assert np.allclose(field.norm.mean(), 5)
+
+    # fields returned from the cache are copied on write
+    norm1 = field.norm
+    norm2 = field.norm
+    norm1 *= 2
+    assert np.allclose(norm1.mean(), 10)
+    assert np.allclose(norm2.mean(), 5)
+    norm2.array *= 3
+    assert np.allclose(norm2.mean(), 15)
+    assert np.allclose(field.norm.mean(), 5)
+    assert field.norm._array is field.norm._array
+    orientation = field.orientation
+    orientation.z.array[...] = 0  # the component is copied, not the orientation
+    assert np.allclose(orientation.mean(), (0, 0, 1))
+    assert np.allclose(field.orientation.mean(), (0, 0, 1))
+
+    # nothing is cached once the array has been exposed
+    array = field.array
+    assert np.allclose(field.norm.mean(), 5)
+    array[0] = (0, 0, 3)
+    assert np.allclose(field.norm._array[0], 3)
+    assert field.norm._array is not field.norm._array
+    field.array = (0, 0, 2)  # a new array
+    assert field.norm._array is field.norm._array
+    array[...] = 0
+    assert np.allclose(field.norm.mean(), 2)
+
+    field = df.Field(mesh, nvdim=3, value=np.ones((*mesh.n, 3)), copy=False)
+    assert field.norm._array is not field.norm._array
+
+    # views share the version with the original field
+    field = df.Field(mesh, nvdim=3, value=(0, 0, 2))
+    assert np.allclose(field.norm.mean(), 2)
+    field.z.array[...] = 1
+    assert np.allclose(field.norm.mean(), 1)
+    field.array = (0, 0, 1)
+    assert np.allclose(field.norm.mean(), 1)
+    field[df.Region(p1=(0, 0, 0), p2=(10, 10, 2))].x.array[...] = 1
+    assert np.allclose(field.norm._array[:, :, 0], np.sqrt(2))
+    field.array = field._array.copy()
+    assert field.norm._array is field.norm._array
+    field.sel(x=1).y.array[...] = 1
+    assert np.allclose(field.norm._array[0, :, 0], np.sqrt(3))
+
+    # memory limit
+    assert df.Field.max_cache_nbytes is not None
+    field = df.Field(mesh, nvdim=3, value=(3, 0, 4))
+    monkeypatch.setattr(df.Field, "max_cache_nbytes", 0)
+    assert field.norm._array is not field.norm._array
+    assert field.norm._array.flags.writeable
+    monkeypatch.setattr(df.Field, "max_cache_nbytes", field.norm._array.nbytes)
+    assert field.norm._array is field.norm._array
+    assert field.orientation._array is not field.orientation._array
+
+
 @pytest.mark.parametrize("ndim", [1, 2, 3, 4])
 @pytest.mark.parametrize("nvdim", [1, 2, 3, 4])
 def test_valid_set_on_norm(ndim, nvdim):
@@ -808,6 +1268,152 @@ def test_call(ndim, nvdim):
     with pytest.raises(TypeError):
         f(None)
 
+    # multiple points
+    points = np.random.default_rng(0).random((50, ndim)) * 10
+    points[:2] = [[0.0] * ndim, [10.0] * ndim]
+    values = f(points)
+    assert values.shape == (50, nvdim)
+    assert np.array_equal(values, [f(point) for point in points])
+    # view of a larger field
+    sub = f[df.Region(p1=(2.0,) * ndim, p2=(8.0,) * ndim)]
+    points = 2 + np.random.default_rng(1).random((50, ndim)) * 6
+    assert np.array_equal(sub(points), [sub(point) for point in points])
+
+    with pytest.raises(ValueError):
+        f(np.full((2, ndim), -1.0))
+    with pytest.raises(ValueError):
+        f(np.zeros((2, ndim + 1)))
+
+
+@pytest.mark.parametrize("ndim", [1, 2, 3])
+def test_interp(ndim, monkeypatch):
+    mesh = df.Mesh(p1=(0,) * ndim, p2=(10,) * ndim, n=(10, 5, 1)[:ndim])
+    field = df.Field(
+        mesh, nvdim=2, value=lambda p: (sum(p), -2 * p[0]), vectorized=True
+    )
+    rng = np.random.default_rng(0)
+    points = rng.random((200, ndim)) * 10
+    points[:2] = [[0.0] * ndim, [10.0] * ndim]
+
+    # nearest is the same as sampling the cells
+    assert np.array_equal(field.interp(points, method="nearest"), field(points))
+
+    # linear functions are reproduced between the outermost cell midpoints
+    lower = mesh.region.pmin + mesh.cell / 2
+    upper = mesh.region.pmax - mesh.cell / 2
+    clipped = np.clip(points, lower, upper)
+    if ndim == 3:
+        clipped[:, 2] = 5  # single cell
+    expected = np.stack([clipped.sum(axis=1), -2 * clipped[:, 0]], axis=-1)
+    values = field.interp(points)
+    assert values.shape == (200, 2)
+    assert np.allclose(values, expected, rtol=1e-12, atol=1e-12)
+    assert np.allclose(field.interp(points[5]), expected[5], rtol=1e-12, atol=1e-12)
+    assert np.allclose(field.interp(points, method="cubic"), expected, rtol=1e-12)
+
+    # thread-parallel evaluation
+    for method in ["nearest", "linear", "cubic"]:
+        assert np.array_equal(
+            field.interp(points, method=method, workers=3),
+            field.interp(points, method=method),
+        )
+
+    # invalid cells are replaced by the nearest valid cell
+    field.valid = mesh.coordinate_field().x.array[..., 0] < 6
+    inside = np.clip(points, lower, (5.5,) + tuple(upper[1:]))
+    assert np.allclose(field.interp(points), field.interp(inside), rtol=1e-12)
+    assert np.allclose(field.interp(points)[:, 1], -2 * inside[:, 0], rtol=1e-12)
+    field.valid = True
+
+    # the interpolator is cached until the values or the valid cells change
+    field += 0
+    calls = []
+    interpolator = df.field._Interpolator
+    monkeypatch.setattr(
+        df.field,
+        "_Interpolator",
+        lambda *args: calls.append(args[-1]) or interpolator(*args),
+    )
+    field.interp(points)
+    field.interp(points[:3])
+    field.interp(points, method="nearest")
+    assert calls == ["linear", "nearest"]
+    field.valid[(0,) * ndim] = False
+    field.interp(points)
+    assert calls == ["linear", "nearest", "linear"]
+    field.valid = True
+    field.array += 1
+    assert np.allclose(field.interp(points), expected + 1, rtol=1e-12, atol=1e-12)
+    assert calls == ["linear", "nearest", "linear", "linear"]
+
+    with pytest.raises(ValueError):
+        field.interp(points, method="quadratic")
+    with pytest.raises(ValueError):
+        field.interp(np.full((2, ndim), -1.0))
+    with pytest.raises(ValueError):
+        field.interp(np.zeros((2, ndim + 1)))
+    with pytest.raises(TypeError):
+        field.interp(np.full((2, ndim), "a"))
+    with pytest.raises(ValueError):
+        df.Field(mesh, nvdim=1, valid=False).interp(points)
+    small = df.Mesh(p1=(0,) * ndim, p2=(10,) * ndim, n=(10, 3, 1)[:ndim])
+    if ndim > 1:
+        with pytest.raises(ValueError):
+            df.Field(small, nvdim=1).interp(points, method="cubic")
+
+
+def test_interp_old_scipy(monkeypatch):
+    # NdBSpline is not available in scipy<1.12
+    monkeypatch.delattr(scipy.interpolate, "NdBSpline")
+    mesh = df.Mesh(p1=(0, 0), p2=(10, 10), n=(10, 10))
+    field = df.Field(mesh, nvdim=1, value=lambda p: p[0] * p[1])
+    assert np.allclose(field.interp([[2, 3]], method="linear"), 6)
+    with pytest.raises(ImportError, match="scipy>=1.12"):
+        field.interp([[2, 3]], method="cubic")
+
+
+@pytest.mark.parametrize("ndim", [1, 2, 3])
+def test_iter_blocks(ndim):
+    mesh = df.Mesh(p1=(0,) * ndim, p2=(10,) * ndim, n=(5, 4, 3)[:ndim])
+    field = df.Field(mesh, nvdim=2, value=np.random.default_rng(0).random((*mesh.n, 2)))
+    points = np.array(list(mesh))
+    values = np.array([field(point) for point in points])
+    assert np.array_equal(np.array(list(field)), values)
+
+    for max_cells in [1, 5, 12, 10**6]:
+        blocks = list(field.iter_blocks(max_cells=max_cells))
+        for coords, block_values in blocks:
+            assert coords.shape[1] == ndim
+            assert block_values.shape == (len(coords), 2)
+        assert np.array_equal(np.concatenate([b[0] for b in blocks]), points)
+        assert np.array_equal(np.concatenate([b[1] for b in blocks]), values)
+
+    # the values are a copy
+    for _, block_values in field.iter_blocks():
+        block_values[...] = -1
+    assert np.array_equal(np.array(list(field)), values)
+
+    # non-contiguous arrays (component views) are not copied for every block
+    component = field.x
+    assert not component._array.flags.c_contiguous
+    blocks = list(component.iter_blocks(max_cells=5))
+    assert np.array_equal(np.concatenate([b[1] for b in blocks]), values[:, :1])
+    for _, block_values in component.iter_blocks(max_cells=5):
+        block_values[...] = -1
+    assert np.array_equal(np.array(list(component)), values[:, :1])
+
+
+def test_iter_blocks_memory():
+    mesh = df.Mesh(p1=(0, 0, 0), p2=(10, 10, 2000), n=(10, 10, 2000))
+    field = df.Field(mesh, nvdim=3, value=(1, 2, 3))
+    component = field.y
+    tracemalloc.start()
+    for _, values in component.iter_blocks(max_cells=1000):
+        assert np.all(values == 2)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    assert peak < 0.1 * component._array.nbytes
+
 
 def test_mean():
     tol = 1e-12
@@ -883,6 +1489,198 @@ def test_mean():
         f.mean(direction=["x", "y", "z", "z"])
 
 
+@pytest.mark.parametrize("reduction", ["mean", "sum", "std", "min", "max"])
+def test_masked_reductions(reduction):
+    subregions = {"sr": df.Region(p1=(2, 0, 0), p2=(8, 6, 4))}
+    mesh = df.Mesh(p1=(0, 0, 0), p2=(10, 8, 4), n=(10, 8, 2), subregions=subregions)
+    rng = np.random.default_rng(0)
+    f = df.Field(
+        mesh,
+        nvdim=2,
+        value=rng.normal(size=(*mesh.n, 2)),
+        valid=rng.random(mesh.n) < 0.7,
+        unit="A/m",
+    )
+    where = rng.random(mesh.n) < 0.5
+    func = getattr(np, reduction)
+
+    assert np.allclose(getattr(f, reduction)(), func(f.array, axis=(0, 1, 2)))
+    assert np.allclose(
+        getattr(f, reduction)(valid_only=True), func(f.array[f.valid], axis=0)
+    )
+    assert np.allclose(getattr(f, reduction)(where=where), func(f.array[where], axis=0))
+    assert np.allclose(
+        getattr(f, reduction)(where=df.Field(mesh, nvdim=1, value=where)),
+        func(f.array[where], axis=0),
+    )
+    assert np.allclose(
+        getattr(f, reduction)(where=where, valid_only=True),
+        func(f.array[where & f.valid], axis=0),
+    )
+    assert np.allclose(
+        getattr(f, reduction)(subregion="sr"), func(f["sr"].array, axis=(0, 1, 2))
+    )
+    assert np.allclose(
+        getattr(f, reduction)(where=where, subregion="sr"),
+        func(f.array[2:8, :6][where[2:8, :6]], axis=0),
+    )
+
+    # directional reductions
+    res = getattr(f, reduction)("z", where=where, subregion="sr")
+    assert isinstance(res, df.Field)
+    assert res.mesh.region.dims == ("x", "y")
+    assert res.mesh.allclose(mesh["sr"].sel("z"))
+    assert res.unit == "A/m"
+    mask = where[2:8, :6]
+    assert np.array_equal(res.valid, mask.any(axis=2))
+    for i, j in zip(*np.nonzero(mask.any(axis=2))):
+        expected = func(f.array[2 + i, j][mask[i, j]], axis=0)
+        assert np.allclose(res.array[i, j], expected)
+    res = getattr(f, reduction)(["x", "z"], valid_only=True)
+    assert res.mesh.region.dims == ("y",)
+    for j in range(mesh.n[1]):
+        expected = func(f.array[:, j][f.valid[:, j]], axis=0)
+        assert np.allclose(res.array[j], expected)
+    assert np.allclose(getattr(f, reduction)("x").array, func(f.array, axis=0))
+
+    # no cells
+    where = np.zeros(mesh.n, dtype=bool)
+    if reduction in ["min", "max"]:
+        with pytest.raises(ValueError):
+            getattr(f, reduction)(where=where)
+    elif reduction == "sum":
+        assert np.array_equal(f.sum(where=where), [0, 0])
+    else:
+        assert np.all(np.isnan(getattr(f, reduction)(where=where)))
+    assert not np.any(getattr(f, reduction)("x", where=where).valid)
+
+    with pytest.raises(ValueError):
+        getattr(f, reduction)(where=np.ones((2, 2)))
+    with pytest.raises(ValueError):
+        getattr(f, reduction)(where=f)
+    with pytest.raises(KeyError):
+        getattr(f, reduction)(subregion="a")
+
+
+def test_labelled_subregion_reductions():
+    # L-shaped subregion, i.e. not its bounding box
+    mesh = df.Mesh(p1=(0, 0), p2=(4, 4), cell=(1, 1))
+    labels = np.zeros(mesh.n, dtype=int)
+    labels[0, :] = labels[:, 0] = 1
+    labels[2:, 2:] = 2
+    mesh.set_subregion_labels(labels, names=["a", "b"])
+    array = np.where(labels == 1, 1.0, 100.0)[..., np.newaxis]
+    array[0, 0] = 3
+    f = df.Field(mesh, nvdim=1, value=array)
+    cells = labels == 1
+
+    assert np.allclose(f.mean(subregion="a"), np.mean(array[cells]))
+    assert np.allclose(f.sum(subregion="a"), 9)
+    assert np.allclose(f.integrate(subregion="a"), 9 * mesh.dV)
+    assert np.allclose(f.std(subregion="a"), np.std(array[cells]))
+    assert np.allclose(f.max(subregion="a"), 3)
+    assert np.allclose(f.min(subregion="b"), 100)
+    assert np.allclose(f.stats(subregion="a")["mean"], np.mean(array[cells]))
+    where = np.zeros(mesh.n, dtype=bool)
+    where[0] = True
+    assert np.allclose(f.sum(where=where, subregion="a"), 6)
+    res = f.sum("y", subregion="a")
+    assert np.allclose(res.array[..., 0], [6, 1, 1, 1])
+
+    sub = f["a"]
+    assert np.array_equal(sub.valid, cells)
+    assert np.allclose(sub.mean(valid_only=True), np.mean(array[cells]))
+    sub = f["b"]
+    assert sub.mesh.n.tolist() == [2, 2]
+    assert sub.valid.all()
+
+    # box subregions are not affected
+    mesh.subregions = {"a": df.Region(p1=(0, 0), p2=(1, 4))}
+    f = df.Field(mesh, nvdim=1, value=array)
+    assert np.allclose(f.sum(subregion="a"), 6)
+    assert f["a"].valid.all()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 50, 2**16])
+def test_stats(monkeypatch, chunk_size):
+    monkeypatch.setattr(df.field, "_REDUCTION_CHUNK_SIZE", chunk_size)
+    mesh = df.Mesh(p1=(0, 0, 0), p2=(10, 8, 4), n=(10, 8, 2))
+    rng = np.random.default_rng(0)
+    # large offset to check the numerical stability
+    f = df.Field(
+        mesh,
+        nvdim=3,
+        value=rng.normal(size=(*mesh.n, 3)) + 1e8,
+        valid=rng.random(mesh.n) < 0.7,
+        unit="A/m",
+    )
+    where = rng.random(mesh.n) < 0.5
+
+    # std computed by numpy is less accurate because of the offset
+    rtol = {"mean": 1e-12, "std": 1e-6, "min": 0, "max": 0}
+    stats = f.stats()
+    assert set(stats) == {"mean", "std", "min", "max", "mean_norm", "valid_fraction"}
+    for key in ["mean", "std", "min", "max"]:
+        assert np.allclose(stats[key], getattr(f, key)(), rtol=rtol[key], atol=0)
+    assert np.isclose(stats["mean_norm"], f.norm.mean()[0], rtol=1e-12)
+    assert stats["valid_fraction"] == np.mean(f.valid)
+
+    stats = f.stats(where=where)
+    for key in ["mean", "std", "min", "max"]:
+        assert np.allclose(
+            stats[key], getattr(f, key)(where=where), rtol=rtol[key], atol=0
+        )
+    assert stats["valid_fraction"] == np.mean(f.valid[where])
+    stats = f.stats(valid_only=True)
+    assert np.allclose(stats["std"], f.std(valid_only=True), rtol=1e-6, atol=0)
+    assert stats["valid_fraction"] == 1
+
+    for direction in ["x", "y", ["x", "z"], ["y", "z"]]:
+        stats = f.stats(direction, where=where)
+        for key in ["mean", "std", "min", "max"]:
+            expected = getattr(f, key)(direction, where=where)
+            assert stats[key].mesh.allclose(expected.mesh)
+            assert stats[key].unit == "A/m"
+            assert np.array_equal(stats[key].valid, expected.valid)
+            assert np.allclose(
+                stats[key].array[expected.valid],
+                expected.array[expected.valid],
+                rtol=rtol[key],
+                atol=0,
+            )
+        assert stats["mean_norm"].nvdim == 1
+        assert stats["valid_fraction"].allclose(
+            f._valid_as_field.mean(direction, where=where)
+        )
+
+    with pytest.raises(ValueError):
+        f.stats(where=np.zeros(mesh.n, dtype=bool))
+    with pytest.raises(ValueError):
+        f.stats(direction=["x", "x"])
+
+
+def test_std_memory(monkeypatch):
+    # the deviations are accumulated per chunk, i.e. no full-size temporary arrays
+    monkeypatch.setattr(df.field, "_REDUCTION_CHUNK_SIZE", 1000)
+    mesh = df.Mesh(p1=(0, 0, 0), p2=(100, 100, 50), n=(100, 100, 50))
+    f = df.Field(mesh, nvdim=3, value=np.random.default_rng(0).random((*mesh.n, 3)))
+    where = np.ones(mesh.n, dtype=bool)
+    for kwargs, axis in [
+        ({}, (0, 1, 2)),
+        ({"where": where}, (0, 1, 2)),
+        ({"direction": "x"}, 0),
+        ({"direction": "z"}, 2),
+    ]:
+        tracemalloc.start()
+        res = f.std(**kwargs)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        assert peak < 0.25 * f.array.nbytes
+        res = res.array if isinstance(res, df.Field) else res
+        expected = np.std(f.array, axis=axis)
+        assert np.allclose(res, expected)
+
+
 @pytest.mark.parametrize("nvdim", [1, 2, 3, 4])
 def test_field_component(valid_mesh, nvdim):
     valid_components = ["a", "b", "c", "d", "e", "f"]
@@ -1220,6 +2018,57 @@ def test_mul_truediv(mesh_3d):
         f1 /= f2
 
 
+def test_inplace_operators(mesh_3d):
+    f = df.Field(mesh_3d, nvdim=3, value=(1, 2, 3))
+    other = df.Field(mesh_3d, nvdim=3, value=(1, 1, 1))
+    ref = f
+    array = f.array
+    view = f.x
+
+    f += other
+    f -= (0, 1, 2)
+    f *= 2
+    f /= other
+    assert f is ref
+    assert f.array is array
+    assert np.allclose(f.mean(), (4, 4, 4))
+    assert np.allclose(view.mean(), 4)
+
+    # scalar fields and arrays with the same shape
+    f *= df.Field(mesh_3d, nvdim=1, value=0.5)
+    f += np.ones_like(array)
+    assert f is ref
+    assert np.allclose(f.mean(), (3, 3, 3))
+
+    f -= f
+    assert f is ref
+    assert np.allclose(f.mean(), (0, 0, 0))
+
+    # valid values are combined
+    other.valid = np.zeros(mesh_3d.n, dtype=bool)
+    f += other
+    assert f is ref
+    assert not np.any(f.valid)
+
+    # fallback to the binary operator if the result does not fit into the array
+    f = df.Field(mesh_3d, nvdim=1, value=1, dtype=np.int64)
+    ref = f
+    f += 2
+    assert f is ref
+    assert f.array.dtype == np.int64
+    f /= 2
+    assert f is not ref
+    assert f.array.dtype == np.float64
+    assert np.allclose(f.mean(), 1.5)
+
+    f = df.Field(mesh_3d, nvdim=1, value=2)
+    ref = f
+    f *= other
+    assert f is not ref
+    assert f.nvdim == 3
+    assert np.allclose(ref.mean(), 2)
+
+
 @pytest.mark.parametrize("nvdim", [1, 2, 3, 4])
 def test_dot(mesh_3d, nvdim):
     # Zero vectors
@@ -1386,6 +2235,88 @@ def test_lshift(valid_mesh, nvdim):
         _ = f1 << "a"
 
 
+def test_operators_out(mesh_3d):
+    f1 = df.Field(mesh_3d, nvdim=3, value=lambda p: (p[0], p[1], 1))
+    f2 = df.Field(mesh_3d, nvdim=3, value=(0, 1, 2))
+
+    out = df.Field(mesh_3d, nvdim=1)
+    array = out._array
+    assert f1.dot(f2, out=out) is out
+    assert out._array is array
+    assert out.allclose(f1.dot(f2))
+
+    out = df.Field(mesh_3d, nvdim=3)
+    assert f1.cross(f2, out=out) is out
+    assert out.allclose(f1.cross(f2))
+    expected = f1.cross(f2)
+    assert f1.cross(f2, out=f1) is f1
+    assert f1.allclose(expected)
+
+    f1 = df.Field(mesh_3d, nvdim=3, value=lambda p: (p[0] ** 2, p[1], 1))
+    expected = f1.diff("x")
+    assert f1.diff("x", out=out) is out
+    assert out.allclose(expected)
+    assert f1.diff("x", out=f1) is f1
+    assert f1.allclose(expected)
+
+    mesh_pbc = df.Mesh(region=mesh_3d.region, n=mesh_3d.n, bc="x")
+    f = df.Field(mesh_pbc, nvdim=1, value=lambda p: p[0])
+    expected = f.diff("x", order=2)
+    assert f.diff("x", order=2, out=f) is f
+    assert f.allclose(expected)
+
+    # valid is not shared with the operands
+    f1 = df.Field(mesh_3d, nvdim=3, value=(1, 2, 3), valid=True)
+    for out in [
+        f1.dot((0, 1, 0), out=df.Field(mesh_3d, nvdim=1)),
+        f1.cross((0, 0, 1), out=df.Field(mesh_3d, nvdim=3)),
+        f1.diff("x", out=df.Field(mesh_3d, nvdim=3)),
+    ]:
+        assert not np.shares_memory(out.valid, f1.valid)
+        out.valid[0, 0, 0] = False
+        assert f1.valid.all()
+    assert np.allclose(out.mean(), 0)
+    assert np.allclose(f1.cross((0, 0, 1), out=out).mean(), (2, -1, 0))
+
+    # the cache of out is invalidated but not disabled
+    out = df.Field(mesh_3d, nvdim=3)
+    array = out._array
+    assert np.allclose(out.jacobian, 0)
+    f2 = df.Field(mesh_3d, nvdim=3, value=lambda p: (p[1], p[0], 0))
+    f2.diff("x", out=out)
+    f2.x.dot((1,), out=out.x)
+    f2.cross((0, 0, 1), out=out)  # (x, -y, 0)
+    assert out._array is array
+    assert out._version[0] is not None
+    jacobian = out.jacobian
+    assert np.allclose(jacobian[..., 0, 0], 1)
+    assert np.allclose(jacobian[..., 1, 1], -1)
+    assert out._cache[1]
+
+    # no full-size temporary array for the cross product
+    big = df.Mesh(p1=(0, 0, 0), p2=(100, 100, 20), n=(100, 100, 20))
+    f2 = df.Field(big, nvdim=3, value=(1, 2, 3))
+    out = df.Field(big, nvdim=3)
+    tracemalloc.start()
+    f2.cross((0, 0, 1), out=out)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    assert peak < 0.5 * out._array.nbytes
+    assert np.allclose(out.mean(), (2, -1, 0))
+
+    # invalid out
+    with pytest.raises(TypeError):
+        f1.dot(f2, out=np.zeros((*mesh_3d.n, 1)))
+    with pytest.raises(ValueError):
+        f1.dot(f2, out=f1)
+    with pytest.raises(ValueError):
+        f1.cross(f2, out=df.Field(mesh_3d, nvdim=1))
+    with pytest.raises(ValueError):
+        f1.diff(
+            "x", out=df.Field(df.Mesh(p1=(0, 0, 0), p2=(1, 1, 1), n=(1, 1, 1)), nvdim=3)
+        )
+
+
 def test_lshift_different_mesh():
     mesh1 = df.Mesh(p1=(0, 0, 0), p2=(5, 5, 5), n=(1, 1, 1))
     mesh2 = df.Mesh(p1=(0, 0, 0), p2=(3, 3, 3), n=(1, 1, 1))
@@ -1929,6 +2860,221 @@ def test_diff_valid():
     assert np.allclose(f.diff("z", restrict2valid=False).array, (0, 0, 1))
 
 
+def test_diff_accuracy():
+    def value_fun(point):
+        x, y, z = point
+        return (np.sin(x), np.cos(2 * y), x * z)
+
+    errors = {}
+    for accuracy in [2, 4, 6]:
+        for n in [16, 32]:
+            mesh = df.Mesh(p1=(0, 0, 0), p2=(2, 2, 2), n=(n, n, 4))
+            f = df.Field(mesh, nvdim=3, value=value_fun)
+            d = f.diff("x", accuracy=accuracy)
+            assert d.vdims == f.vdims
+            assert np.allclose(d.y.array, 0)
+            assert np.allclose(d.z.array[..., 0], mesh.cells.z)
+            errors[accuracy, n] = np.max(
+                np.abs(d.x.array[..., 0] - np.cos(mesh.cells.x)[:, None, None])
+            )
+    for accuracy in [2, 4, 6]:
+        assert np.log2(errors[accuracy, 16] / errors[accuracy, 32]) > accuracy - 0.5
+    assert errors[6, 16] < errors[4, 16] < errors[2, 16]
+
+    # periodic boundary conditions
+    mesh = df.Mesh(p1=(0, 0, 0), p2=(2 * np.pi, 1, 1), n=(20, 1, 1), bc="x")
+    f = df.Field(mesh, nvdim=1, value=lambda p: np.sin(p[0]))
+    exact = np.cos(mesh.cells.x)
+    error2 = np.max(np.abs(f.diff("x").array[:, 0, 0, 0] - exact))
+    error6 = np.max(np.abs(f.diff("x", accuracy=6).array[:, 0, 0, 0] - exact))
+    assert error6 < error2 / 100
+
+    # default accuracy of the derived operators
+    mesh = df.Mesh(p1=(0, 0, 0), p2=(1, 1, 1), n=(10, 8, 6), bc="y")
+    f = df.Field(mesh, nvdim=3, value=np.random.default_rng(1).random((*mesh.n, 3)))
+    jacobian = f.jacobian
+    assert f.diff_accuracy == 2
+    f.diff_accuracy = 4
+    assert not np.allclose(f.jacobian, jacobian)
+    assert np.array_equal(f.jacobian[..., 0, 1], f.x.diff("y").array[..., 0])
+    assert np.array_equal(
+        f.jacobian[..., 0, 1], f.x.diff("y", accuracy=4).array[..., 0]
+    )
+    assert np.array_equal(
+        f.curl.z.array[..., 0],
+        f.y.diff("x").array[..., 0] - f.x.diff("y").array[..., 0],
+    )
+    assert np.array_equal(
+        f.laplace.y.array, sum(f.y.diff(d, order=2).array for d in "xyz")
+    )
+    # a property of the field and its views, not of other fields or results
+    assert f.x.diff_accuracy == 4
+    assert f.sel("x").diff_accuracy == 4
+    assert df.Field(mesh, nvdim=3).diff_accuracy == 2
+    assert (f + 1).diff_accuracy == 2
+    assert np.array_equal((f + 0).jacobian, jacobian)
+    f.diff_accuracy = 2
+    assert np.array_equal(f.jacobian, jacobian)
+
+    with pytest.raises(ValueError):
+        f.diff("x", accuracy=3)
+    with pytest.raises(ValueError):
+        f.diff_accuracy = 8
+    assert f.diff_accuracy == 2
+
+
+def test_diff_bc():
+    # zero gradient at the boundaries
+    mesh = df.Mesh(p1=(0, 0, 0), p2=(np.pi, 1, 1), n=(100, 2, 1))
+    f = df.Field(mesh, nvdim=1, value=lambda p: np.cos(p[0]))
+    x = mesh.cells.x[:, None, None]
+    for accuracy in [2, 4]:
+        d = f.diff("x", accuracy=accuracy, bc="neumann")
+        assert np.allclose(d.array[..., 0], -np.sin(x), atol=1e-3)
+        d = f.diff("x", order=2, accuracy=accuracy, bc="neumann")
+        assert np.allclose(d.array[..., 0], -np.cos(x), atol=1e-3)
+    assert np.allclose(f.diff("y", bc="neumann").array, 0)
+
+    # the boundary condition of the mesh is not used for derivatives
+    mesh_bc = df.Mesh(p1=(0, 0, 0), p2=(np.pi, 1, 1), n=(100, 2, 1), bc="neumann")
+    f_bc = df.Field(mesh_bc, nvdim=1, value=lambda p: np.cos(p[0]))
+    assert np.array_equal(f_bc.diff("x").array, f.diff("x").array)
+    assert np.array_equal(f_bc.diff("x", order=2).array, f.diff("x", order=2).array)
+    f_bc.diff_bc = "neumann"
+    assert np.array_equal(
+        f_bc.diff("x", order=2).array, f.diff("x", order=2, bc="neumann").array
+    )
+
+    # zero value at the boundaries: antisymmetric ghost cells
+    mesh = df.Mesh(p1=(0, 0, 0), p2=(10, 1, 1), n=(10, 1, 1))
+    f = df.Field(mesh, nvdim=1, value=lambda p: np.sin(np.pi * p[0] / 10))
+    u = f.array[0, 0, 0, 0]
+    h = mesh.cell[0]
+    d2 = f.diff("x", order=2, bc="dirichlet").array[0, 0, 0, 0]
+    assert np.isclose(d2, (f.array[1, 0, 0, 0] - 3 * u) / h**2)
+    assert np.isclose(d2, -0.0154, atol=1e-4)
+    d2_exact = -((np.pi / 10) ** 2) * u
+    assert abs(d2 - d2_exact) < 2e-3 * abs(d2_exact) + 1e-4
+    d1 = f.diff("x", bc="dirichlet").array[0, 0, 0, 0]
+    assert np.isclose(d1, (f.array[1, 0, 0, 0] + u) / (2 * h))
+    d1_exact = np.pi / 10 * np.cos(np.pi / 20)  # 0.310
+    assert np.isclose(d1, d1_exact, rtol=2e-2)
+
+    f.diff_bc = "dirichlet"
+    assert f.diff_bc == "dirichlet"
+    assert np.array_equal(
+        f.diff("x", order=2).array, f.diff("x", order=2, bc="dirichlet").array
+    )
+    with pytest.raises(ValueError):
+        f.diff_bc = "robin"
+    with pytest.raises(ValueError):
+        f.diff("x", bc="robin")
+    with pytest.raises(ValueError):
+        f.diff("x", method="spectral")
+
+
+def test_diff_spectral():
+    mesh = df.Mesh(p1=(0, 0, 0), p2=(2 * np.pi, 2, 1), n=(16, 10, 5), bc="xy")
+
+    def value_fun(point):
+        x, y, z = point
+        return (np.sin(2 * x), np.cos(np.pi * y) * z, z**2)
+
+    f = df.Field(mesh, nvdim=3, value=value_fun)
+    x, y, z = (mesh.cells.x[:, None, None], mesh.cells.y[None, :, None], mesh.cells.z)
+    d = f.diff("x", method="spectral")
+    assert d.vdims == f.vdims
+    assert np.allclose(d.x.array[..., 0], 2 * np.cos(2 * x))
+    assert np.allclose(d.array[..., 1:], 0)
+    d = f.diff("y", order=2, method="spectral")
+    assert np.allclose(d.y.array[..., 0], -(np.pi**2) * np.cos(np.pi * y) * z)
+
+    out = df.Field(mesh, nvdim=3)
+    assert f.diff("x", method="spectral", out=out) is out
+    assert out.allclose(f.diff("x", method="spectral"))
+
+    # derived operators use spectral derivatives in periodic directions
+    f.diff_method = "spectral"
+    jacobian = f.jacobian
+    assert np.allclose(jacobian[..., 0, 0], 2 * np.cos(2 * x))
+    assert np.allclose(jacobian[..., 1, 1], -np.pi * np.sin(np.pi * y) * z)
+    assert np.array_equal(jacobian[..., 2, 2], f.z.diff("z").array[..., 0])
+    assert np.allclose(f.div.array[..., 0], jacobian.trace(axis1=-2, axis2=-1))
+    assert np.allclose(
+        f.laplace.x.array[..., 0], -4 * np.sin(2 * x) * np.ones_like(y * z)
+    )
+    assert np.array_equal(f.diff("x").array, f.diff("x", method="spectral").array)
+    # a property of the field and its views, not of other fields or results
+    assert f.x.diff_method == "spectral"
+    assert df.Field(mesh, nvdim=3).diff_method == "finite-difference"
+    assert (2 * f).diff_method == "finite-difference"
+    f.diff_method = "finite-difference"
+    assert not np.allclose(f.jacobian, jacobian)
+
+    with pytest.raises(ValueError):
+        f.diff("z", method="spectral")
+    with pytest.raises(ValueError):
+        f.diff("x", method="chebyshev")
+    with pytest.raises(ValueError):
+        f.diff_method = "chebyshev"
+    f.diff_method = "spectral"
+
+    # invalid cells
+    f.valid = lambda p: p[0] < 3
+    with pytest.raises(ValueError):
+        f.diff("x", method="spectral")
+    with pytest.raises(ValueError):
+        f.curl  # noqa: B018
+    d = f.diff("x", method="spectral", restrict2valid=False)
+    assert np.allclose(d.x.array[..., 0], 2 * np.cos(2 * x))
+    assert np.array_equal(d.valid, f.valid)
+
+
+@pytest.mark.parametrize("bc", ["", "x", "xyz", "neumann", "dirichlet"])
+def test_jacobian(bc):
+    diff_bc = bc if bc in ("neumann", "dirichlet") else None
+    mesh = df.Mesh(p1=(0, 0, 0), p2=(10, 8, 6), n=(10, 8, 3), bc="" if diff_bc else bc)
+    rng = np.random.default_rng(1)
+    f = df.Field(
+        mesh, nvdim=3, value=rng.random((*mesh.n, 3)), valid=rng.random(mesh.n) < 0.8
+    )
+    f.diff_bc = diff_bc
+    jacobian = f.jacobian
+    assert jacobian.shape == (10, 8, 3, 3, 3)
+    for i, vdim in enumerate(f.vdims):
+        for j, dim in enumerate(mesh.region.dims):
+            expected = getattr(f, vdim).diff(dim).array[..., 0]
+            assert np.array_equal(jacobian[..., i, j], expected)
+
+    # cached per component and direction until the field or valid changes
+    assert f._derivative(0, 1) is f._derivative(0, 1)
+    assert not f._derivative(0, 1).flags.writeable
+    jacobian[...] = 0  # a new array
+    assert not np.array_equal(f.jacobian, jacobian)
+    derivative = f._derivative(0, 1)
+    f += 1
+    assert f._derivative(0, 1) is not derivative
+    jacobian = f.jacobian
+    f.valid[...] = True  # the derivatives depend on valid, also if modified in place
+    assert not np.array_equal(f.jacobian, jacobian)
+    f.valid = jacobian[..., 0, 0] > 0
+    assert not np.array_equal(f.jacobian, jacobian)
+
+    # only the required derivatives are computed
+    f = df.Field(mesh, nvdim=3, value=rng.random((*mesh.n, 3)))
+    f.div  # noqa: B018
+    assert sorted(key[1:3] for key in f._cache[1]) == [(0, 0), (1, 1), (2, 2)]
+    f.curl  # noqa: B018
+    assert len(f._cache[1]) == 9
+    f.x.grad.array[...] = 0  # no view into the cache
+    assert np.array_equal(f.x.grad.array[..., 1], f.x.diff("y").array[..., 0])
+
+    x, y, z = (f.jacobian[..., i, :] for i in range(3))
+    assert np.array_equal(f.div.array[..., 0], x[..., 0] + y[..., 1] + z[..., 2])
+    assert np.array_equal(f.curl.z.array[..., 0], y[..., 0] - x[..., 1])
+    assert np.array_equal(f.x.grad.array, x)
+
+
 def test_grad(valid_mesh):
     # f() = 0 -> grad(f) = (0, 0, 0)
     f = df.Field(valid_mesh, nvdim=1, value=0)
@@ -2287,6 +3433,31 @@ def test_integrate_cumulative():
     assert np.allclose(f_int.mean(), (1, 1.25))
 
 
+def test_integrate_masked():
+    subregions = {"sr": df.Region(p1=(2, 0, 0), p2=(8, 6, 4))}
+    mesh = df.Mesh(p1=(0, 0, 0), p2=(10, 8, 4), n=(10, 8, 2), subregions=subregions)
+    rng = np.random.default_rng(0)
+    f = df.Field(
+        mesh,
+        nvdim=2,
+        value=rng.normal(size=(*mesh.n, 2)),
+        valid=rng.random(mesh.n) < 0.7,
+    )
+    masked = df.Field(mesh, nvdim=2, value=f.array * f.valid[..., np.newaxis])
+
+    assert np.allclose(f.integrate(valid_only=True), masked.integrate())
+    assert np.allclose(f.integrate(where=f.valid), masked.integrate())
+    assert np.allclose(f.integrate(subregion="sr"), f["sr"].integrate())
+    assert np.allclose(
+        f.integrate(valid_only=True, subregion="sr"), masked["sr"].integrate()
+    )
+    assert f.integrate("y", valid_only=True).allclose(masked.integrate("y"))
+    assert f.integrate("z", subregion="sr").allclose(f["sr"].integrate("z"))
+    assert f.integrate("x", cumulative=True, valid_only=True).allclose(
+        masked.integrate("x", cumulative=True)
+    )
+
+
 def test_integrate_exceptions():
     p1 = (0, 0, 0)
     p2 = (10, 10, 10)
@@ -2957,6 +4128,30 @@ def test_write_read_hdf5(norm, nvdim, value, subregions, filename, tmp_path):
     assert f.mesh.subregions == f_read.mesh.subregions  # not checked in __eq__
 
 
+def test_write_read_subregion_labels(tmp_path):
+    mesh = df.Mesh(p1=(0, 0, 0), p2=(4, 3, 2), cell=(1, 1, 1))
+    labels = np.random.default_rng(0).integers(0, 3, size=mesh.n)
+    mesh.set_subregion_labels(labels, names=["a", "b"])
+    f = df.Field(mesh, nvdim=1, value={"a": 1, "b": 2, "default": 0})
+
+    # hdf5 files contain the labels
+    f.to_file(tmp_path / "labels.hdf5")
+    f_read = df.Field.from_file(tmp_path / "labels.hdf5")
+    assert f == f_read
+    assert f_read.mesh.subregions == mesh.subregions
+    assert f_read.mesh._defined_by_labels
+    assert np.array_equal(f_read.mesh.subregion_labels, mesh.subregion_labels)
+
+    # only the bounding boxes are saved in the json files
+    for filename in ["labels.ovf", "labels.vtk"]:
+        with pytest.warns(UserWarning, match="labels are lost"):
+            f.to_file(tmp_path / filename)
+        f_read = df.Field.from_file(tmp_path / filename)
+        assert f_read.mesh.subregions == mesh.subregions
+        assert not f_read.mesh._defined_by_labels
+    f.to_file(tmp_path / "no_sr.ovf", save_subregions=False)
+
+
 def test_write_read_invalid_extension():
     filename = "testfile.jpg"
 
@@ -3786,6 +4981,32 @@ def test_k3d_nonzero(test_field):
         test_field.k3d.nonzero()
 
 
+def test_k3d_scalar_filter_field():
+    mesh = df.Mesh(p1=(0, 0, 0), p2=(4, 2, 2), n=(4, 2, 2))
+    field = df.Field(mesh, nvdim=1, value=lambda p: p[0] + 1)
+    # filter field on a finer mesh with a larger region
+    filter_mesh = df.Mesh(p1=(-1, -1, -1), p2=(5, 3, 3), n=(12, 8, 8))
+    filter_field = df.Field(filter_mesh, nvdim=1, value=lambda p: p[0] > 2)
+    plot = k3d.plot()
+    field.k3d.scalar(plot=plot, filter_field=filter_field)
+    voxels = np.swapaxes(plot.objects[-1].voxels, 0, 2)
+    assert np.all(voxels[:2] == 0)
+    assert np.all(voxels[2:] > 0)
+
+    # other callables are evaluated point by point
+    points = []
+
+    def filter_function(point):
+        points.append(point)
+        return point[0] > 2
+
+    plot = k3d.plot()
+    field.k3d.scalar(plot=plot, filter_field=filter_function)
+    assert np.array_equal(np.swapaxes(plot.objects[-1].voxels, 0, 2), voxels)
+    assert len(points) == 16
+    assert all(np.shape(point) == (3,) for point in points)
+
+
 def test_k3d_scalar(test_field):
     # Default
     test_field.a.k3d.scalar()
@@ -0,0 +1,193 @@
+import re
+
+import numpy as np
+import pytest
+
+import discretisedfield as df
+
+
+def check_equal(lazy, expected):
+    for block_size in [None, 1, 7, 10**9]:
+        res = lazy.compute(block_size=block_size)
+        assert isinstance(res, df.Field)
+        assert res.mesh == expected.mesh
+        assert res.nvdim == expected.nvdim
+        assert res.vdims == expected.vdims
+        assert res.vdim_mapping == expected.vdim_mapping
+        assert res.unit == expected.unit
+        assert np.array_equal(res.array, expected.array)
+        assert np.array_equal(res.valid, expected.valid)
+
+
+@pytest.fixture
+def mesh():
+    return df.Mesh(p1=(0, 0, 0), p2=(12e-9, 9e-9, 4e-9), n=(12, 9, 4))
+
+
+@pytest.fixture
+def fields(mesh):
+    rng = np.random.default_rng(42)
+    f1 = df.Field(mesh, nvdim=3, value=rng.random((*mesh.n, 3)) - 0.5, unit="A/m")
+    f2 = df.Field(mesh, nvdim=3, value=rng.random((*mesh.n, 3)) - 0.5)
+    f3 = df.Field(mesh, nvdim=1, value=rng.random((*mesh.n, 1)) + 1)
+    return f1, f2, f3
+
+
+def test_arithmetic(fields):
+    f1, f2, f3 = fields
+    l1 = f1.lazy()
+    check_equal(l1, f1)
+    check_equal(l1 + f2, f1 + f2)
+    check_equal(f2 + l1, f2 + f1)
+    check_equal(l1 - f2.lazy(), f1 - f2)
+    check_equal(l1 * f3 / 2 - 1, f1 * f3 / 2 - 1)
+    check_equal(2 / f3.lazy(), 2 / f3)
+    check_equal(-l1 + (1, 2, 3), -f1 + (1, 2, 3))
+    check_equal((1, 2, 3) - l1, (1, 2, 3) - f1)
+    check_equal(np.float64(2) * l1, 2 * f1)
+    check_equal(f3.lazy() * (1, 2, 3), f3 * (1, 2, 3))
+    check_equal(l1 + f1.array, f1 + f1.array)
+    check_equal(+l1, f1)
+
+
+def test_vector_operations(fields):
+    f1, f2, f3 = fields
+    l1 = f1.lazy()
+    check_equal(l1.dot(f2), f1.dot(f2))
+    check_equal(l1.dot((0, 0, 1)), f1.dot((0, 0, 1)))
+    check_equal(l1.cross(f2.lazy()), f1.cross(f2))
+    check_equal(l1.cross((0, 1, 0)), f1.cross((0, 1, 0)))
+    check_equal(l1.norm, f1.norm)
+    check_equal(l1.orientation, f1.orientation)
+    check_equal((l1 * f3).norm.dot(f3), (f1 * f3).norm.dot(f3))
+
+
+@pytest.mark.parametrize("bc", ["", "x", "y", "xyz", "neumann", "dirichlet"])
+@pytest.mark.parametrize("direction", ["x", "y", "z"])
+@pytest.mark.parametrize("order", [1, 2])
+@pytest.mark.parametrize("accuracy", [2, 4])
+def test_diff(mesh, fields, bc, direction, order, accuracy):
+    diff_bc = bc if bc in ("neumann", "dirichlet") else None
+    mesh = df.Mesh(region=mesh.region, n=mesh.n, bc="" if diff_bc else bc)
+    f1 = df.Field(mesh, nvdim=3, value=fields[0].array)
+    check_equal(f1.lazy().diff(direction, bc=diff_bc), f1.diff(direction, bc=diff_bc))
+    f1.diff_bc = diff_bc
+    l1 = f1.lazy()
+    kwargs = {"order": order, "accuracy": accuracy}
+    check_equal(l1.diff(direction, **kwargs), f1.diff(direction, **kwargs))
+    check_equal(
+        l1.diff(direction, **kwargs).diff("x").diff(direction, accuracy=accuracy),
+        f1.diff(direction, **kwargs).diff("x").diff(direction, accuracy=accuracy),
+    )
+
+    # invalid cells
+    f1.valid = np.random.default_rng(1).random(mesh.n) < 0.8
+    l1 = f1.lazy()
+    check_equal(l1.diff(direction, **kwargs), f1.diff(direction, **kwargs))
+    check_equal(
+        l1.diff(direction, **kwargs).diff("x").diff(direction, accuracy=accuracy),
+        f1.diff(direction, **kwargs).diff("x").diff(direction, accuracy=accuracy),
+    )
+    check_equal(
+        l1.diff(direction, restrict2valid=False),
+        f1.diff(direction, restrict2valid=False),
+    )
+
+    # default accuracy of the field
+    f1.diff_accuracy = accuracy
+    l1 = f1.lazy()
+    check_equal(l1.diff(direction).diff("x"), f1.diff(direction).diff("x"))
+
+
+def test_diff_spectral(mesh, fields):
+    mesh = df.Mesh(region=mesh.region, n=mesh.n, bc="xz")
+    f1 = df.Field(mesh, nvdim=3, value=fields[0].array)
+    l1 = f1.lazy()
+    for direction in "xz":
+        check_equal(
+            l1.diff(direction, method="spectral").diff("y"),
+            f1.diff(direction, method="spectral").diff("y"),
+        )
+    with pytest.raises(ValueError):
+        l1.diff("y", method="spectral")
+
+    # default method of the field
+    f1.diff_method = "spectral"
+    for direction in "xyz":
+        check_equal(f1.lazy().diff(direction), f1.diff(direction))
+    assert (
+        not f1.lazy()
+        .diff("x")
+        .compute()
+        .allclose(f1.diff("x", method="finite-difference"))
+    )
+
+    f1.valid = np.random.default_rng(1).random(mesh.n) < 0.8
+    with pytest.raises(ValueError):
+        f1.lazy().diff("x", method="spectral").compute()
+
+
+def test_topological_charge_density():
+    mesh = df.Mesh(p1=(0, 0), p2=(100, 80), n=(50, 40))
+    field = df.Field(
+        mesh,
+        nvdim=3,
+        value=lambda p: (p[0] - 50, p[1] - 40, 10),
+        valid=lambda p: (p[0] - 50) ** 2 + (p[1] - 40) ** 2 < 35**2,
+    )
+    of = field.orientation
+    expected = 1 / (4 * np.pi) * of.dot(of.diff("x").cross(of.diff("y")))
+    of = field.lazy().orientation
+    check_equal(1 / (4 * np.pi) * of.dot(of.diff("x").cross(of.diff("y"))), expected)
+
+
+def test_shared_subexpression(fields, monkeypatch):
+    f1, _, _ = fields
+    calls = []
+    norm = df.lazy._norm
+    monkeypatch.setattr(df.lazy, "_norm", lambda *args: calls.append(1) or norm(*args))
+    n = f1.lazy().norm
+    (n * n + n).compute(block_size=10**9)
+    assert len(calls) == 1
+
+
+def test_invalid(fields):
+    f1, f2, f3 = fields
+    l1 = f1.lazy()
+    with pytest.raises(TypeError):
+        df.LazyField(f1.array)
+    with pytest.raises(TypeError):
+        l1 + "a"
+    with pytest.raises(TypeError):
+        l1 * (1, 2)
+    with pytest.raises(TypeError):
+        l1.dot(1)
+    with pytest.raises(ValueError):
+        l1.dot(f3)
+    with pytest.raises(ValueError):
+        (l1 * f3).cross(f3)
+    with pytest.raises(ValueError):
+        l1 + df.Field(df.Mesh(p1=(0, 0, 0), p2=(1, 1, 1), n=(1, 1, 1)), nvdim=3)
+    with pytest.raises(ValueError):
+        l1 + df.Field(f1.mesh, nvdim=2)
+    with pytest.raises(ValueError):
+        l1.diff("a")
+    with pytest.raises(NotImplementedError):
+        l1.diff("x", order=3)
+    with pytest.raises(ValueError):
+        l1.diff("x", accuracy=5)
+
+
+def test_repr(fields):
+    f1, f2, _ = fields
+    assert re.match(
+        r"^LazyField\(norm\(add\(Field\(\.\.\.\), diff\(Field\(\.\.\.\), 'y',"
+        r" order=2\)\)\)\)$",
+        repr((f1.lazy() + f2.lazy().diff("y", order=2)).norm),
+    )
+    assert repr(f1.lazy().diff("x", accuracy=4)) == (
+        "LazyField(diff(Field(...), 'x', accuracy=4))"
+    )
+    assert repr(f1.lazy().diff("x", method="finite-difference")) == (
+        "LazyField(diff(Field(...), 'x'))"
+    )
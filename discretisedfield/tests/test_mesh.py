@@ -1,5 +1,8 @@
+import copy
 import numbers
+import pickle
 import re
+import tracemalloc
 import types
 
 import ipywidgets
@@ -7,6 +10,7 @@ import matplotlib.pyplot as plt
 import numpy as np
 import pytest
 import pyvista as pv
+import scipy.sparse.linalg
 
 import discretisedfield as df
 import discretisedfield.plotting.util as plot_util
@@ -466,6 +470,36 @@ def test_indices_coordinates_iter(p1, p2, n, length):
         assert all([0 <= i <= j for i, j in zip(point, p2)])
 
 
+@pytest.mark.parametrize("n", [(5,), (5, 3), (2, 5, 3), (5, 4, 3, 2)])
+def test_coordinate_index_arrays(n):
+    ndim = len(n)
+    mesh = df.Mesh(p1=(-1.0,) * ndim, p2=(10.0, 5.0, 2e-9, 7.0)[:ndim], n=n)
+    indices = np.array(list(mesh.indices))
+    points = np.array(list(mesh))
+
+    coordinates = mesh.coordinate_arrays()
+    index_arrays = mesh.index_arrays()
+    assert len(coordinates) == len(index_arrays) == ndim
+    for i in range(ndim):
+        shape = tuple(n[i] if i == j else 1 for j in range(ndim))
+        assert coordinates[i].shape == index_arrays[i].shape == shape
+        assert np.allclose(coordinates[i].ravel(), mesh.cells[i], rtol=1e-12)
+    # the same coordinates as in index2point, for all cells in the order of indices
+    dense = mesh.coordinate_arrays(sparse=False)
+    dense_indices = mesh.index_arrays(sparse=False)
+    for i in range(ndim):
+        assert dense[i].shape == dense_indices[i].shape == tuple(n)
+        assert np.array_equal(dense[i][tuple(indices.T)], points[:, i])
+        assert np.array_equal(dense_indices[i][tuple(indices.T)], indices[:, i])
+        assert np.array_equal(np.broadcast_to(coordinates[i], n), dense[i])
+
+    # blocks of cells in the order of indices
+    for max_cells in [1, 7, 10**6]:
+        blocks = list(mesh._index_blocks(max_cells))
+        assert all(len(block) <= max(max_cells, np.prod(n[:-1])) for block in blocks)
+        assert np.array_equal(np.concatenate(blocks), indices)
+
+
 @pytest.mark.parametrize(
     "p1_1, p1_2, p2, n1, n2",
     [
@@ -546,6 +580,142 @@ def test_allclose(p1_1, p1_2, p2, n1, n2):
         mesh1.allclose(mesh3, rtol="1")
 
 
+def test_hash_and_cache():
+    mesh = df.Mesh(p1=(0, 0, 0), p2=(10, 20, 30), cell=(1, 2, 3))
+    equal = df.Mesh(p1=(0.0, 0, 0), p2=(10.0, 20, 30), n=(10, 10, 10), bc="x")
+    assert mesh == equal
+    assert hash(mesh) == hash(equal)
+    assert {mesh: 1}[equal] == 1
+    assert len({mesh, df.Mesh(region=mesh.region, n=(5, 10, 10))}) == 2
+    assert mesh.allclose(equal, rtol=0, atol=0)
+
+    # cached and read-only geometry
+    assert mesh.cell is mesh.cell
+    assert mesh.cells.x is mesh.cells.x
+    assert mesh.vertices.z is mesh.vertices.z
+    for array in [mesh.n, mesh.cell, mesh.cells.x, mesh.vertices.y]:
+        with pytest.raises(ValueError):
+            array[0] = 1
+
+    # the cache is updated when the mesh changes
+    mesh.translate((1, 1, 1), inplace=True)
+    assert np.allclose(mesh.cells.x[0], 1.5)
+    mesh.scale(2, reference_point=(0, 0, 0), inplace=True)
+    assert np.allclose(mesh.cell, (2, 4, 6))
+    assert mesh.dV == 48
+    assert np.allclose(mesh.vertices.x[0], 2)
+    mesh.rotate90("x", "y", inplace=True)
+    assert np.array_equal(mesh.n, (10, 10, 10))
+    assert np.allclose(mesh.cell, (4, 2, 6))
+    assert np.allclose(mesh.cells.y[0], mesh.region.pmin[1] + 1)
+
+    # the arrays stay read-only after copying and pickling
+    for copied in [copy.deepcopy(mesh), pickle.loads(pickle.dumps(mesh))]:
+        assert copied == mesh
+        assert not copied.n.flags.writeable
+        assert not copied.region.pmin.flags.writeable
+        assert np.array_equal(copied.cells.x, mesh.cells.x)
+
+
+def test_subregion_labels():
+    subregions = {
+        "r1": df.Region(p1=(0, 0, 0), p2=(4, 8, 6)),
+        "r2": df.Region(p1=(2, 0, 0), p2=(6, 4, 6)),
+        "r3": df.Region(p1=(8, 0, 0), p2=(10, 8, 6)),
+    }
+    mesh = df.Mesh(p1=(0, 0, 0), p2=(10, 8, 6), cell=(1, 1, 1), subregions=subregions)
+    labels = mesh.subregion_labels
+    assert labels.dtype == np.uint8
+    assert not labels.flags.writeable
+    assert mesh.subregion_labels is labels
+    assert np.all(labels[:4] == 1)  # first subregion takes precedence
+    assert np.all(labels[4:6, :4] == 2)
+    assert np.all(labels[4:6, 4:] == 0)
+    assert np.all(labels[6:8] == 0)
+    assert np.all(labels[8:] == 3)
+
+    # the labels are updated when the subregions change
+    mesh.subregions["r1"].translate((2, 0, 0), inplace=True)
+    assert np.all(mesh.subregion_labels[:2] == 0)
+    assert np.all(mesh.subregion_labels[4:6] == 1)
+    mesh.subregions = {}
+    assert not mesh.subregion_labels.any()
+
+    # subregions defined by an arbitrary label array
+    rng = np.random.default_rng(0)
+    array = rng.integers(0, 4, size=mesh.n) * 10
+    mesh.set_subregion_labels(array)
+    assert list(mesh.subregions) == ["subregion10", "subregion20", "subregion30"]
+    assert np.array_equal(mesh.subregion_labels, array // 10)
+    assert not mesh.subregion_labels.flags.writeable
+    mesh.set_subregion_labels(array + 1, names=["a", "b", "c", "d"])
+    assert np.array_equal(mesh.subregion_labels, array // 10 + 1)
+    mask = np.zeros(mesh.n, dtype=bool)
+    mask[1:3, 2:5, 3] = True
+    with pytest.warns(UserWarning, match="Subregion name ``default``"):
+        mesh.set_subregion_labels(mask.astype(int), names=["default"])
+    assert mesh.subregions["default"] == df.Region(p1=(1, 2, 3), p2=(3, 5, 4))
+
+    # labels are kept by translate, scale, rotate90, and copies
+    mesh.set_subregion_labels(array + 1, names=["a", "b", "c", "d"])
+    labels = mesh.subregion_labels
+    for result in [
+        mesh.translate((1, 2, 3)),
+        mesh.scale(2),
+        copy.deepcopy(mesh),
+        pickle.loads(pickle.dumps(mesh)),
+    ]:
+        assert np.array_equal(result.subregion_labels, labels)
+        assert not result.subregion_labels.flags.writeable
+    boxes = df.Mesh(region=mesh.region, n=mesh.n, subregions=mesh.subregions)
+    boxes.set_subregion_labels(mask.astype(int))
+    mesh.set_subregion_labels(mask.astype(int))
+    for k in [1, 2, 3]:
+        assert np.array_equal(
+            mesh.rotate90("x", "z", k=k).subregion_labels,
+            df.Mesh(region=boxes.region, n=boxes.n, subregions=boxes.subregions)
+            .rotate90("x", "z", k=k)
+            .subregion_labels,
+        )
+    mesh.rotate90("y", "z", inplace=True)
+    mask = np.rot90(mask, axes=(1, 2))
+    assert np.array_equal(mesh.subregion_labels, mask)
+
+    # setting subregions replaces the labels
+    pmin = mesh.region.pmin
+    mesh.subregions = {"r": df.Region(p1=pmin, p2=pmin + 1)}
+    assert mesh.subregion_labels.sum() == 1
+
+    # modifying subregions in place replaces the labels
+    mesh.set_subregion_labels(mask.astype(int), names=["a"])
+    assert mesh._defined_by_labels
+    region = df.Region(p1=pmin, p2=pmin + 1)
+    mesh.subregions["r"] = region
+    assert not mesh._defined_by_labels
+    expected = mesh._box_labels([mesh.subregions["a"], region])
+    assert np.array_equal(mesh.subregion_labels, expected)
+    mesh.set_subregion_labels(mask.astype(int), names=["a"])
+    mesh.subregions["a"] = mesh.subregions["a"].translate((1, 0, 0))
+    assert not mesh._defined_by_labels
+    mesh.set_subregion_labels(mask.astype(int), names=["a"])
+    mesh.subregions["b"] = mesh.subregions.pop("a")
+    assert not mesh._defined_by_labels
+    assert np.array_equal(
+        mesh.subregion_labels, mesh._box_labels([mesh.subregions["b"]])
+    )
+
+    with pytest.raises(TypeError):
+        mesh.set_subregion_labels(mask)
+    with pytest.raises(TypeError):
+        mesh.set_subregion_labels(mask.astype(int), names=[1])
+    with pytest.raises(ValueError):
+        mesh.set_subregion_labels(np.ones((2, 2, 2), dtype=int))
+    with pytest.raises(ValueError):
+        mesh.set_subregion_labels(-mask.astype(int))
+    with pytest.raises(ValueError):
+        mesh.set_subregion_labels(mask.astype(int), names=["a", "b"])
+
+
 def test_allclose_cell_accuracy():
     eps = 1e-6
     n = int(1e7)
@@ -825,6 +995,37 @@ def test_index2point_point2index_mutually_inverse():
         assert mesh.point2index(mesh.index2point(i)) == i
 
 
+def test_index2point_point2index_batch():
+    mesh = df.Mesh(p1=(15, -4, 12.5), p2=(-1, 10.1, 11), cell=(1, 0.1, 0.5))
+    rng = np.random.default_rng(0)
+    points = mesh.region.pmin + rng.random((100, 3)) * mesh.region.edges
+    points[0] = mesh.region.pmin
+    points[1] = mesh.region.pmax
+    # within the tolerance
+    points[2] = mesh.region.pmax + 1e-14
+    index = mesh.point2index(points)
+    assert index.shape == (100, 3)
+    assert np.issubdtype(index.dtype, np.integer)
+    assert np.array_equal(index, [mesh.point2index(p) for p in points])
+    assert np.allclose(
+        mesh.index2point(index), [mesh.index2point(tuple(i)) for i in index], atol=0
+    )
+    assert np.array_equal(mesh.point2index(mesh.index2point(index)), index)
+
+    with pytest.raises(ValueError):
+        mesh.point2index(np.vstack([points, [[20, 0, 12]]]))
+    with pytest.raises(ValueError):
+        mesh.point2index(points[:, :2])
+    with pytest.raises(TypeError):
+        mesh.point2index(points.astype(complex))
+    with pytest.raises(IndexError):
+        mesh.index2point(np.vstack([index, [[16, 0, 0]]]))
+    with pytest.raises(IndexError):
+        mesh.index2point(index[:, :2])
+    with pytest.raises(TypeError):
+        mesh.index2point(index.astype(float))
+
+
 def test_region2slice():
     p1 = 0
     p2 = 4
@@ -1658,6 +1859,93 @@ def test_coordinate_field(valid_mesh):
         assert np.allclose(cfield.array[index], getattr(valid_mesh.cells, dim), atol=0)
 
 
+@pytest.mark.parametrize("bc", ["", "x", "xz", "neumann", "dirichlet"])
+@pytest.mark.parametrize("accuracy", [2, 4])
+def test_diff_operator(bc, accuracy):
+    diff_bc = bc if bc in ("neumann", "dirichlet") else None
+    mesh = df.Mesh(p1=(0, 0, 0), p2=(10, 8, 6), n=(10, 8, 3), bc="" if diff_bc else bc)
+    rng = np.random.default_rng(0)
+    f = df.Field(
+        mesh, nvdim=3, value=rng.random((*mesh.n, 3)), valid=rng.random(mesh.n) < 0.8
+    )
+    values = f.array.reshape(-1, 3)
+    kwargs = {"accuracy": accuracy, "bc": diff_bc}
+    for dim in mesh.region.dims:
+        for order in [1, 2]:
+            operator = mesh.diff_operator(dim, order=order, valid=f.valid, **kwargs)
+            assert operator.shape == (240, 240)
+            assert operator.format == "csr"
+            expected = f.diff(dim, order=order, **kwargs).array
+            assert np.allclose((operator @ values).reshape(expected.shape), expected)
+            expected = f.diff(dim, order=order, restrict2valid=False, **kwargs).array
+            operator = mesh.diff_operator(dim, order=order, **kwargs)
+            assert np.allclose((operator @ values).reshape(expected.shape), expected)
+
+    operator = mesh.laplace_operator(valid=f.valid, **kwargs)
+    f.diff_accuracy = accuracy
+    f.diff_bc = diff_bc
+    expected = f.laplace.array
+    assert np.allclose((operator @ values).reshape(expected.shape), expected)
+
+    # matrices are cached
+    assert mesh.diff_operator("x", valid=f.valid, bc=diff_bc) is df.Mesh(
+        region=mesh.region, n=mesh.n, bc=mesh.bc
+    ).diff_operator("x", valid=f.valid.copy(), bc=diff_bc)
+    assert mesh.laplace_operator(valid=np.ones(mesh.n)) is mesh.laplace_operator()
+
+    with pytest.raises(ValueError):
+        mesh.diff_operator("a")
+    with pytest.raises(NotImplementedError):
+        mesh.diff_operator("x", order=3)
+    with pytest.raises(ValueError):
+        mesh.diff_operator("x", accuracy=3)
+    with pytest.raises(ValueError):
+        mesh.laplace_operator(valid=np.ones((2, 2, 2)))
+
+
+@pytest.mark.parametrize("bc", [None, "periodic", "neumann", "dirichlet"])
+def test_diff_matrix_kronecker(bc):
+    # without invalid cells the matrix is built from the one-dimensional matrix,
+    # full-mesh probing must give the same weights
+    n = (4, 25, 1, 3)
+    all_valid = np.ones(n, dtype=bool).tobytes()
+    for axis in range(len(n)):
+        for order, accuracy in [(1, 2), (2, 4)]:
+            args = (n, axis, order, 0.5, bc, accuracy)
+            matrix = df.operators._diff_matrix(*args, None)
+            probed = df.operators._diff_matrix(*args, all_valid)
+            assert matrix.format == "csr"
+            assert matrix.shape == probed.shape == (300, 300)
+            assert abs(matrix - probed).max() < 1e-12
+
+    # no probe arrays of the size of the mesh
+    n = (40, 40, 40)
+    peaks = []
+    for valid in [None, np.ones(n, dtype=bool).tobytes()]:
+        df.operators._diff_matrix.cache_clear()
+        tracemalloc.start()
+        df.operators._diff_matrix(n, 1, 2, 1.0, None, 4, valid)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    assert peaks[0] < 0.5 * peaks[1]
+
+
+def test_laplace_operator_poisson():
+    # -laplace(u) = 2 pi^2 sin(pi x) sin(pi y), u = 0 at the boundaries
+    errors = []
+    for n in [10, 20, 40]:
+        mesh = df.Mesh(p1=(0, 0), p2=(1, 1), n=(n, n))
+        exact = df.Field(mesh, nvdim=1, value=lambda p: np.prod(np.sin(np.pi * p)))
+        rhs = 2 * np.pi**2 * exact.array.ravel()
+        operator = mesh.laplace_operator(bc="dirichlet").tocsc()
+        solution = scipy.sparse.linalg.spsolve(-operator, rhs)
+        errors.append(np.max(np.abs(solution - exact.array.ravel())))
+    assert errors[1] < 5e-3
+    # second order convergence
+    assert 3.5 < errors[0] / errors[1] < 4.5
+    assert 3.5 < errors[1] / errors[2] < 4.5
+
+
 def test_sel_convert_intput():
     # 3d
     p1 = (0, 0, 0)
@@ -5,6 +5,10 @@ import sympy as sp
 import discretisedfield as df
 from discretisedfield.operators import (
     _1d_diff,
+    _diff,
+    _fd_weights,
+    _spectral_diff,
+    _spectral_factor,
     _split_array_on_idx,
     _split_diff_combine,
 )
@@ -73,6 +77,238 @@ def test_split_diff_combine():
     assert np.allclose(out, [0, 0, 0, 0, 0, 0, 0, 0])
 
 
+@pytest.mark.parametrize("shape", [(1,), (2,), (5,), (9, 7), (6, 1, 5), (4, 8, 3)])
+@pytest.mark.parametrize("order", [1, 2])
+@pytest.mark.parametrize("valid_fraction", [1, 0.8, 0.4, None])
+def test_diff(shape, order, valid_fraction):
+    rng = np.random.default_rng(42)
+    array = rng.normal(size=(*shape, 2))
+    valid = None if valid_fraction is None else rng.random(shape) < valid_fraction
+    for axis in range(len(shape)):
+        # same result as computing the derivative for each line separately
+        expected = np.zeros_like(array)
+        line_valid = np.ones(shape, dtype=bool) if valid is None else valid
+        lines = list(shape)
+        lines[axis] = 1
+        for idx in np.ndindex(*lines):
+            idx = list(idx)
+            idx[axis] = slice(None)
+            for dim in range(array.shape[-1]):
+                expected[(*idx, dim)] = _split_diff_combine(
+                    array[(*idx, dim)], line_valid[tuple(idx)], order, 0.3
+                )
+        assert np.array_equal(_diff(array, valid, axis, order, 0.3), expected)
+
+        # out can be the array itself
+        out = array.copy()
+        assert _diff(out, valid, axis, order, 0.3, out=out) is out
+        assert np.array_equal(out, expected)
+
+    # arbitrary values of invalid cells do not influence the result
+    if valid is not None:
+        array[~valid] = np.inf
+        res = _diff(array, valid, 0, order, 0.3)
+        assert np.all(np.isfinite(res))
+        assert np.all(res[~valid] == 0)
+
+
+def test_fd_weights():
+    assert np.allclose(_fd_weights(1, 3, 1), [-1 / 2, 0, 1 / 2])
+    assert np.allclose(_fd_weights(1, 5, 2), [1 / 12, -2 / 3, 0, 2 / 3, -1 / 12])
+    assert np.allclose(_fd_weights(2, 5, 2), [-1 / 12, 4 / 3, -5 / 2, 4 / 3, -1 / 12])
+    assert np.allclose(_fd_weights(1, 3, 0), [-3 / 2, 2, -1 / 2])
+    assert np.allclose(_fd_weights(2, 4, 0), [2, -5, 4, -1])
+
+
+@pytest.mark.parametrize("accuracy", [4, 6])
+@pytest.mark.parametrize("order", [1, 2])
+def test_diff_accuracy(accuracy, order):
+    # polynomials of degree order + accuracy - 1 are differentiated exactly
+    x = np.arange(20) * 0.3
+    degree = order + accuracy - 1
+    array = np.stack([x**degree, x], axis=-1)
+    expected = np.stack(
+        [
+            degree * x ** (degree - 1)
+            if order == 1
+            else degree * (degree - 1) * x ** (degree - 2),
+            np.full_like(x, 1 if order == 1 else 0),
+        ],
+        axis=-1,
+    )
+    res = _diff(array, None, 0, order, 0.3, accuracy=accuracy)
+    assert np.allclose(res, expected, rtol=1e-8, atol=1e-6)
+
+    # convergence for a smooth function
+    errors = []
+    for n in [40, 80]:
+        x = (np.arange(n) + 0.5) / n
+        res = _diff(
+            np.sin(3 * x)[:, np.newaxis], None, 0, order, 1 / n, accuracy=accuracy
+        )
+        exact = 3 * np.cos(3 * x) if order == 1 else -9 * np.sin(3 * x)
+        errors.append(np.max(np.abs(res[:, 0] - exact)))
+    assert np.log2(errors[0] / errors[1]) > accuracy - 0.5
+
+    # contiguous valid parts are differentiated separately; parts that are too short
+    # for the requested accuracy use a lower accuracy
+    rng = np.random.default_rng(42)
+    array = rng.normal(size=(6, 30, 2))
+    valid = rng.random((6, 30)) < 0.85
+    expected = np.zeros_like(array)
+    for i in range(6):
+        (edges,) = np.nonzero(np.diff(np.concatenate([[0], valid[i], [0]])))
+        for start, stop in zip(edges[::2], edges[1::2]):
+            part = array[i, start:stop]
+            for part_accuracy in range(accuracy, 0, -2):
+                if len(part) >= order + part_accuracy or part_accuracy == 2:
+                    break
+            expected[i, start:stop] = _diff(
+                part, None, 0, order, 0.3, accuracy=part_accuracy
+            )
+    array[~valid] = np.inf
+    res = _diff(array, valid, 1, order, 0.3, accuracy=accuracy)
+    assert np.allclose(res, expected, rtol=1e-12, atol=1e-12)
+
+    # out can be the array itself
+    out = array.copy()
+    assert _diff(out, valid, 1, order, 0.3, out=out, accuracy=accuracy) is out
+    assert np.array_equal(out, res)
+
+    # periodic
+    x = np.arange(32) / 32
+    res = _diff(
+        np.sin(2 * np.pi * x)[:, np.newaxis],
+        None,
+        0,
+        1,
+        1 / 32,
+        bc="periodic",
+        accuracy=accuracy,
+    )
+    assert np.allclose(res[:, 0], 2 * np.pi * np.cos(2 * np.pi * x), atol=1e-3)
+
+
+@pytest.mark.parametrize("accuracy", [2, 4, 6])
+@pytest.mark.parametrize("order", [1, 2])
+@pytest.mark.parametrize("n", [3, 9, 40])
+def test_diff_bc(accuracy, order, n):
+    rng = np.random.default_rng(0)
+    array = rng.normal(size=(5, n, 2))
+    valid = rng.random((5, n)) < 0.8
+    valid[0] = True
+
+    # same result as differentiating the padded array
+    for bc, mode, width in [
+        ("periodic", "wrap", order + accuracy - 1),
+        ("neumann", "symmetric", accuracy // 2),
+        ("dirichlet", "symmetric", accuracy // 2),
+    ]:
+        padded = np.pad(array[:1], [(0, 0), (width, width), (0, 0)], mode=mode)
+        if bc == "dirichlet":
+            # antisymmetric ghost cells (repeated mirroring for short arrays)
+            sign = np.where((np.arange(-width, n + width) // n) % 2 == 0, 1, -1)
+            padded *= sign[:, np.newaxis]
+        expected = _diff(padded, None, 1, order, 0.3, accuracy=accuracy)
+        res = _diff(array, None, 1, order, 0.3, bc=bc, accuracy=accuracy)
+        assert np.allclose(res[:1], expected[:, width:-width], rtol=1e-12, atol=1e-12)
+
+        # out can be the array itself
+        res = _diff(array, valid, 1, order, 0.3, bc=bc, accuracy=accuracy)
+        out = array.copy()
+        assert (
+            _diff(out, valid, 1, order, 0.3, bc=bc, out=out, accuracy=accuracy) is out
+        )
+        assert np.array_equal(out, res)
+
+    # contiguous parts continue on the opposite side in periodic directions
+    for i in range(1, 5):
+        if valid[i].all() or not valid[i].any():
+            continue
+        shift = np.argmin(valid[i])
+        rolled = np.roll(array[i], -shift, axis=0)
+        expected = _diff(
+            rolled, np.roll(valid[i], -shift), 0, order, 0.3, accuracy=accuracy
+        )
+        res = _diff(array, valid, 1, order, 0.3, bc="periodic", accuracy=accuracy)
+        assert np.allclose(
+            res[i], np.roll(expected, shift, axis=0), rtol=1e-12, atol=1e-12
+        )
+
+
+def test_diff_dirichlet():
+    # sin(pi x / L) is zero at both boundaries
+    n = 10
+    x = np.arange(n) + 0.5
+    k = np.pi / n
+    array = np.sin(k * x)[:, np.newaxis]
+    d1 = _diff(array, None, 0, 1, 1.0, bc="dirichlet")[:, 0]
+    d2 = _diff(array, None, 0, 2, 1.0, bc="dirichlet")[:, 0]
+    assert np.isclose(d1[0], 0.310, atol=6e-3)
+    assert np.isclose(d2[0], -0.0154, atol=2e-4)
+    assert np.allclose(d1, k * np.cos(k * x), atol=6e-3)
+    assert np.allclose(d2, -(k**2) * np.sin(k * x), rtol=1e-2)
+    # the boundary cells are as accurate as the interior cells
+    error = np.abs(d2 + k**2 * np.sin(k * x)) / (k**2 * np.sin(k * x))
+    assert np.allclose(error, error[n // 2], rtol=0.1)
+
+    # second-order convergence also for higher accuracies and with ghost cells from
+    # repeated mirroring
+    for accuracy in [2, 4, 6]:
+        errors = []
+        for n in [16, 32]:
+            x = (np.arange(n) + 0.5) / n
+            res = _diff(
+                np.sin(np.pi * x)[:, np.newaxis],
+                None,
+                0,
+                2,
+                1 / n,
+                bc="dirichlet",
+                accuracy=accuracy,
+            )
+            errors.append(np.max(np.abs(res[:, 0] + np.pi**2 * np.sin(np.pi * x))))
+        assert np.log2(errors[0] / errors[1]) > 1.9
+
+    # valid cells
+    array = np.ones((6, 1))
+    valid = np.array([True, True, True, False, True, True])
+    res = _diff(array, valid, 0, 1, 1.0, bc="dirichlet")
+    assert np.allclose(res[:, 0], [1, 0, 0, 0, 1, -1])
+
+
+@pytest.mark.parametrize("n", [(16, 8), (15, 9)])
+def test_spectral_diff(n):
+    # exact for band-limited periodic data
+    x, y = np.meshgrid(
+        np.arange(n[0]) * 2 * np.pi / n[0],
+        np.arange(n[1]) * 4 / n[1],
+        indexing="ij",
+    )
+    ky = 2 * np.pi / 4
+    array = np.stack([np.sin(3 * x) * np.cos(2 * ky * y), np.cos(x) + 1], axis=-1)
+    cells = [2 * np.pi / n[0], 4 / n[1]]
+    dx = _spectral_diff(array, 0, 1, cells[0])
+    dy = _spectral_diff(array, 1, 1, cells[1])
+    assert np.allclose(dx[..., 0], 3 * np.cos(3 * x) * np.cos(2 * ky * y))
+    assert np.allclose(dx[..., 1], -np.sin(x))
+    assert np.allclose(dy[..., 0], -2 * ky * np.sin(3 * x) * np.sin(2 * ky * y))
+    assert np.allclose(dy[..., 1], 0)
+    d2y = _spectral_diff(array, 1, 2, cells[1])
+    assert np.allclose(d2y[..., 0], -((2 * ky) ** 2) * array[..., 0])
+    assert dx.dtype == np.float64
+
+    # complex data
+    res = _spectral_diff(array * (1 + 2j), 0, 1, cells[0])
+    assert np.iscomplexobj(res)
+    assert np.allclose(res, dx * (1 + 2j))
+
+    # the wavenumbers are cached
+    assert _spectral_factor(n[0], cells[0], 1, True) is _spectral_factor(
+        n[0], cells[0], 1, True
+    )
+
+
 @pytest.mark.parametrize("array_len", [1, 2, 3, 4, 5])
 @pytest.mark.parametrize("dx", [1, 2, 0.5])
 @pytest.mark.parametrize("order", [1, 2])
@@ -350,6 +350,48 @@ def test_contains(factor, p1, p2):
     point[-1] = region.pmax[-1] + tol_out
     assert point not in region
 
+    # vectorised version
+    points = np.array([region.pmin, region.pmax, region.center, point])
+    points = np.concatenate([points, points + tol_in, points - tol_out])
+    expected = [list(p) in region for p in points]
+    assert np.array_equal(region.contains(points), expected)
+    assert np.array_equal(
+        region.contains(points.reshape(3, 4, -1)), np.reshape(expected, (3, 4))
+    )
+    assert region.contains(region.center)
+    assert region.contains(points[:0]).shape == (0,)
+    with pytest.raises(ValueError):
+        region.contains(points[:, :-1])
+    with pytest.raises(TypeError):
+        region.contains(points.astype(complex))
+
+
+def test_contains_regions_intersects():
+    region = df.Region(p1=(0, 0, 0), p2=(10e-9, 8e-9, 6e-9))
+    regions = [
+        region,
+        df.Region(p1=(0, 0, 0), p2=(5e-9, 5e-9, 5e-9)),  # inside
+        df.Region(p1=(5e-9, 0, 0), p2=(15e-9, 8e-9, 6e-9)),  # overlapping
+        df.Region(p1=(10e-9, 0, 0), p2=(15e-9, 8e-9, 6e-9)),  # touching
+        df.Region(p1=(0, -1e-9, 0), p2=(10e-9, 1e-30, 6e-9)),  # touching with tol
+        df.Region(p1=(20e-9, 0, 0), p2=(25e-9, 8e-9, 6e-9)),  # outside
+        df.Region(p1=(-1e-9, -1e-9, -1e-9), p2=(11e-9, 9e-9, 7e-9)),  # around
+    ]
+    expected = [r in region for r in regions]
+    assert expected == [True, True, False, False, False, False, False]
+    assert np.array_equal(region.contains_regions(regions), expected)
+    assert np.array_equal(
+        region.intersects(regions), [True, True, True, False, False, False, True]
+    )
+    assert region.contains_regions(regions[1]) is True
+    assert region.intersects(regions[3]) is False
+    assert region.contains_regions([]).shape == (0,)
+
+    with pytest.raises(TypeError):
+        region.intersects([region, (0, 0, 0)])
+    with pytest.raises(ValueError):
+        region.contains_regions([df.Region(p1=(0, 0), p2=(1e-9, 1e-9))])
+
 
 @pytest.mark.parametrize(
     "p11, p12, p21, p22, expected",
@@ -884,6 +926,34 @@ def test_pmin_pmax(region_3d):
         region_3d.pmax = (100e-9, 100e-9, 40e-9)
 
 
+def test_hash_and_cache(region_3d):
+    region = df.Region(p1=(0, 0, 0), p2=(10, 20, 30))
+    assert hash(region) == hash(df.Region(p1=(0.0, 0, 0), p2=(10.0, 20, 30)))
+    assert {region: 1}[df.Region(p1=(10, 20, 30), p2=(0, 0, 0))] == 1
+    assert (
+        len({region, df.Region(p1=(0, 0, 0), p2=(10, 20, 30), units=("m", "m", "nm"))})
+        == 2
+    )
+    assert region.allclose(df.Region(p1=(0.0, 0, 0), p2=(10.0, 20, 30)), rtol=0, atol=0)
+    assert region.allclose(region, rtol=0, atol=0)
+
+    # the coordinates and the cached geometry are read-only
+    assert region.edges is region.edges
+    for array in [region.pmin, region.pmax, region.edges, region.center]:
+        with pytest.raises(ValueError):
+            array[0] = 1
+
+    # the cache is updated when the region changes
+    region.translate((1, 1, 1), inplace=True)
+    assert np.allclose(region.center, (6, 11, 16))
+    region.scale(2, inplace=True)
+    assert np.allclose(region.edges, (20, 40, 60))
+    assert region.volume == 48000
+    region.rotate90("x", "z", inplace=True)
+    assert np.allclose(region.edges, (60, 40, 20))
+    assert not region.pmin.flags.writeable
+
+
 @pytest.mark.parametrize("p1, p2", [[0, 1], [(0, 0), (1, 1)], [(0, 0, 0), (1, 1, 1)]])
 def test_mpl(p1, p2, tmp_path):
     region = df.Region(p1=p1, p2=p2)
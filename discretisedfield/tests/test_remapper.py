@@ -0,0 +1,167 @@
+import re
+
+import numpy as np
+import pytest
+
+import discretisedfield as df
+
+
+@pytest.fixture
+def src_mesh():
+    return df.Mesh(p1=(0, 0, 0), p2=(10e-9, 8e-9, 6e-9), n=(10, 8, 3))
+
+
+@pytest.mark.parametrize("method", ["nearest", "linear", "conservative"])
+def test_identity(valid_mesh, method):
+    field = df.Field(
+        valid_mesh, nvdim=3, value=np.random.random((*valid_mesh.n, 3)), unit="A/m"
+    )
+    remapper = df.Remapper(valid_mesh, valid_mesh, method=method)
+    assert remapper.src_mesh is valid_mesh
+    assert remapper.dst_mesh is valid_mesh
+    assert remapper.method == method
+    assert remapper.matrix.shape == (valid_mesh.n.prod(),) * 2
+
+    remapped = remapper(field)
+    assert isinstance(remapped, df.Field)
+    assert remapped.mesh == valid_mesh
+    assert remapped.unit == "A/m"
+    assert remapped.vdims == field.vdims
+    assert np.allclose(remapped.array, field.array, rtol=1e-14, atol=0)
+
+
+@pytest.mark.parametrize("n", [(5, 4, 3), (20, 3, 7), (1, 1, 1)])
+def test_nearest(src_mesh, n):
+    dst_mesh = df.Mesh(region=src_mesh.region, n=n)
+    remapper = df.Remapper(src_mesh, dst_mesh)
+
+    # same result as the previous implementation based on xarray.sel
+    field = df.Field(src_mesh, nvdim=2, value=np.random.random((*src_mesh.n, 2)))
+    expected = (
+        field.to_xarray()
+        .sel(**{dim: getattr(dst_mesh.cells, dim) for dim in "xyz"}, method="nearest")
+        .data
+    )
+    assert np.array_equal(remapper(field).array, expected)
+    assert np.array_equal(df.Field(dst_mesh, nvdim=2, value=field).array, expected)
+
+    # dtype is preserved
+    for dtype in [np.int32, np.complex128, bool]:
+        field = df.Field(src_mesh, nvdim=1, value=1, dtype=dtype)
+        remapped = remapper(field)
+        assert remapped.array.dtype == dtype
+        assert np.all(remapped.array == 1)
+
+
+def test_linear(src_mesh):
+    def value_fun(point):
+        x, y, z = point
+        return (2 * x + 3 * y - z, 1)
+
+    field = df.Field(src_mesh, nvdim=2, value=value_fun)
+
+    # region spanned by the cell midpoints of the source mesh
+    p1 = src_mesh.region.pmin + src_mesh.cell / 2
+    p2 = src_mesh.region.pmax - src_mesh.cell / 2
+    dst_mesh = df.Mesh(p1=p1, p2=p2, n=(13, 5, 4))
+    remapped = df.Remapper(src_mesh, dst_mesh, method="linear")(field)
+    expected = df.Field(dst_mesh, nvdim=2, value=value_fun)
+    assert np.allclose(remapped.array, expected.array, rtol=1e-12, atol=0)
+
+    # constant values between the outermost midpoints and the region boundary
+    dst_mesh = df.Mesh(region=src_mesh.region, n=(40, 1, 1))
+    remapped = df.Remapper(src_mesh, dst_mesh, method="linear")(
+        df.Field(src_mesh, nvdim=1, value=lambda p: p[0])
+    )
+    assert np.allclose(remapped.array[:2], 0.5e-9, rtol=1e-12, atol=0)
+    assert np.allclose(remapped.array[-2:], 9.5e-9, rtol=1e-12, atol=0)
+
+
+def test_conservative(src_mesh):
+    field = df.Field(src_mesh, nvdim=3, value=np.random.random((*src_mesh.n, 3)))
+    dst_mesh = df.Mesh(region=src_mesh.region, n=(3, 7, 2))
+    remapper = df.Remapper(src_mesh, dst_mesh, method="conservative")
+    assert np.allclose(remapper.matrix.sum(axis=1), 1)
+    remapped = remapper(field)
+    assert np.allclose(remapped.integrate(), field.integrate(), rtol=1e-12)
+
+    # averaging of aligned cells
+    dst_mesh = df.Mesh(region=src_mesh.region, n=(5, 4, 1))
+    remapped = df.Remapper(src_mesh, dst_mesh, method="conservative")(field)
+    expected = field.array.reshape(5, 2, 4, 2, 1, 3, 3).mean(axis=(1, 3, 5))
+    assert np.allclose(remapped.array, expected, rtol=1e-12, atol=0)
+
+    # destination region smaller than source region
+    region = df.Region(p1=(2.5e-9, 0, 0), p2=(7.5e-9, 8e-9, 6e-9))
+    dst_mesh = df.Mesh(region=region, n=(2, 1, 1))
+    remapped = df.Remapper(src_mesh, dst_mesh, method="conservative")(field)
+    assert np.allclose(remapped.integrate(), field[region].integrate(), rtol=1e-12)
+
+
+def test_valid(src_mesh):
+    field = df.Field(
+        src_mesh, nvdim=1, value=1, valid=lambda p: p[0] > 4e-9, vectorized=False
+    )
+    dst_mesh = df.Mesh(region=src_mesh.region, n=(5, 1, 1))
+    for method, expected in [
+        ("nearest", [False, False, True, True, True]),
+        ("linear", [False, False, True, True, True]),
+        ("conservative", [False, False, True, True, True]),
+    ]:
+        remapped = df.Remapper(src_mesh, dst_mesh, method=method)(field)
+        assert np.array_equal(remapped.valid[:, 0, 0], expected)
+
+
+def test_cache(src_mesh):
+    dst_mesh = df.Mesh(region=src_mesh.region, n=(5, 5, 5))
+    remapper1 = df.Remapper(src_mesh, dst_mesh, method="linear")
+    remapper2 = df.Remapper(
+        df.Mesh(region=src_mesh.region, n=src_mesh.n), dst_mesh, method="linear"
+    )
+    assert remapper1.matrix is remapper2.matrix
+
+    # the weight matrix for nearest is only built on request
+    remapper = df.Remapper(src_mesh, dst_mesh, method="nearest")
+    assert remapper._matrix is None
+    remapper(df.Field(src_mesh, nvdim=1, value=1))
+    assert remapper._matrix is None
+    assert remapper.matrix.shape == (dst_mesh.n.prod(), src_mesh.n.prod())
+
+
+def test_resample(src_mesh):
+    field = df.Field(src_mesh, nvdim=3, value=np.random.random((*src_mesh.n, 3)))
+    for method in ["nearest", "linear", "conservative"]:
+        resampled = field.resample((5, 4, 3), method=method)
+        dst_mesh = df.Mesh(region=src_mesh.region, n=(5, 4, 3))
+        expected = df.Remapper(src_mesh, dst_mesh, method=method)(field)
+        assert resampled.allclose(expected)
+
+
+def test_invalid(src_mesh):
+    with pytest.raises(TypeError):
+        df.Remapper(src_mesh, src_mesh.region)
+
+    with pytest.raises(ValueError):
+        df.Remapper(src_mesh, src_mesh, method="cubic")
+
+    with pytest.raises(ValueError):
+        df.Remapper(src_mesh, df.Mesh(p1=(0, 0), p2=(10e-9, 8e-9), n=(2, 2)))
+
+    with pytest.raises(ValueError):
+        df.Remapper(
+            src_mesh, df.Mesh(p1=(0, 0, 0), p2=(20e-9, 8e-9, 6e-9), n=(2, 2, 2))
+        )
+
+    remapper = df.Remapper(src_mesh, src_mesh)
+    with pytest.raises(TypeError):
+        remapper(np.zeros((*src_mesh.n, 3)))
+
+    with pytest.raises(ValueError):
+        remapper(df.Field(df.Mesh(region=src_mesh.region, n=(2, 2, 2)), nvdim=1))
+
+
+def test_repr(src_mesh):
+    remapper = df.Remapper(src_mesh, src_mesh, method="linear")
+    assert re.match(
+        r"^Remapper\(Mesh\(.*\), Mesh\(.*\), method='linear'\)$", repr(remapper)
+    )
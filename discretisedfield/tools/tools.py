@@ -339,13 +339,22 @@ def emergent_magnetic_field(field):
             " region. It must be three-dimensional region."
         )
 
-    geo_dims = field.mesh.region.dims
-
-    F1 = field.dot(field.diff(geo_dims[1]).cross(field.diff(geo_dims[2])))
-    F2 = field.dot(field.diff(geo_dims[2]).cross(field.diff(geo_dims[0])))
-    F3 = field.dot(field.diff(geo_dims[0]).cross(field.diff(geo_dims[1])))
+    # derivatives along all three directions are computed once
+    jacobian = field.jacobian
+
+    def F(i, j):
+        return np.einsum(
+            "...l,...l->...",
+            field.array,
+            np.cross(jacobian[..., :, i], jacobian[..., :, j]),
+        )
 
-    return F1 << F2 << F3
+    return df.Field(
+        field.mesh,
+        nvdim=3,
+        value=np.stack([F(1, 2), F(2, 0), F(0, 1)], axis=-1),
+        valid=field.valid,
+    )
 
 
 def neighbouring_cell_angle(field, /, direction, units="rad"):